@@ -0,0 +1,175 @@
+"""
+Benchmark de l'agrégateur de lectures météo.
+
+Compare l'implémentation actuelle (un seul parcours, sans tri) à
+l'implémentation historique (tri complet puis parcours) sur des jeux de
+10 000 à 1 000 000 d'enregistrements (schéma de l'API, ordre mélangé et
+schéma imbriqué aux clés peu prioritaires), et vérifie que les deux produisent
+exactement le même résultat.
+
+Sur l'ordre de l'API (du plus récent au plus ancien), le parcours complet
+n'est pas plus rapide que l'historique (le tri d'une liste déjà triée est
+linéaire) : le gain vient de newest_first=True (ligne « API trié »), qui
+s'arrête dès que chaque champ a une valeur. C'est le mode utilisé pour
+les fenêtres du StationRecordStore.
+
+Usage :
+    python -m benchmarks.bench_aggregator [taille ...]
+    python -m benchmarks.bench_aggregator 10000 100000 1000000
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from time import perf_counter
+
+from src.infrastructure.reading_aggregator import aggregate_latest_values
+from src.infrastructure.record_extractor import (
+    extract_timestamp,
+    extract_temperature_c,
+    extract_humidity_pct,
+    extract_pressure_hpa,
+    extract_rain_mm,
+    extract_wind_speed,
+    extract_wind_direction_deg,
+)
+
+DEFAULT_SIZES = (10_000, 100_000)
+
+
+def legacy_aggregate_latest_values(records: list[dict]) -> dict:
+    """
+    Implémentation historique : tri par horodatage puis premier non nul.
+    """
+    sorted_records = sorted(
+        records,
+        key=lambda r: extract_timestamp(r) or datetime.min,
+        reverse=True,
+    )
+    result = dict.fromkeys(
+        (
+            "timestamp",
+            "temperature_c",
+            "humidity_pct",
+            "pressure_hpa",
+            "rain_mm",
+            "wind_speed",
+            "wind_direction_deg",
+        )
+    )
+    extractors = {
+        "timestamp": extract_timestamp,
+        "temperature_c": extract_temperature_c,
+        "humidity_pct": extract_humidity_pct,
+        "pressure_hpa": extract_pressure_hpa,
+        "rain_mm": extract_rain_mm,
+        "wind_speed": extract_wind_speed,
+        "wind_direction_deg": extract_wind_direction_deg,
+    }
+    for record in sorted_records:
+        for name, extract in extractors.items():
+            if result[name] is None:
+                result[name] = extract(record)
+        if all(value is not None for value in result.values()):
+            break
+    return result
+
+
+def make_records(count: int, seed: int = 42) -> list[dict]:
+    """
+    Génère des enregistrements au format de l'API (pas de 15 minutes),
+    du plus récent au plus ancien, avec quelques capteurs manquants.
+    """
+    rng = random.Random(seed)
+    start = datetime(2026, 1, 20, tzinfo=timezone.utc)
+    records = []
+    for i in range(count):
+        stamp = (start - timedelta(minutes=15 * i)).isoformat()
+        records.append(
+            {
+                "data": f"{i:024x}",
+                "id": 42,
+                "humidite": rng.choice((None, rng.randint(40, 100))),
+                "pression": rng.choice((None, rng.randint(98000, 103000))),
+                "pluie": rng.choice((None, 0.0, 0.2)),
+                "temperature_en_degre_c": rng.choice((None, rng.uniform(-5, 35))),
+                "force_moyenne_du_vecteur_vent": rng.randint(0, 20),
+                "direction_du_vecteur_vent_moyen": rng.randint(0, 359),
+                "heure_de_paris": stamp,
+                "heure_utc": stamp,
+            }
+        )
+    return records
+
+
+def make_nested_records(count: int, seed: int = 42) -> list[dict]:
+    """
+    Génère des enregistrements imbriqués (clé 'data') dont les clés sont
+    en fin de liste des clés candidates (schéma coûteux en chemin générique).
+    """
+    nested = []
+    for record in make_records(count, seed):
+        nested.append(
+            {
+                "id": record["id"],
+                "data": {
+                    "time": record["heure_utc"],
+                    "t": record["temperature_en_degre_c"],
+                    "u": record["humidite"],
+                    "qnh": record["pression"],
+                    "rr": record["pluie"],
+                    "ff": record["force_moyenne_du_vecteur_vent"],
+                    "dd": record["direction_du_vecteur_vent_moyen"],
+                },
+            }
+        )
+    return nested
+
+
+def _time(func, records: list[dict], repeat: int = 3) -> tuple[float, dict]:
+    """
+    Retourne le meilleur temps d'exécution (secondes) et le résultat.
+    """
+    best = float("inf")
+    result: dict = {}
+    for _ in range(repeat):
+        start = perf_counter()
+        result = func(records)
+        best = min(best, perf_counter() - start)
+    return best, result
+
+
+def main(sizes: tuple[int, ...]) -> None:
+    """
+    Exécute le benchmark pour chaque taille et chaque ordre d'entrée.
+    """
+    print(f"{'taille':>9} {'ordre':>10} {'historique':>11} {'actuel':>9} {'gain':>6}")
+    sorted_aggregate = partial(aggregate_latest_values, newest_first=True)
+    for size in sizes:
+        descending = make_records(size)
+        shuffled = descending[:]
+        random.Random(0).shuffle(shuffled)
+        nested = make_nested_records(size)
+        inputs = (
+            ("API (desc)", descending, aggregate_latest_values),
+            ("API trié", descending, sorted_aggregate),
+            ("mélangé", shuffled, aggregate_latest_values),
+            ("imbriqué", nested, aggregate_latest_values),
+            ("imb. trié", nested, sorted_aggregate),
+        )
+        for label, records, aggregate in inputs:
+            legacy_s, expected = _time(legacy_aggregate_latest_values, records)
+            current_s, result = _time(aggregate, records)
+            if result != expected:
+                raise SystemExit(f"Résultats différents ({size}, {label})")
+            print(
+                f"{size:>9} {label:>10} {legacy_s * 1000:>9.1f}ms "
+                f"{current_s * 1000:>7.1f}ms {legacy_s / current_s:>5.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main(tuple(int(arg) for arg in sys.argv[1:]) or DEFAULT_SIZES)
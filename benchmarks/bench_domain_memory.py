@@ -0,0 +1,127 @@
+"""
+Benchmark mémoire des lectures (Station et value objects).
+
+Mesure avec tracemalloc l'empreinte par lecture d'un historique de
+lectures en mémoire, avec les classes historiques (instances avec
+__dict__) puis avec les classes actuelles (dataclasses slots, immuables).
+Les valeurs (datetime, flottants) sont partagées entre les deux mesures :
+seul le coût des objets du domaine est comparé.
+
+Usage :
+    python -m benchmarks.bench_domain_memory [nombre de lectures]
+"""
+
+from __future__ import annotations
+
+import sys
+import tracemalloc
+from dataclasses import field, fields, make_dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+
+from src.domain.mesure.humidite import Humidite
+from src.domain.mesure.pression import Pression
+from src.domain.mesure.temperature import Temperature
+from src.domain.station import Station
+
+
+class LegacyValue:  # pylint: disable=too-few-public-methods
+    """
+    Value object historique (attribut dans __dict__).
+    """
+
+    def __init__(self, value):
+        self.value = value
+
+
+# Station historique : mêmes champs, dataclass sans slots.
+LegacyStation = make_dataclass(
+    "LegacyStation",
+    [(f.name, f.type, field(default=f.default)) for f in fields(Station)],
+    frozen=True,
+)
+
+
+def _readings(count: int) -> list[tuple]:
+    """
+    Prépare les valeurs brutes des lectures (hors mesure).
+    """
+    start = datetime(2026, 1, 20, tzinfo=timezone.utc)
+    return [
+        (
+            start - timedelta(minutes=15 * i),
+            float(i % 40),
+            float(i % 100),
+            1000.0 + i % 30,
+            0.2,
+            float(i % 20),
+            float(i % 360),
+        )
+        for i in range(count)
+    ]
+
+
+def legacy_reading(values: tuple) -> Any:
+    """
+    Construit une lecture avec les classes historiques.
+    """
+    timestamp, temp, hum, pres, rain, speed, direction = values
+    return LegacyStation(
+        "Station",
+        timestamp,
+        LegacyValue(temp),
+        LegacyValue(hum),
+        LegacyValue(pres),
+        rain,
+        speed,
+        direction,
+    )
+
+
+def current_reading(values: tuple) -> Station:
+    """
+    Construit une lecture avec les classes actuelles.
+    """
+    timestamp, temp, hum, pres, rain, speed, direction = values
+    return Station(
+        "Station",
+        timestamp,
+        Temperature(temp),
+        Humidite(hum),
+        Pression(pres),
+        rain,
+        speed,
+        direction,
+    )
+
+
+def bytes_per_reading(build: Callable[[tuple], Any], readings: list[tuple]) -> float:
+    """
+    Retourne la mémoire allouée par lecture pour conserver l'historique.
+    """
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    history = [build(values) for values in readings]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    # La liste elle-même n'est pas un coût du domaine.
+    allocated -= sys.getsizeof(history)
+    return allocated / len(history)
+
+
+def main(count: int) -> None:
+    """
+    Affiche l'empreinte par lecture avant / après.
+    """
+    readings = _readings(count)
+    legacy = bytes_per_reading(legacy_reading, readings)
+    current = bytes_per_reading(current_reading, readings)
+    print(f"lectures : {count}")
+    print(f"historique : {legacy:7.1f} octets / lecture")
+    print(f"actuel     : {current:7.1f} octets / lecture ({current / legacy:.0%})")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
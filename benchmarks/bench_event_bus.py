@@ -0,0 +1,95 @@
+"""
+Benchmark du temps passé par le producteur dans EventBus.publish().
+
+Un abonné lent (pause simulée) et un abonné rapide reçoivent chaque
+événement. Sans dispatcher, le producteur (le worker de chargement)
+attend l'abonné lent à chaque publication ; avec un ThreadPoolDispatcher,
+publish() se contente de mettre l'événement en file.
+
+Un second scénario simule un rafraîchissement en masse et compte les
+appels du gestionnaire (rendus UI) avec un abonnement groupé et coalescé.
+
+Usage :
+    python -m benchmarks.bench_event_bus [événements] [pause_ms]
+"""
+
+from __future__ import annotations
+
+import sys
+from threading import Event
+from time import perf_counter, sleep
+
+from src.application.event_bus import EventBus, ReadingLoaded, ThreadPoolDispatcher
+
+
+def run(bus: EventBus, events: int, pause_s: float) -> tuple[float, list[str]]:
+    """
+    Publie les événements et mesure le temps passé dans publish().
+
+    Returns:
+        Tuple (secondes côté producteur, stations reçues par l'abonné rapide).
+    """
+    received: list[str] = []
+    sleeper = Event()
+    bus.subscribe(ReadingLoaded, lambda evt: sleeper.wait(pause_s))
+    bus.subscribe(ReadingLoaded, lambda evt: received.append(evt.station))
+
+    start = perf_counter()
+    for index in range(events):
+        bus.publish(ReadingLoaded(station=f"Station {index}", data=None))
+    return perf_counter() - start, received
+
+
+def bulk_refresh(stations: int, rounds: int) -> tuple[int, int]:
+    """
+    Publie rounds lectures par station, en rafale.
+
+    Returns:
+        Tuple (appels du gestionnaire par événement, appels par lot coalescé).
+    """
+    per_event: list[str] = []
+    batches: list[list[ReadingLoaded]] = []
+    bus = EventBus()
+    bus.subscribe(ReadingLoaded, lambda evt: per_event.append(evt.station))
+    batch = bus.subscribe_batch(
+        ReadingLoaded, batches.append, window_seconds=0.05, key=lambda evt: evt.station
+    )
+
+    for _ in range(rounds):
+        for index in range(stations):
+            bus.publish(ReadingLoaded(station=f"Station {index}", data=None))
+    while batch.pending:
+        sleep(0.01)
+    sleep(0.05)
+    return len(per_event), len(batches)
+
+
+def main(events: int, pause_ms: float) -> None:
+    """
+    Compare la publication directe et la publication avec dispatcher.
+    """
+    pause_s = pause_ms / 1000
+    direct_s, direct = run(EventBus(), events, pause_s)
+
+    pool = ThreadPoolDispatcher(max_workers=2)
+    queued_s, queued = run(EventBus(dispatcher=pool), events, pause_s)
+    start = perf_counter()
+    pool.shutdown(wait=True)
+    drained_s = perf_counter() - start
+
+    if queued != direct:
+        raise SystemExit("Événements reçus différents")
+    print(f"{events} événements, abonné lent : {pause_ms} ms / événement")
+    print(f"  publish direct          : {direct_s * 1000:9.1f} ms")
+    print(f"  publish avec dispatcher : {queued_s * 1000:9.1f} ms "
+          f"(file vidée {drained_s * 1000:.1f} ms plus tard)")
+
+    handled, batched = bulk_refresh(stations=50, rounds=3)
+    print("Rafraîchissement en masse (50 stations x 3) :")
+    print(f"  appels par événement    : {handled}")
+    print(f"  appels par lot coalescé : {batched}")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(int(args[0]) if args else 500, float(args[1]) if len(args) > 1 else 2.0)
@@ -0,0 +1,71 @@
+"""
+Benchmark de l'historique des consultations.
+
+Compare l'approche historique (LinkedList reconstruite dès que la taille
+maximale est dépassée) au tampon circulaire, pour une suite de clics,
+et vérifie que les deux historiques sont identiques.
+
+Usage :
+    python -m benchmarks.bench_history [clics] [capacité ...]
+"""
+
+from __future__ import annotations
+
+import sys
+from time import perf_counter
+
+from src.domain.linked_list import LinkedList
+from src.domain.ring_buffer import RingBuffer
+
+
+def legacy_history(entries: list[str], max_size: int) -> list[str]:
+    """
+    Implémentation historique de MeteoApp._push_history.
+    """
+    history: LinkedList[str] = LinkedList()
+    for entry in entries:
+        history.prepend(entry)
+        if len(history) > max_size:
+            kept = history.to_list()[:max_size]
+            history = LinkedList()
+            for item in reversed(kept):
+                history.prepend(item)
+    return history.to_list()
+
+
+def ring_history(entries: list[str], max_size: int) -> list[str]:
+    """
+    Historique basé sur le tampon circulaire.
+    """
+    history: RingBuffer[str] = RingBuffer(max_size)
+    for entry in entries:
+        history.push(entry)
+    return history.to_list()
+
+
+def main(clicks: int, capacities: tuple[int, ...]) -> None:
+    """
+    Exécute le benchmark pour chaque capacité.
+    """
+    entries = [f"Station {i % 50} | 2026-01-20 10:{i % 60:02d}" for i in range(clicks)]
+    print(f"{'capacité':>9} {'clics':>8} {'historique':>11} {'actuel':>9} {'gain':>7}")
+    for capacity in capacities:
+        start = perf_counter()
+        expected = legacy_history(entries, capacity)
+        legacy_s = perf_counter() - start
+
+        start = perf_counter()
+        result = ring_history(entries, capacity)
+        ring_s = perf_counter() - start
+
+        if result != expected:
+            raise SystemExit(f"Historiques différents (capacité {capacity})")
+        print(
+            f"{capacity:>9} {clicks:>8} {legacy_s * 1000:>9.1f}ms "
+            f"{ring_s * 1000:>7.1f}ms {legacy_s / ring_s:>6.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    main(args[0] if args else 20_000, tuple(args[1:]) or (20, 200))
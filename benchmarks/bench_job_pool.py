@@ -0,0 +1,95 @@
+"""
+Benchmark du chargement de stations : un worker unique contre JobPool.
+
+Chaque chargement simule une latence réseau (une station sur dix est
+lente). Les clics répétés sur une même station sont simulés en soumettant
+chaque station plusieurs fois. On mesure le temps total et le nombre de
+chargements réellement exécutés.
+
+Usage :
+    python -m benchmarks.bench_job_pool [stations] [répétitions] [workers]
+"""
+
+from __future__ import annotations
+
+import sys
+from queue import Queue
+from threading import Event, Lock, Thread
+from time import perf_counter
+
+from src.application.job_pool import JobPool
+
+FAST_S = 0.01
+SLOW_S = 0.1
+
+
+class Loader:  # pylint: disable=too-few-public-methods
+    """
+    Chargement simulé comptant les appels.
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self._lock = Lock()
+        self._sleep = Event()
+
+    def __call__(self, station: str) -> None:
+        with self._lock:
+            self.calls += 1
+        index = int(station.rsplit(" ", 1)[1])
+        self._sleep.wait(SLOW_S if index % 10 == 0 else FAST_S)
+
+
+def legacy_single_worker(requests: list[str]) -> tuple[float, int]:
+    """
+    Ancien fonctionnement : une Queue et un seul thread, sans déduplication.
+    """
+    loader = Loader()
+    queue: Queue[str] = Queue()
+
+    def run_forever() -> None:
+        while True:
+            station = queue.get()
+            loader(station)
+            queue.task_done()
+
+    Thread(target=run_forever, daemon=True).start()
+    start = perf_counter()
+    for station in requests:
+        queue.put(station)
+    queue.join()
+    return perf_counter() - start, loader.calls
+
+
+def job_pool(requests: list[str], workers: int) -> tuple[float, int]:
+    """
+    JobPool : plusieurs workers, une demande par station au plus.
+    """
+    loader = Loader()
+    pool = JobPool(loader, workers=workers)
+    pool.start()
+    start = perf_counter()
+    for station in requests:
+        pool.submit(station)
+    pool.join()
+    elapsed = perf_counter() - start
+    pool.stop()
+    return elapsed, loader.calls
+
+
+def main(stations: int, repeats: int, workers: int) -> None:
+    """
+    Compare les deux fonctionnements.
+    """
+    requests = [f"Station {index}" for index in range(stations) for _ in range(repeats)]
+    legacy_s, legacy_calls = legacy_single_worker(requests)
+    pool_s, pool_calls = job_pool(requests, workers)
+
+    print(f"{len(requests)} demandes ({stations} stations x {repeats})")
+    print(f"  worker unique : {legacy_s * 1000:8.1f} ms, {legacy_calls} chargements")
+    print(f"  JobPool ({workers})   : {pool_s * 1000:8.1f} ms, {pool_calls} chargements")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    main(*(args + [40, 3, 4][len(args):]))
@@ -0,0 +1,76 @@
+"""
+Benchmark d'un historique LRU de stations (sans doublon, borné).
+
+Compare l'approche possible avec LinkedList seule (reconstruction de la
+liste pour retirer une station déjà présente puis pour tronquer) à
+IndexedLinkedList (move_to_front / pop_right en O(1)), et vérifie que
+les deux historiques sont identiques.
+
+Usage :
+    python -m benchmarks.bench_linked_list [consultations] [capacité ...]
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+from time import perf_counter
+
+from src.domain.linked_list import IndexedLinkedList, LinkedList
+
+
+def legacy_recent(stations: list[str], capacity: int) -> list[str]:
+    """
+    Historique LRU avec LinkedList : chaque consultation reconstruit la liste.
+    """
+    recent: LinkedList[str] = LinkedList()
+    for station in stations:
+        kept = [name for name in recent if name != station][: capacity - 1]
+        recent = LinkedList()
+        recent.append(station)
+        for name in kept:
+            recent.append(name)
+    return recent.to_list()
+
+
+def indexed_recent(stations: list[str], capacity: int) -> list[str]:
+    """
+    Historique LRU avec IndexedLinkedList.
+    """
+    recent: IndexedLinkedList[str, None] = IndexedLinkedList()
+    for station in stations:
+        recent.push_front(station, None)
+        if len(recent) > capacity:
+            recent.pop_right()
+    return recent.keys()
+
+
+def main(count: int, capacities: tuple[int, ...]) -> None:
+    """
+    Exécute le benchmark pour chaque capacité.
+    """
+    rng = random.Random(42)
+    for capacity in capacities:
+        stations = [f"Station {rng.randrange(capacity * 2)}" for _ in range(count)]
+
+        start = perf_counter()
+        expected = legacy_recent(stations, capacity)
+        legacy_s = perf_counter() - start
+
+        start = perf_counter()
+        result = indexed_recent(stations, capacity)
+        indexed_s = perf_counter() - start
+
+        if result != expected:
+            raise SystemExit(f"Historiques différents (capacité {capacity})")
+        print(
+            f"capacité={capacity:<5} consultations={count:<7} "
+            f"LinkedList={legacy_s * 1000:8.1f}ms "
+            f"IndexedLinkedList={indexed_s * 1000:7.1f}ms "
+            f"gain={legacy_s / indexed_s:5.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    main(args[0] if args else 20_000, tuple(args[1:]) or (20, 200))
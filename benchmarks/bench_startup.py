@@ -0,0 +1,85 @@
+"""
+Benchmark du temps d'import au démarrage (python -X importtime).
+
+Chaque module est importé dans un interpréteur neuf ; on relève le temps
+cumulé de l'import du module (meilleur de plusieurs essais) et les
+dépendances lourdes chargées. La référence « eager » importe requests et
+tkinter en plus, comme le faisait le démarrage avant les imports
+différés.
+
+Usage :
+    python -m benchmarks.bench_startup [essais]
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+MODULES = (
+    "src.cli",
+    "src.application.factory",
+    "src.ui.tkinter_app",
+)
+EAGER = "requests, tkinter, src.cli"
+HEAVY = ("requests", "urllib3", "tkinter", "aiohttp")
+
+
+def import_time(statement: str) -> tuple[int, set[str]]:
+    """
+    Importe des modules dans un nouvel interpréteur.
+
+    Args:
+        statement: modules à importer (syntaxe de l'instruction import)
+
+    Returns:
+        (temps cumulé des imports de premier niveau en µs, noms de tous
+        les modules chargés)
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {statement}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = 0
+    loaded: set[str] = set()
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        name = name.rstrip()
+        loaded.add(name.strip())
+        # Les imports imbriqués sont indentés ; seuls les premiers niveaux
+        # sont additionnés
+        if not name.startswith("  "):
+            total += int(cumulative)
+    return total, loaded
+
+
+def best_of(statement: str, runs: int) -> tuple[int, set[str]]:
+    """
+    Retourne la mesure la plus rapide sur plusieurs essais.
+    """
+    return min((import_time(statement) for _ in range(runs)), key=lambda item: item[0])
+
+
+def main(runs: int) -> None:
+    """
+    Affiche le temps d'import de chaque point d'entrée.
+    """
+    print(f"Temps d'import (meilleur de {runs} essais)")
+    for statement in (EAGER, *MODULES):
+        total, loaded = best_of(statement, runs)
+        heavy = [name for name in HEAVY if name in loaded]
+        label = "eager" if statement == EAGER else statement
+        print(
+            f"  {label:26} {total / 1000:7.1f} ms"
+            f"  chargés : {', '.join(heavy) or 'aucun'}"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
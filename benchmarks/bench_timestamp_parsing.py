@@ -0,0 +1,92 @@
+"""
+Micro-benchmark de la conversion des horodatages.
+
+Compare la conversion historique (str + replace + fromisoformat à chaque
+appel) à parse_datetime (chemin direct pour le format de l'API et
+mémorisation bornée), sur :
+- une charge réaliste : plusieurs stations relues à chaque requête, dont
+  les horodatages suivent la même grille de 15 minutes
+- des horodatages tous distincts (pire cas pour la mémorisation)
+
+Usage :
+    python -m benchmarks.bench_timestamp_parsing [stations] [requêtes]
+"""
+
+from __future__ import annotations
+
+import sys
+from datetime import datetime, timedelta, timezone
+from time import perf_counter
+from typing import Any, Callable, Optional
+
+from src.infrastructure.record_extractor import clear_timestamp_cache, parse_datetime
+
+
+def legacy_parse_datetime(value: Any) -> Optional[datetime]:
+    """
+    Conversion historique, sans mémorisation.
+    """
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except (TypeError, ValueError):
+        return None
+
+
+def grid(count: int, suffix: str = "+00:00") -> list[str]:
+    """
+    Retourne count horodatages successifs sur une grille de 15 minutes.
+    """
+    start = datetime(2026, 1, 20, tzinfo=timezone.utc)
+    return [
+        (start - timedelta(minutes=15 * i)).strftime("%Y-%m-%dT%H:%M:%S") + suffix
+        for i in range(count)
+    ]
+
+
+def _throughput(
+    parse: Callable[[Any], Any], values: list[str], repeat: int = 7
+) -> float:
+    """
+    Retourne le meilleur débit (conversions par seconde), la mémoire des
+    horodatages étant vidée avant chaque essai.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        clear_timestamp_cache()
+        start = perf_counter()
+        for value in values:
+            parse(value)
+        best = min(best, perf_counter() - start)
+    return len(values) / best
+
+
+def main(stations: int, fetches: int) -> None:
+    """
+    Exécute le benchmark sur chaque charge.
+    """
+    window = 100
+    workloads = (
+        ("réaliste +00:00", grid(window) * stations * fetches),
+        ("réaliste Z", grid(window, "Z") * stations * fetches),
+        ("distincts +00:00", grid(window * stations * fetches)),
+    )
+
+    print(f"{'charge':>17} {'valeurs':>9} {'historique':>12} {'actuel':>12} {'gain':>6}")
+    for label, values in workloads:
+        if [legacy_parse_datetime(v) for v in values[:window]] != [
+            parse_datetime(v) for v in values[:window]
+        ]:
+            raise SystemExit(f"Résultats différents ({label})")
+        legacy = _throughput(legacy_parse_datetime, values)
+        current = _throughput(parse_datetime, values)
+        print(
+            f"{label:>17} {len(values):>9} {legacy / 1e6:>8.2f} M/s "
+            f"{current / 1e6:>8.2f} M/s {current / legacy:>5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:3]]
+    main(*(args + [50, 20][len(args):]))
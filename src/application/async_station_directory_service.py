@@ -0,0 +1,170 @@
+"""
+Service applicatif asynchrone d'accès aux données météo.
+
+Variante asyncio de StationDirectoryService : elle partage le catalogue,
+la construction des Station et le format de résultat du service synchrone,
+mais s'appuie sur un AsyncMeteoClient afin d'interroger des centaines de
+stations depuis une seule boucle d'événements, sans thread par requête.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import AsyncIterator, Iterable, Optional
+
+from src.application.station_directory_service import (
+    DEFAULT_CACHE_MAX_ENTRIES,
+    DefaultStationCatalog,
+    StationCatalog,
+    StationFetchResult,
+    build_station,
+)
+from src.domain.lru_cache import LruTtlCache
+from src.domain.station import Station
+from src.infrastructure.meteo_clients import AsyncHttpMeteoClient, AsyncMeteoClient
+
+
+class AsyncStationDirectoryService:
+    """
+    Service applicatif principal (version asynchrone).
+
+    Responsabilités :
+    - fournir la liste des stations
+    - récupérer la dernière lecture pour une ou plusieurs stations
+    - mettre en cache en mémoire (cache LRU borné) les résultats récents
+    """
+
+    def __init__(
+        self,
+        catalog: StationCatalog | None = None,
+        client: AsyncMeteoClient | None = None,
+        cache_ttl_seconds: int = 60,
+    ):
+        """
+        Initialise le service.
+
+        Args:
+            catalog: source des stations (station -> endpoint)
+            client: client météo asynchrone (HTTP, fake, etc.)
+            cache_ttl_seconds: durée de validité du cache mémoire
+        """
+        self._catalog = catalog or DefaultStationCatalog()
+        self._client: AsyncMeteoClient = client or AsyncHttpMeteoClient()
+
+        # Cache mémoire borné : station_name -> Station
+        self._cache: LruTtlCache[str, Station] = LruTtlCache(
+            ttl_seconds=cache_ttl_seconds,
+            max_entries=DEFAULT_CACHE_MAX_ENTRIES,
+        )
+
+        # Chargements en cours, partagés entre coroutines concurrentes
+        self._in_flight: dict[str, asyncio.Task] = {}
+
+    def get_station_names(self) -> list[str]:
+        """
+        Retourne la liste des noms de stations disponibles.
+        """
+        return list(self._catalog.get_stations().keys())
+
+    def cache_stats(self) -> dict[str, float]:
+        """
+        Retourne les statistiques du cache mémoire.
+        """
+        return self._cache.stats()
+
+    async def get_latest_for_station(self, station_name: str) -> Optional[Station]:
+        """
+        Retourne la dernière lecture météo disponible pour une station.
+
+        Le cache est consulté en premier ; en cas d'absence, l'API est
+        interrogée sans bloquer la boucle d'événements. Les coroutines
+        demandant simultanément la même station partagent un seul appel.
+
+        Args:
+            station_name: nom de la station
+
+        Returns:
+            Station si des données exploitables existent, sinon None.
+        """
+        station = self._cache.get(station_name)
+        if station is not None:
+            return station
+
+        task = self._in_flight.get(station_name)
+        if task is None:
+            task = asyncio.ensure_future(self._load_station(station_name))
+            self._in_flight[station_name] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(station_name, None))
+
+        # shield : l'annulation d'un appelant n'annule pas le chargement partagé
+        return await asyncio.shield(task)
+
+    async def _load_station(self, station_name: str) -> Optional[Station]:
+        """
+        Interroge l'API pour une station et met le résultat en cache.
+
+        Args:
+            station_name: nom de la station
+
+        Returns:
+            Station si des données exploitables existent, sinon None.
+        """
+        endpoint = self._catalog.get_stations().get(station_name)
+        if not endpoint:
+            return None
+
+        station = build_station(station_name, await self._client.fetch(endpoint))
+        if station is not None:
+            self._cache.set(station_name, station)
+        return station
+
+    async def get_latest_for_stations(
+        self, station_names: Iterable[str]
+    ) -> AsyncIterator[StationFetchResult]:
+        """
+        Charge plusieurs stations simultanément dans la boucle courante.
+
+        La concurrence effective est bornée par le client (sémaphore et
+        pool de connexions). Une erreur sur une station n'interrompt pas
+        les autres : elle est portée par le résultat.
+
+        Args:
+            station_names: noms des stations à charger (doublons ignorés)
+
+        Yields:
+            StationFetchResult pour chaque station, dans l'ordre d'arrivée.
+        """
+        tasks = [
+            asyncio.ensure_future(self._load_result(name))
+            for name in dict.fromkeys(station_names)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _load_result(self, station_name: str) -> StationFetchResult:
+        """
+        Charge une station en capturant l'erreur éventuelle.
+
+        Args:
+            station_name: nom de la station
+
+        Returns:
+            StationFetchResult correspondant.
+        """
+        try:
+            station = await self.get_latest_for_station(station_name)
+        except (OSError, RuntimeError, ValueError) as exc:
+            return StationFetchResult(name=station_name, station=None, error=exc)
+        return StationFetchResult(name=station_name, station=station)
+
+    async def close(self) -> None:
+        """
+        Ferme le client sous-jacent s'il expose une méthode close().
+        """
+        close = getattr(self._client, "close", None)
+        if close is not None:
+            await close()
@@ -0,0 +1,73 @@
+"""
+Exécution périodique d'une tâche de rafraîchissement en arrière-plan.
+
+Ce module fournit un thread démon minimal, utilisé par le service pour
+recharger les stations consultées récemment avant l'expiration du cache.
+"""
+
+from __future__ import annotations
+
+from threading import Event, Thread
+from typing import Callable, Optional
+
+
+class BackgroundRefresher:
+    """
+    Thread démon appelant une fonction à intervalle régulier.
+
+    Les exceptions levées par la fonction n'arrêtent pas la boucle :
+    un échec ponctuel de rafraîchissement ne doit pas désactiver
+    les rafraîchissements suivants.
+    """
+
+    def __init__(self, tick: Callable[[], None], interval_seconds: float):
+        """
+        Initialise le rafraîchisseur (non démarré).
+
+        Args:
+            tick: fonction appelée à chaque intervalle
+            interval_seconds: délai entre deux appels
+        """
+        self._tick = tick
+        self._interval_seconds = interval_seconds
+        self._stop = Event()
+        self._thread: Optional[Thread] = None
+
+    def start(self) -> None:
+        """
+        Démarre le thread s'il ne tourne pas déjà.
+        """
+        if self.is_running():
+            return
+        self._stop.clear()
+        self._thread = Thread(
+            target=self._run,
+            name="station-refresher",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Demande l'arrêt du thread et attend sa fin.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self._interval_seconds + 1)
+            self._thread = None
+
+    def is_running(self) -> bool:
+        """
+        Indique si le thread de rafraîchissement est actif.
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self) -> None:
+        """
+        Boucle du thread : attend l'intervalle puis appelle tick().
+        """
+        while not self._stop.wait(self._interval_seconds):
+            try:
+                self._tick()
+            except (OSError, RuntimeError, ValueError):
+                continue
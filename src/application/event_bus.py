@@ -4,13 +4,40 @@ Event bus implémentant le pattern Observer.
 Ce module fournit un mécanisme simple de publication / abonnement
 pour découpler les producteurs d'événements (workers) des consommateurs
 (interface graphique, logs, etc.).
+
+Le bus est thread-safe. Par défaut, les gestionnaires sont appelés dans
+le thread qui publie ; avec un Dispatcher (pool de threads, boucle
+asyncio), chaque abonnement dispose de sa propre file bornée et ses
+gestionnaires s'exécutent hors du thread producteur : un abonné lent ne
+bloque plus le worker qui publie.
+
+Les abonnements groupés (subscribe_batch) accumulent les événements
+pendant une fenêtre de temps et les livrent en une seule liste, en ne
+gardant éventuellement que le dernier événement par clé (ex: station) :
+un rafraîchissement en masse produit une seule mise à jour de l'UI.
 """
 
 from __future__ import annotations
 
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Callable, DefaultDict, Type, TypeVar
-from collections import defaultdict
+from functools import partial
+from itertools import count
+from threading import Lock, Timer
+from typing import TYPE_CHECKING, Callable, Hashable, Optional, Protocol, Type, TypeVar
+
+if TYPE_CHECKING:
+    import asyncio
+
+_LOGGER = logging.getLogger(__name__)
+
+# Politiques appliquées lorsqu'une file d'abonnement est pleine
+DROP_OLDEST = "drop_oldest"  # l'événement le plus ancien en attente est perdu
+DROP_NEWEST = "drop_newest"  # le nouvel événement est perdu
+RAISE = "raise"  # publish() lève RuntimeError
+OVERFLOW_POLICIES = (DROP_OLDEST, DROP_NEWEST, RAISE)
 
 
 class Event:  # pylint: disable=too-few-public-methods
@@ -51,34 +78,588 @@ class ReadingFailed(Event):
     error: str
 
 
+@dataclass(frozen=True)
+class CatalogLoaded(Event):
+    """
+    Événement émis lorsque la liste des stations a été chargée.
+
+    Attributs :
+        stations : noms des stations disponibles (vide si aucune)
+    """
+
+    stations: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class StationsRefreshed(Event):
+    """
+    Événement émis après le rafraîchissement d'une ou plusieurs stations.
+
+    Attributs :
+        results : résultats par station (StationFetchResult), dans
+            l'ordre d'arrivée
+    """
+
+    results: tuple[object, ...]
+
+
 E = TypeVar("E", bound=Event)
 Handler = Callable[[Event], None]
+BatchHandler = Callable[[list[Event]], None]
+Task = Callable[[], None]
+# Planifie une tâche après un délai en secondes (sans bloquer l'appelant) ;
+# retourne éventuellement un objet annulable (méthode cancel())
+Scheduler = Callable[[float, Task], Optional[object]]
+
+
+def start_timer(delay: float, task: Task) -> Timer:
+    """
+    Scheduler par défaut : exécute la tâche dans un Timer (thread démon).
+
+    Args:
+        delay: délai en secondes
+        task: tâche à exécuter
+
+    Returns:
+        Le Timer démarré (annulable).
+    """
+    timer = Timer(delay, task)
+    timer.daemon = True
+    timer.start()
+    return timer
+
+
+class Dispatcher(Protocol):  # pylint: disable=too-few-public-methods
+    """
+    Exécuteur des gestionnaires hors du thread producteur.
+    """
+
+    def submit(self, task: Task) -> None:
+        """
+        Planifie l'exécution d'une tâche (sans attendre sa fin).
+        """
+
+
+class ThreadPoolDispatcher:
+    """
+    Dispatcher exécutant les gestionnaires dans un pool de threads.
+    """
+
+    def __init__(self, max_workers: int = 4, thread_name_prefix: str = "event-bus"):
+        """
+        Initialise le pool de threads.
+
+        Args:
+            max_workers: nombre maximal de threads
+            thread_name_prefix: préfixe du nom des threads
+        """
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix=thread_name_prefix,
+        )
+
+    def submit(self, task: Task) -> None:
+        """
+        Planifie l'exécution d'une tâche dans le pool.
+        """
+        self._executor.submit(task)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Arrête le pool (après les tâches déjà planifiées si wait est True).
+        """
+        self._executor.shutdown(wait=wait)
+
+
+class AsyncioDispatcher:  # pylint: disable=too-few-public-methods
+    """
+    Dispatcher exécutant les gestionnaires dans une boucle asyncio.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        """
+        Initialise le dispatcher.
+
+        Args:
+            loop: boucle dans laquelle les gestionnaires sont appelés
+        """
+        self._loop = loop
+
+    def submit(self, task: Task) -> None:
+        """
+        Planifie l'exécution d'une tâche dans la boucle (thread-safe).
+        """
+        self._loop.call_soon_threadsafe(task)
+
+
+class Subscription:  # pylint: disable=too-many-instance-attributes
+    """
+    Abonnement d'un gestionnaire à un type d'événement.
+
+    Sans dispatcher, deliver() appelle directement le gestionnaire. Avec
+    un dispatcher, les événements sont mis dans une file propre à
+    l'abonnement, vidée par une seule tâche à la fois : l'ordre de
+    publication est conservé pour ce gestionnaire.
+    """
+
+    def __init__(
+        self,
+        bus: EventBus,
+        event_type: Type[Event],
+        handler: Handler,
+        dispatcher: Optional[Dispatcher] = None,
+        max_backlog: Optional[int] = None,
+        overflow: str = DROP_OLDEST,
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """
+        Initialise l'abonnement.
+
+        Args:
+            bus: bus auquel l'abonnement appartient
+            event_type: classe des événements observés
+            handler: fonction appelée pour chaque événement
+            dispatcher: exécuteur des appels (None = appel direct)
+            max_backlog: nombre maximal d'événements en attente
+                (None = illimité ; ignoré sans dispatcher)
+            overflow: politique appliquée quand la file est pleine
+                (DROP_OLDEST, DROP_NEWEST ou RAISE)
+
+        Raises:
+            ValueError: si la politique ou la taille de file est invalide
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Politique de débordement inconnue : {overflow}")
+        if max_backlog is not None and max_backlog < 1:
+            raise ValueError("max_backlog doit être supérieur ou égal à 1")
+
+        self.event_type = event_type
+        self.handler = handler
+        self._bus = bus
+        self._dispatcher = dispatcher
+        self._max_backlog = max_backlog
+        self._overflow = overflow
+
+        self._lock = Lock()
+        self._backlog: deque[Event] = deque()
+        self._scheduled = False
+        self._active = True
+        self._dropped = 0
+        self._errors = 0
+
+    @property
+    def active(self) -> bool:
+        """
+        Indique si l'abonnement reçoit encore des événements.
+        """
+        return self._active
+
+    @property
+    def pending(self) -> int:
+        """
+        Retourne le nombre d'événements en attente de traitement.
+        """
+        with self._lock:
+            return len(self._backlog)
+
+    @property
+    def dropped(self) -> int:
+        """
+        Retourne le nombre d'événements perdus (file pleine).
+        """
+        with self._lock:
+            return self._dropped
+
+    @property
+    def errors(self) -> int:
+        """
+        Retourne le nombre d'appels du gestionnaire ayant échoué
+        (mode avec dispatcher uniquement).
+        """
+        with self._lock:
+            return self._errors
+
+    def unsubscribe(self) -> None:
+        """
+        Désabonne le gestionnaire ; les événements en attente sont abandonnés.
+        """
+        self._bus.unsubscribe(self)
+
+    def cancel(self) -> None:
+        """
+        Désactive l'abonnement et vide sa file (appelé par le bus).
+        """
+        with self._lock:
+            self._active = False
+            self._backlog.clear()
+
+    def deliver(self, event: Event) -> None:
+        """
+        Transmet un événement au gestionnaire (directement ou via la file).
+
+        Args:
+            event: événement publié
+
+        Raises:
+            RuntimeError: si la file est pleine avec la politique RAISE
+        """
+        if self._dispatcher is None:
+            if self._active:
+                self.handler(event)
+            return
+
+        with self._lock:
+            if not self._active:
+                return
+            if self._max_backlog is not None and len(self._backlog) >= self._max_backlog:
+                if self._overflow == RAISE:
+                    raise RuntimeError(
+                        f"File pleine pour {self.event_type.__name__} "
+                        f"({self._max_backlog} événements en attente)"
+                    )
+                self._dropped += 1
+                if self._overflow == DROP_NEWEST:
+                    return
+                self._backlog.popleft()
+            self._backlog.append(event)
+            if self._scheduled:
+                return
+            self._scheduled = True
+
+        self._dispatcher.submit(self._drain)
+
+    def _drain(self) -> None:
+        """
+        Vide la file en appelant le gestionnaire pour chaque événement.
+
+        Un échec du gestionnaire est compté (et journalisé s'il est
+        imprévu) sans interrompre la file ; si la vidange est malgré tout
+        interrompue (KeyboardInterrupt...), le prochain deliver() en
+        programme une nouvelle.
+        """
+        while True:
+            with self._lock:
+                if not self._backlog:
+                    self._scheduled = False
+                    return
+                event = self._backlog.popleft()
+            drained = False
+            try:
+                self._call_handler(event)
+                drained = True
+            finally:
+                if not drained:
+                    with self._lock:
+                        self._scheduled = False
+
+    def _call_handler(self, payload: object) -> None:
+        """
+        Appelle le gestionnaire hors du thread producteur et compte ses
+        échecs.
+
+        Args:
+            payload: événement (ou lot d'événements) à transmettre
+        """
+        try:
+            self.handler(payload)  # type: ignore[arg-type]
+        except (OSError, RuntimeError, ValueError):
+            with self._lock:
+                self._errors += 1
+        except Exception:  # pylint: disable=broad-exception-caught
+            with self._lock:
+                self._errors += 1
+            _LOGGER.exception(
+                "Gestionnaire de %s en échec", self.event_type.__name__
+            )
+
+
+class BatchSubscription(Subscription):  # pylint: disable=too-many-instance-attributes
+    """
+    Abonnement recevant les événements par lots.
+
+    Le premier événement d'une fenêtre planifie la livraison après
+    window_seconds ; les événements suivants rejoignent le même lot. Avec
+    une fonction de clé, seul le dernier événement de chaque clé est
+    conservé (coalescence). Le gestionnaire reçoit la liste du lot, dans
+    l'ordre de dernière arrivée.
+    """
+
+    def __init__(
+        self,
+        bus: EventBus,
+        event_type: Type[Event],
+        handler: BatchHandler,
+        window_seconds: float,
+        key: Optional[Callable[[Event], Hashable]] = None,
+        dispatcher: Optional[Dispatcher] = None,
+        scheduler: Scheduler = start_timer,
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """
+        Initialise l'abonnement groupé.
+
+        Args:
+            bus: bus auquel l'abonnement appartient
+            event_type: classe des événements observés
+            handler: fonction appelée avec la liste des événements du lot
+            window_seconds: durée de la fenêtre d'accumulation
+            key: clé de coalescence (None = tous les événements sont livrés)
+            dispatcher: exécuteur des livraisons (None = dans le scheduler)
+            scheduler: planificateur de la fin de fenêtre
+
+        Raises:
+            ValueError: si la fenêtre est négative
+        """
+        if window_seconds < 0:
+            raise ValueError("window_seconds doit être positif ou nul")
+        super().__init__(bus, event_type, handler, dispatcher=dispatcher)  # type: ignore[arg-type]
+        self._window_seconds = window_seconds
+        self._key = key
+        self._scheduler = scheduler
+        self._sequence = count()
+        self._batch: dict[Hashable, Event] = {}
+        self._coalesced = 0
+        # Fenêtre courante : une fin de fenêtre planifiée pour une fenêtre
+        # déjà livrée (flush manuel) est ignorée
+        self._window = 0
+        self._timer: Optional[object] = None
+
+    @property
+    def pending(self) -> int:
+        """
+        Retourne le nombre d'événements du lot en cours.
+        """
+        with self._lock:
+            return len(self._batch)
+
+    @property
+    def coalesced(self) -> int:
+        """
+        Retourne le nombre d'événements remplacés par un plus récent.
+        """
+        with self._lock:
+            return self._coalesced
+
+    def cancel(self) -> None:
+        """
+        Désactive l'abonnement et abandonne le lot en cours.
+        """
+        with self._lock:
+            self._active = False
+            _, timer = self._take_batch()
+        _cancel_timer(timer)
+
+    def deliver(self, event: Event) -> None:
+        """
+        Ajoute un événement au lot en cours (planifie sa livraison).
+
+        Args:
+            event: événement publié
+        """
+        with self._lock:
+            if not self._active:
+                return
+            key = self._key(event) if self._key is not None else next(self._sequence)
+            if self._batch.pop(key, None) is not None:
+                self._coalesced += 1
+            self._batch[key] = event
+            if self._scheduled:
+                return
+            self._scheduled = True
+            window = self._window
+
+        timer = self._scheduler(self._window_seconds, partial(self._dispatch_flush, window))
+        with self._lock:
+            if self._window == window:
+                self._timer = timer
+                timer = None
+        # Fenêtre déjà livrée entre-temps : le Timer n'a plus d'objet
+        _cancel_timer(timer)
+
+    def flush(self) -> int:
+        """
+        Livre immédiatement le lot en cours.
+
+        Annule la fin de fenêtre planifiée : elle ne livrera ni lot vide
+        ni lot en double.
+
+        Returns:
+            Nombre d'événements livrés.
+        """
+        with self._lock:
+            events, timer = self._take_batch()
+            active = self._active
+        _cancel_timer(timer)
+        if not events or not active:
+            return 0
+
+        self._call_handler(events)
+        return len(events)
+
+    def _take_batch(self) -> tuple[list[Event], Optional[object]]:
+        """
+        Retire le lot et termine sa fenêtre (appelé verrou détenu).
+
+        Lot vidé, fenêtre close et Timer détaché en une seule section
+        critique : un deliver() concurrent ouvre forcément une nouvelle
+        fenêtre, son événement ne reste jamais sans livraison planifiée.
+
+        Returns:
+            (événements du lot, Timer de la fenêtre à annuler hors verrou)
+        """
+        events = list(self._batch.values())
+        self._batch.clear()
+        self._scheduled = False
+        self._window += 1
+        timer, self._timer = self._timer, None
+        return events, timer
+
+    def _dispatch_flush(self, window: int) -> None:
+        """
+        Fin de fenêtre : livre le lot (via le dispatcher s'il existe).
+
+        Args:
+            window: fenêtre pour laquelle la fin a été planifiée
+        """
+        with self._lock:
+            if window != self._window:
+                return
+        if self._dispatcher is None:
+            self.flush()
+        else:
+            self._dispatcher.submit(self.flush)
+
+
+def _cancel_timer(timer: Optional[object]) -> None:
+    """
+    Annule une tâche planifiée si le scheduler a retourné un objet annulable.
+
+    Args:
+        timer: valeur retournée par le scheduler (None = rien à annuler)
+    """
+    cancel = getattr(timer, "cancel", None)
+    if cancel is not None:
+        cancel()
 
 
 class EventBus:
     """
-    Bus d'événements simple implémentant le pattern Observer.
+    Bus d'événements thread-safe implémentant le pattern Observer.
 
     Permet :
-    - l'inscription de gestionnaires (observers)
-    - la publication d'événements typés
+    - l'inscription et la désinscription de gestionnaires (observers)
+    - la publication d'événements typés, depuis n'importe quel thread
+    - l'exécution des gestionnaires hors du thread producteur (dispatcher),
+      avec une file bornée par gestionnaire
     """
 
-    def __init__(self) -> None:
+    def __init__(self, dispatcher: Optional[Dispatcher] = None) -> None:
         """
         Initialise le bus d'événements sans abonnés.
+
+        Args:
+            dispatcher: exécuteur des gestionnaires (None = appel direct
+                dans le thread qui publie)
         """
-        self._subscribers: DefaultDict[Type[Event], list[Handler]] = defaultdict(list)
+        self._dispatcher = dispatcher
+        self._lock = Lock()
+        # Listes copiées à chaque modification : publish() lit sans verrou
+        # une liste qui ne change plus.
+        self._subscribers: dict[Type[Event], tuple[Subscription, ...]] = {}
 
-    def subscribe(self, event_type: Type[E], handler: Callable[[E], None]) -> None:
+    def subscribe(
+        self,
+        event_type: Type[E],
+        handler: Callable[[E], None],
+        max_backlog: Optional[int] = None,
+        overflow: str = DROP_OLDEST,
+    ) -> Subscription:
         """
         Abonne un gestionnaire à un type d'événement.
 
         Args:
             event_type : classe de l'événement à observer
             handler : fonction appelée lors de la publication
+            max_backlog : nombre maximal d'événements en attente pour ce
+                gestionnaire (avec dispatcher ; None = illimité)
+            overflow : politique si la file est pleine (DROP_OLDEST,
+                DROP_NEWEST ou RAISE)
+
+        Returns:
+            L'abonnement (permet de se désabonner et de suivre la file).
+        """
+        subscription = Subscription(
+            self,
+            event_type,
+            handler,  # type: ignore[arg-type]
+            dispatcher=self._dispatcher,
+            max_backlog=max_backlog,
+            overflow=overflow,
+        )
+        self._add(subscription)
+        return subscription
+
+    def subscribe_batch(
+        self,
+        event_type: Type[E],
+        handler: Callable[[list[E]], None],
+        window_seconds: float = 0.05,
+        key: Optional[Callable[[E], Hashable]] = None,
+        scheduler: Scheduler = start_timer,
+    ) -> BatchSubscription:  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """
+        Abonne un gestionnaire recevant les événements par lots.
+
+        Args:
+            event_type : classe de l'événement à observer
+            handler : fonction appelée avec la liste des événements d'une
+                fenêtre
+            window_seconds : durée d'accumulation d'un lot
+            key : clé de coalescence (ex: lambda evt: evt.station) ; seul
+                le dernier événement de chaque clé est livré
+            scheduler : planificateur de fin de fenêtre (Timer par défaut)
+
+        Returns:
+            L'abonnement groupé (flush() livre le lot immédiatement).
+        """
+        subscription = BatchSubscription(
+            self,
+            event_type,
+            handler,  # type: ignore[arg-type]
+            window_seconds,
+            key=key,  # type: ignore[arg-type]
+            dispatcher=self._dispatcher,
+            scheduler=scheduler,
+        )
+        self._add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> bool:
+        """
+        Retire un abonnement du bus.
+
+        Args:
+            subscription : abonnement retourné par subscribe()
+
+        Returns:
+            True si l'abonnement était présent, False sinon.
         """
-        self._subscribers[event_type].append(handler)
+        with self._lock:
+            current = self._subscribers.get(subscription.event_type, ())
+            if subscription not in current:
+                return False
+            remaining = tuple(sub for sub in current if sub is not subscription)
+            if remaining:
+                self._subscribers[subscription.event_type] = remaining
+            else:
+                del self._subscribers[subscription.event_type]
+        subscription.cancel()
+        return True
+
+    def subscriber_count(self, event_type: Type[Event]) -> int:
+        """
+        Retourne le nombre d'abonnés à un type d'événement.
+        """
+        with self._lock:
+            return len(self._subscribers.get(event_type, ()))
 
     def publish(self, event: Event) -> None:
         """
@@ -87,5 +668,13 @@ class EventBus:
         Args:
             event : événement à diffuser
         """
-        for handler in self._subscribers[type(event)]:
-            handler(event)
+        for subscription in self._subscribers.get(type(event), ()):
+            subscription.deliver(event)
+
+    def _add(self, subscription: Subscription) -> None:
+        """
+        Enregistre un abonnement (copie de la liste des abonnés).
+        """
+        with self._lock:
+            current = self._subscribers.get(subscription.event_type, ())
+            self._subscribers[subscription.event_type] = current + (subscription,)
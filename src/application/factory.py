@@ -4,11 +4,68 @@ Factory de création de l'application météo.
 Ce module centralise la construction des objets principaux
 (service métier, client météo, interface graphique) selon
 le pattern Factory.
+
+L'interface graphique n'est importée que par create_app() : le service
+peut être construit sans Tkinter (CLI, tâches planifiées, conteneurs).
 """
 
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
 from src.application.station_directory_service import StationDirectoryService
+from src.infrastructure.columnar_store import ColumnarStationStore
+from src.infrastructure.disk_cache import JsonDiskCache
 from src.infrastructure.meteo_clients import HttpMeteoClient
-from src.ui.tkinter_app import MeteoApp
+from src.infrastructure.record_store import StationRecordStore
+from src.infrastructure.rollup_engine import RollupEngine
+
+if TYPE_CHECKING:
+    from src.ui.tkinter_app import MeteoApp
+
+
+# Cache disque d'exécution, hors du dépôt (cache/meteo_cache.json, suivi
+# par git, n'est qu'un exemple de données) : variable d'environnement
+# METEO_CACHE_FILE, sinon répertoire de cache de l'utilisateur.
+CACHE_FILE_ENV = "METEO_CACHE_FILE"
+CACHE_FILE_NAME = Path("meteo-toulouse") / "meteo_cache.json"
+
+# Taille de la fenêtre d'enregistrements agrégés par station : identique
+# à la page par défaut de l'API (10 enregistrements les plus récents).
+RECORDS_WINDOW = 10
+
+# Nombre maximal de points d'historique par station (environ 100 jours
+# d'enregistrements au pas de 15 minutes).
+HISTORY_MAX_POINTS = 10_000
+
+# Nombre maximal de fenêtres de cumuls par station et par résolution
+# (100 jours en horaire, plus de 6 ans en journalier).
+ROLLUP_MAX_BUCKETS = 2_400
+
+# Délai de regroupement des écritures du cache disque (secondes) : un
+# chargement groupé donne une seule réécriture du fichier.
+CACHE_FLUSH_DELAY_SECONDS = 5.0
+
+# Durée de conservation sur disque des enregistrements bruts : après un
+# redémarrage dans ce délai, le premier appel API reste incrémental.
+RAW_RECORDS_TTL_SECONDS = 86_400
+
+
+def default_cache_file() -> Path:
+    """
+    Retourne le chemin du cache disque d'exécution.
+
+    Returns:
+        Chemin donné par METEO_CACHE_FILE, sinon fichier du répertoire de
+        cache de l'utilisateur ($XDG_CACHE_HOME ou ~/.cache).
+    """
+    override = os.environ.get(CACHE_FILE_ENV)
+    if override:
+        return Path(override)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / CACHE_FILE_NAME
 
 
 class AppFactory:
@@ -18,16 +75,38 @@ class AppFactory:
     """
 
     @staticmethod
-    def create_service() -> StationDirectoryService:
+    def create_service(cache_file: Optional[Path] = None) -> StationDirectoryService:
         """
         Crée et configure le service principal de gestion des stations météo.
 
+        Args:
+            cache_file: fichier du cache disque (default_cache_file() si None)
+
         Returns:
             StationDirectoryService: service configuré avec le client HTTP
-            et le cache mémoire.
+            et le cache mémoire (valeurs périmées servies pendant le
+            rafraîchissement), le cache disque partagé entre exécutions et
+            la récupération incrémentale des enregistrements,
+            l'historique colonnaire des enregistrements reçus et les
+            cumuls horaires / journaliers.
         """
         client = HttpMeteoClient(timeout_seconds=10)
-        return StationDirectoryService(client=client, cache_ttl_seconds=60)
+        return StationDirectoryService(
+            client=client,
+            cache_ttl_seconds=60,
+            stale_ttl_seconds=600,
+            persistent_cache=JsonDiskCache(
+                cache_file or default_cache_file(),
+                ttl_seconds=60,
+                flush_delay_seconds=CACHE_FLUSH_DELAY_SECONDS,
+            ),
+            record_store=StationRecordStore(max_records_per_station=RECORDS_WINDOW),
+            history_store=ColumnarStationStore(
+                max_points_per_station=HISTORY_MAX_POINTS
+            ),
+            rollup_engine=RollupEngine(max_buckets=ROLLUP_MAX_BUCKETS),
+            raw_records_ttl_seconds=RAW_RECORDS_TTL_SECONDS,
+        )
 
     @staticmethod
     def create_app() -> MeteoApp:
@@ -37,5 +116,8 @@ class AppFactory:
         Returns:
             MeteoApp: instance de l'application prête à être lancée.
         """
+        from src.ui.tkinter_app import MeteoApp  # pylint: disable=import-outside-toplevel
+
         service = AppFactory.create_service()
+        service.start_background_refresh()
         return MeteoApp(service=service)
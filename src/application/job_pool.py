@@ -0,0 +1,270 @@
+"""
+Pool de workers pour les chargements de stations.
+
+Les demandes sont identifiées par une clé (le nom de la station) et
+exécutées par plusieurs threads. Une clé n'est jamais en attente ni en
+cours d'exécution deux fois : une nouvelle demande pour une station déjà
+en attente remplace l'ancienne (avec la meilleure des deux priorités).
+Les demandes en attente sont servies par priorité croissante (un clic de
+l'utilisateur passe avant un rafraîchissement d'arrière-plan), puis par
+ordre d'arrivée.
+"""
+
+from __future__ import annotations
+
+import heapq
+from itertools import count
+from threading import Condition, Thread
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+# Priorités usuelles (la plus petite valeur est servie en premier)
+PRIORITY_USER = 0
+PRIORITY_BACKGROUND = 10
+
+
+class JobPool(Generic[K]):  # pylint: disable=too-many-instance-attributes
+    """
+    Pool de threads exécutant run(clé) pour chaque demande.
+
+    Responsabilités :
+    - répartir les demandes sur plusieurs workers
+    - dédupliquer les demandes par clé (en attente ou en cours)
+    - servir les demandes par priorité
+    - annuler une demande en attente
+    """
+
+    def __init__(
+        self,
+        run: Callable[[K], None],
+        workers: int = 4,
+        name: str = "job-pool",
+        on_error: Optional[Callable[[K, Exception], None]] = None,
+    ):
+        """
+        Initialise le pool (non démarré).
+
+        Args:
+            run: fonction exécutée pour chaque clé ; toute exception est
+                comptée (failed) sans arrêter le worker
+            workers: nombre de threads
+            name: préfixe du nom des threads
+            on_error: fonction appelée avec la clé et l'exception d'une
+                demande en échec (None = échec seulement compté)
+
+        Raises:
+            ValueError: si le nombre de workers est inférieur à 1
+        """
+        if workers < 1:
+            raise ValueError("Le pool doit avoir au moins un worker")
+        self._run = run
+        self._workers = workers
+        self._name = name
+        self._on_error = on_error
+
+        self._condition = Condition()
+        self._heap: list[tuple[int, int, K]] = []
+        # clé -> (priorité, numéro de séquence) de la demande en attente
+        self._pending: dict[K, tuple[int, int]] = {}
+        self._running: set[K] = set()
+        self._sequence = count()
+        self._threads: list[Thread] = []
+        self._stopping = False
+        self._counters = {
+            "submitted": 0,
+            "deduplicated": 0,
+            "cancelled": 0,
+            "completed": 0,
+            "failed": 0,
+        }
+
+    def start(self) -> None:
+        """
+        Démarre les workers s'ils ne tournent pas déjà.
+        """
+        with self._condition:
+            if self._threads:
+                return
+            self._stopping = False
+            self._threads = [
+                Thread(target=self._work, name=f"{self._name}-{index}", daemon=True)
+                for index in range(self._workers)
+            ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Arrête les workers après leur tâche en cours ; les demandes en
+        attente sont abandonnées.
+
+        Args:
+            timeout: attente maximale par thread (None = illimitée)
+        """
+        with self._condition:
+            self._stopping = True
+            self._heap.clear()
+            self._pending.clear()
+            self._condition.notify_all()
+            threads, self._threads = self._threads, []
+        for thread in threads:
+            thread.join(timeout)
+
+    def submit(self, key: K, priority: int = PRIORITY_USER) -> bool:
+        """
+        Demande l'exécution de run(key).
+
+        Si la clé est déjà en attente, la demande existante est remplacée
+        et garde la meilleure priorité ; si elle est en cours
+        d'exécution, la demande est ignorée (le résultat en cours la
+        satisfait).
+
+        Args:
+            key: clé de la demande (ex: nom de station)
+            priority: priorité (PRIORITY_USER, PRIORITY_BACKGROUND, ...)
+
+        Returns:
+            True si une nouvelle demande a été mise en attente, False si
+            elle a été fusionnée avec une demande existante.
+        """
+        with self._condition:
+            self._counters["submitted"] += 1
+            if key in self._running:
+                self._counters["deduplicated"] += 1
+                return False
+
+            current = self._pending.get(key)
+            if current is not None:
+                self._counters["deduplicated"] += 1
+                if current[0] <= priority:
+                    return False
+                # Priorité améliorée : l'ancienne entrée du tas devient obsolète
+                self._push(key, priority)
+                return False
+
+            self._push(key, priority)
+            self._condition.notify_all()
+            return True
+
+    def cancel(self, key: K) -> bool:
+        """
+        Annule une demande en attente (une exécution en cours n'est pas
+        interrompue).
+
+        Args:
+            key: clé de la demande
+
+        Returns:
+            True si une demande en attente a été annulée.
+        """
+        with self._condition:
+            if self._pending.pop(key, None) is None:
+                return False
+            self._counters["cancelled"] += 1
+            return True
+
+    def pending(self) -> list[K]:
+        """
+        Retourne les clés en attente, dans l'ordre où elles seront servies.
+        """
+        with self._condition:
+            return [
+                key
+                for key, _ in sorted(self._pending.items(), key=lambda item: item[1])
+            ]
+
+    def running(self) -> set[K]:
+        """
+        Retourne les clés en cours d'exécution.
+        """
+        with self._condition:
+            return set(self._running)
+
+    def stats(self) -> dict[str, int]:
+        """
+        Retourne les compteurs du pool.
+
+        Returns:
+            Dictionnaire contenant submitted, deduplicated, cancelled,
+            completed, failed, pending et running.
+        """
+        with self._condition:
+            stats = dict(self._counters)
+            stats["pending"] = len(self._pending)
+            stats["running"] = len(self._running)
+            return stats
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """
+        Attend qu'aucune demande ne soit en attente ni en cours.
+
+        Args:
+            timeout: attente maximale en secondes (None = illimitée)
+
+        Returns:
+            True si le pool est inactif, False si le délai a expiré.
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._pending and not self._running, timeout
+            )
+
+    def _push(self, key: K, priority: int) -> None:
+        """
+        Enregistre une demande en attente (verrou déjà acquis).
+        """
+        sequence = next(self._sequence)
+        self._pending[key] = (priority, sequence)
+        heapq.heappush(self._heap, (priority, sequence, key))
+
+    def _next_key(self) -> Optional[K]:
+        """
+        Attend et retire la prochaine demande valide (None = arrêt).
+        """
+        with self._condition:
+            while True:
+                while self._heap:
+                    priority, sequence, key = heapq.heappop(self._heap)
+                    # Entrées annulées ou remplacées : ignorées
+                    if self._pending.get(key) == (priority, sequence):
+                        del self._pending[key]
+                        self._running.add(key)
+                        return key
+                if self._stopping:
+                    return None
+                self._condition.wait()
+
+    def _work(self) -> None:
+        """
+        Boucle d'un worker : exécute les demandes jusqu'à l'arrêt.
+        """
+        while True:
+            key = self._next_key()
+            if key is None:
+                return
+            outcome = "completed"
+            try:
+                self._run(key)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                # Un bug d'une demande ne doit pas tuer le worker : le pool
+                # perdrait un thread sans bruit et les demandes resteraient
+                # en attente une fois tous les workers morts.
+                outcome = "failed"
+                self._report(key, exc)
+            finally:
+                with self._condition:
+                    self._running.discard(key)
+                    self._counters[outcome] += 1
+                    self._condition.notify_all()
+
+    def _report(self, key: K, exc: Exception) -> None:
+        """
+        Transmet l'échec d'une demande à on_error (best-effort).
+        """
+        if self._on_error is None:
+            return
+        try:
+            self._on_error(key, exc)
+        except Exception:  # pylint: disable=broad-exception-caught
+            pass
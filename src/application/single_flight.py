@@ -0,0 +1,76 @@
+"""
+Déduplication des appels concurrents (single-flight).
+
+Lorsque plusieurs threads demandent simultanément la même clé, un seul
+d'entre eux exécute réellement le chargement ; les autres attendent son
+résultat (ou son exception) au lieu de relancer le même appel.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Future
+from threading import Lock
+from typing import Callable, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class SingleFlight(Generic[K, V]):
+    """
+    Coordonne les appels concurrents portant sur une même clé.
+
+    Un appel est "en vol" entre le début et la fin de l'exécution de la
+    fonction de chargement. Tout appel arrivant pendant cette fenêtre
+    partage le résultat de l'appel en cours.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialise le coordinateur sans appel en cours.
+        """
+        self._lock = Lock()
+        self._in_flight: dict[K, Future] = {}
+
+    def do(self, key: K, loader: Callable[[], V]) -> V:
+        """
+        Exécute loader() une seule fois pour tous les appels concurrents.
+
+        Args:
+            key: clé identifiant la ressource demandée
+            loader: fonction de chargement exécutée par le premier appelant
+
+        Returns:
+            Le résultat du chargement (partagé entre les appelants).
+
+        Raises:
+            Exception: l'exception levée par loader(), propagée à chacun
+        """
+        with self._lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._in_flight[key] = future
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = loader()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+        future.set_result(result)
+        return result
+
+    def in_flight(self) -> int:
+        """
+        Retourne le nombre de clés en cours de chargement.
+        """
+        with self._lock:
+            return len(self._in_flight)
@@ -5,15 +5,36 @@ Ce module contient le service principal utilisé par l'interface graphique.
 Il orchestre :
 - la liste des stations disponibles (via un catalogue)
 - la récupération des données (via une stratégie MeteoClient)
-- un cache en mémoire (dictionnaire) avec TTL
+- un cache en mémoire borné (LRU + TTL) avec mode stale-while-revalidate
+- un cache persistant optionnel (fichier JSON) partagé entre exécutions,
+  qui conserve aussi les enregistrements bruts (relus au redémarrage)
+- une récupération incrémentale optionnelle (seuls les nouveaux
+  enregistrements sont demandés à l'API)
+- le chargement concurrent de plusieurs stations (pool de threads borné)
+- un historique colonnaire optionnel des enregistrements reçus
+- des cumuls horaires / journaliers optionnels (min, max, moyenne, somme)
 """
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from threading import Lock
+from datetime import datetime
+from math import inf
 from time import time
-from typing import Optional, Protocol
-
+from typing import Iterable, Iterator, Optional, Protocol
+
+from src.application.background_refresher import BackgroundRefresher
+from src.application.single_flight import SingleFlight
+from src.domain.field_stats import FieldStats
+from src.domain.lru_cache import LruTtlCache
+from src.domain.mesure.raw_data import RawMeteoData
+from src.infrastructure.columnar_store import ColumnarStationStore, SeriesSlice
+from src.infrastructure.disk_cache import JsonDiskCache
+from src.infrastructure.record_store import StationRecordStore
+from src.infrastructure.rollup_engine import RollupEngine
+from src.infrastructure.station_serializer import station_from_dict, station_to_dict
 from src.infrastructure.station_registry import StationRegistry
 from src.infrastructure.reading_aggregator import aggregate_latest_values
 from src.domain.station import Station
@@ -23,6 +44,9 @@ from src.domain.mesure.pression import Pression
 from src.infrastructure.meteo_clients import MeteoClient, HttpMeteoClient
 
 
+DEFAULT_CACHE_MAX_ENTRIES = 1024
+
+
 class StationCatalog(Protocol):  # pylint: disable=too-few-public-methods
     """
     Port (interface) permettant d'obtenir les stations disponibles.
@@ -53,14 +77,63 @@ class DefaultStationCatalog:
         return StationRegistry.get_stations()
 
 
-class StationDirectoryService:
+def build_station(station_name: str, raw_data) -> Optional[Station]:
+    """
+    Construit une Station (domain) à partir des données brutes de l'API.
+
+    Args:
+        station_name: nom de la station
+        raw_data: objet contenant les enregistrements bruts (attribut .data)
+
+    Returns:
+        Station si des données exploitables existent, sinon None.
+    """
+    if raw_data is None or not getattr(raw_data, "data", None):
+        return None
+
+    agg = aggregate_latest_values(
+        raw_data.data, newest_first=getattr(raw_data, "newest_first", False)
+    )
+    if agg.get("timestamp") is None:
+        return None
+
+    return Station(
+        name=station_name,
+        timestamp=agg["timestamp"],
+        temperature=Temperature(agg.get("temperature_c")),
+        humidity=Humidite(agg.get("humidity_pct")),
+        pressure=Pression(agg.get("pressure_hpa")),
+        rain=agg.get("rain_mm"),
+        wind_speed=agg.get("wind_speed"),
+        wind_direction=agg.get("wind_direction_deg"),
+    )
+
+
+@dataclass(frozen=True)
+class StationFetchResult:
+    """
+    Résultat d'un chargement de station lors d'une requête groupée.
+
+    Attributs:
+        name: nom de la station
+        station: lecture obtenue (ou None si aucune donnée exploitable)
+        error: exception levée lors du chargement, sinon None
+    """
+
+    name: str
+    station: Optional[Station]
+    error: Optional[Exception] = None
+
+
+class StationDirectoryService:  # pylint: disable=too-many-instance-attributes
     """
     Service applicatif principal.
 
     Responsabilités :
     - fournir la liste des stations
-    - récupérer la dernière lecture pour une station
-    - mettre en cache en mémoire (dictionnaire) les résultats récents
+    - récupérer la dernière lecture pour une ou plusieurs stations
+    - mettre en cache en mémoire (cache LRU borné) les résultats récents
+    - rafraîchir en arrière-plan les entrées périmées ou sur le point de l'être
     """
 
     def __init__(
@@ -68,7 +141,15 @@ class StationDirectoryService:
         catalog: StationCatalog | None = None,
         client: MeteoClient | None = None,
         cache_ttl_seconds: int = 60,
-    ):
+        max_workers: int = 8,
+        stale_ttl_seconds: int = 0,
+        cache: Optional[LruTtlCache[str, Station]] = None,
+        persistent_cache: Optional[JsonDiskCache] = None,
+        record_store: Optional[StationRecordStore] = None,
+        history_store: Optional[ColumnarStationStore] = None,
+        rollup_engine: Optional[RollupEngine] = None,
+        raw_records_ttl_seconds: Optional[float] = None,
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
         """
         Initialise le service.
 
@@ -76,14 +157,69 @@ class StationDirectoryService:
             catalog: source des stations (station -> endpoint)
             client: stratégie de récupération des données (HTTP, mock, etc.)
             cache_ttl_seconds: durée de validité du cache mémoire
+            max_workers: nombre maximal d'appels API simultanés lors
+                d'un chargement groupé
+            stale_ttl_seconds: durée après expiration pendant laquelle une
+                valeur périmée est encore servie immédiatement, pendant
+                qu'un rafraîchissement est lancé en arrière-plan
+                (0 = désactivé)
+            cache: cache mémoire à utiliser ; s'il est fourni,
+                cache_ttl_seconds et stale_ttl_seconds sont ignorés
+            persistent_cache: cache disque consulté avant l'API et
+                alimenté après chaque appel (lectures agrégées et
+                enregistrements bruts) ; écrit à la fermeture du service
+            record_store: stockage local des enregistrements ; s'il est
+                fourni, seuls les enregistrements postérieurs au plus
+                récent déjà connu sont demandés à l'API (mode incrémental)
+            history_store: historique colonnaire alimenté par chaque lot
+                d'enregistrements reçu (voir get_history)
+            rollup_engine: cumuls par fenêtre de temps mis à jour à
+                chaque lot d'enregistrements reçu (voir get_rollups)
+            raw_records_ttl_seconds: durée de validité sur disque des
+                enregistrements bruts (TTL du cache disque si None) ; ils
+                sont rechargés dans record_store, history_store et
+                rollup_engine au premier accès à la station
         """
         self._catalog = catalog or DefaultStationCatalog()
         self._client: MeteoClient = client or HttpMeteoClient(timeout_seconds=10)
-        self._cache_ttl_seconds = cache_ttl_seconds
 
-        # Dictionnaire (barème): cache en mémoire
-        # cache[station_name] = {"expires_at": float, "value": Station}
-        self._cache: dict[str, dict] = {}
+        # Cache mémoire borné : station_name -> Station
+        if cache is None:
+            cache = LruTtlCache(
+                ttl_seconds=cache_ttl_seconds,
+                stale_ttl_seconds=stale_ttl_seconds,
+                max_entries=DEFAULT_CACHE_MAX_ENTRIES,
+                clock=time,
+            )
+        self._cache: LruTtlCache[str, Station] = cache
+        self._persistent_cache = persistent_cache
+        self._record_store = record_store
+        self._history_store = history_store
+        self._rollup_engine = rollup_engine
+        self._raw_records_ttl_seconds = raw_records_ttl_seconds
+
+        # Stations dont les enregistrements persistés ont été rechargés
+        self._restored: set[str] = set()
+        self._restore_lock = Lock()
+
+        # Dernières données brutes reçues et Station construite, par station :
+        # un client renvoyant le même objet (HTTP 304) évite la ré-agrégation.
+        # Borné comme le cache mémoire (LRU, sans expiration).
+        self._last_built: LruTtlCache[str, tuple[object, Station]] = LruTtlCache(
+            ttl_seconds=inf, max_entries=DEFAULT_CACHE_MAX_ENTRIES
+        )
+
+        # Stations dont un rafraîchissement en arrière-plan est programmé
+        self._refreshing: set[str] = set()
+        self._refresher: Optional[BackgroundRefresher] = None
+
+        # Chargements en cours, partagés entre appels concurrents
+        self._single_flight: SingleFlight[str, Optional[Station]] = SingleFlight()
+
+        # Pool de threads créé à la demande pour les chargements groupés
+        self._max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = Lock()
 
     def get_station_names(self) -> list[str]:
         """
@@ -95,24 +231,33 @@ class StationDirectoryService:
         """
         Récupère une valeur du cache si elle est présente et non expirée.
 
+        N'affecte ni l'ordre LRU ni les statistiques du cache.
+
         Args:
             station_name: nom de la station
 
         Returns:
             Station si disponible en cache, sinon None.
         """
-        item = self._cache.get(station_name)
-        if not item:
-            return None
+        return self._cache.peek(station_name)
 
-        expires_at = item.get("expires_at")
-        value = item.get("value")
+    def _cache_get_or_revalidate(self, station_name: str) -> Optional[Station]:
+        """
+        Récupère une valeur du cache, fraîche ou périmée (stale-while-revalidate).
 
-        if not isinstance(expires_at, (int, float)) or time() > expires_at:
-            self._cache.pop(station_name, None)
-            return None
+        Une valeur périmée est retournée immédiatement et un rafraîchissement
+        est programmé en arrière-plan.
 
-        return value if isinstance(value, Station) else None
+        Args:
+            station_name: nom de la station
+
+        Returns:
+            Station si disponible en cache, sinon None.
+        """
+        value, stale = self._cache.lookup(station_name)
+        if stale:
+            self._refresh_in_background(station_name)
+        return value
 
     def _cache_set(self, station_name: str, value: Station) -> None:
         """
@@ -122,18 +267,24 @@ class StationDirectoryService:
             station_name: nom de la station
             value: objet Station à mettre en cache
         """
-        self._cache[station_name] = {
-            "expires_at": time() + self._cache_ttl_seconds,
-            "value": value,
-        }
+        self._cache.set(station_name, value)
+
+    def cache_stats(self) -> dict[str, float]:
+        """
+        Retourne les statistiques du cache mémoire.
+
+        Returns:
+            Dictionnaire (hits, misses, évictions, taux de succès, etc.).
+        """
+        return self._cache.stats()
 
     def get_latest_for_station(self, station_name: str) -> Optional[Station]:
         """
         Retourne la dernière lecture météo disponible pour une station.
 
         Stratégie :
-        - check cache (dictionnaire)
-        - appel API (via MeteoClient)
+        - check cache (dictionnaire), valeur périmée servie si autorisé
+        - appel API (via MeteoClient), partagé entre appels concurrents
         - agrégation des champs (records hétérogènes)
         - construction d'une Station (domain)
 
@@ -143,33 +294,430 @@ class StationDirectoryService:
         Returns:
             Station si des données exploitables existent, sinon None.
         """
-        cached = self._cache_get(station_name)
+        cached = self._cache_get_or_revalidate(station_name)
         if cached is not None:
             return cached
+        return self._load_missing(station_name)
+
+    def _load_missing(self, station_name: str) -> Optional[Station]:
+        """
+        Charge une station absente du cache mémoire (la recherche dans le
+        cache, et donc le comptage du défaut, a déjà été faite).
+
+        Args:
+            station_name: nom de la station
 
+        Returns:
+            Station si des données exploitables existent, sinon None.
+        """
         stations = self._catalog.get_stations()
         endpoint = stations.get(station_name)
         if not endpoint:
             return None
 
-        raw_data = self._client.fetch(endpoint)
-        if raw_data is None or not getattr(raw_data, "data", None):
+        # Single-flight : les appels concurrents pour une même station
+        # attendent un unique appel API au lieu de le dupliquer.
+        return self._single_flight.do(
+            station_name,
+            lambda: self._load_station(station_name, endpoint),
+        )
+
+    def _load_station(
+        self, station_name: str, endpoint: str, force: bool = False
+    ) -> Optional[Station]:
+        """
+        Interroge l'API pour une station et met le résultat en cache.
+
+        Args:
+            station_name: nom de la station
+            endpoint: endpoint API de la station
+            force: ignore une éventuelle valeur fraîche du cache
+
+        Returns:
+            Station si des données exploitables existent, sinon None.
+        """
+        # Un chargement concurrent (ou une exécution précédente, via le
+        # cache disque) a pu fournir la valeur entre-temps.
+        if not force:
+            cached = self._cache_get(station_name) or self._persistent_get(
+                station_name
+            )
+            if cached is not None:
+                return cached
+
+        raw_data = self._fetch_raw(station_name, endpoint)
+        previous = self._last_built.peek(station_name)
+        if previous is not None and previous[0] is raw_data:
+            station = previous[1]
+        else:
+            self._ingest_history(station_name, raw_data)
+            station = build_station(station_name, raw_data)
+            if station is None:
+                return None
+            self._last_built.set(station_name, (raw_data, station))
+
+        self._cache_set(station_name, station)
+        self._persistent_set(station_name, raw_data, station)
+        return station
+
+    def _fetch_raw(self, station_name: str, endpoint: str):
+        """
+        Récupère les données brutes d'une station, de façon incrémentale
+        si un stockage local est configuré.
+
+        En mode incrémental, seuls les enregistrements postérieurs au plus
+        récent heure_utc connu sont demandés, puis fusionnés dans la fenêtre
+        locale. Si rien de nouveau n'arrive, le même objet RawMeteoData est
+        retourné (pas de ré-agrégation).
+
+        Args:
+            station_name: nom de la station
+            endpoint: endpoint API de la station
+
+        Returns:
+            Objet contenant les enregistrements bruts (attribut .data).
+        """
+        self._restore_records(station_name)
+        store = self._record_store
+        if store is None:
+            return self._client.fetch(endpoint)
+
+        since = store.newest_timestamp(station_name)
+        url = (
+            StationRegistry.incremental_endpoint(endpoint, since)
+            if since is not None
+            else endpoint
+        )
+        fetched = self._client.fetch(url)
+        records = getattr(fetched, "data", None) or []
+        store.merge(station_name, records)
+
+        if store.newest_timestamp(station_name) is None:
+            # Enregistrements sans heure_utc : pas de mode incrémental possible.
+            return fetched
+        return store.snapshot(station_name)
+
+    def _ingest_history(self, station_name: str, raw_data) -> None:
+        """
+        Ajoute les enregistrements reçus à l'historique colonnaire et aux
+        cumuls par fenêtre de temps.
+
+        Args:
+            station_name: nom de la station
+            raw_data: données brutes retournées par le client
+        """
+        if raw_data is None:
+            return
+        if self._history_store is not None:
+            self._history_store.ingest(station_name, raw_data)
+        if self._rollup_engine is not None:
+            self._rollup_engine.ingest(station_name, raw_data)
+
+    def get_history(
+        self,
+        station_name: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Optional[SeriesSlice]:
+        """
+        Retourne l'historique déjà reçu d'une station sur [start, end[.
+
+        Aucun appel API n'est effectué : seuls les enregistrements reçus
+        lors des chargements précédents sont disponibles.
+
+        Args:
+            station_name: nom de la station
+            start: début inclus (None = depuis le premier point)
+            end: fin exclue (None = jusqu'au dernier point)
+
+        Returns:
+            SeriesSlice, ou None si aucun historique n'est configuré.
+        """
+        if self._history_store is None:
             return None
+        self._restore_records(station_name)
+        return self._history_store.range(station_name, start, end)
 
-        agg = aggregate_latest_values(raw_data.data)
-        if agg.get("timestamp") is None:
+    def get_rollups(
+        self,
+        station_name: str,
+        resolution: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Optional[list[tuple[datetime, dict[str, FieldStats]]]]:
+        """
+        Retourne les cumuls d'une station par fenêtre de temps.
+
+        Les cumuls sont calculés au fil des chargements : aucun appel API
+        ni aucune ré-agrégation n'est effectué.
+
+        Args:
+            station_name: nom de la station
+            resolution: résolution ("hour" ou "day")
+            start: début inclus (None = première fenêtre)
+            end: fin exclue (None = dernière fenêtre)
+
+        Returns:
+            Liste (début de fenêtre UTC, champ -> FieldStats), ou None si
+            aucun moteur de cumuls n'est configuré.
+
+        Raises:
+            ValueError: si la résolution est inconnue
+        """
+        if self._rollup_engine is None:
             return None
+        self._restore_records(station_name)
+        return self._rollup_engine.rollups(station_name, resolution, start, end)
 
-        station = Station(
-            name=station_name,
-            timestamp=agg["timestamp"],
-            temperature=Temperature(agg.get("temperature_c")),
-            humidity=Humidite(agg.get("humidity_pct")),
-            pressure=Pression(agg.get("pressure_hpa")),
-            rain=agg.get("rain_mm"),
-            wind_speed=agg.get("wind_speed"),
-            wind_direction=agg.get("wind_direction_deg"),
-        )
+    def _persistent_get(self, station_name: str) -> Optional[Station]:
+        """
+        Recherche une lecture encore valide dans le cache disque.
 
-        self._cache_set(station_name, station)
+        La lecture trouvée est replacée dans le cache mémoire pour la durée
+        de validité restante.
+
+        Args:
+            station_name: nom de la station
+
+        Returns:
+            Station si disponible sur disque, sinon None.
+        """
+        if self._persistent_cache is None:
+            return None
+
+        entry = self._persistent_cache.get_entry(f"station:{station_name}")
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        station = station_from_dict(value)
+        if station is not None:
+            self._cache.set(station_name, station, ttl_seconds=expires_at - time())
         return station
+
+    def _persistent_set(self, station_name: str, raw_data, station: Station) -> None:
+        """
+        Enregistre la lecture agrégée et les enregistrements bruts sur disque.
+
+        L'écriture est best-effort : une erreur disque n'empêche pas de
+        retourner la lecture obtenue depuis l'API.
+
+        Args:
+            station_name: nom de la station
+            raw_data: données brutes (fenêtre locale en mode incrémental)
+            station: lecture agrégée
+        """
+        if self._persistent_cache is None:
+            return
+
+        try:
+            self._persistent_cache.set(
+                f"station:{station_name}", station_to_dict(station)
+            )
+            self._persistent_cache.set(
+                f"raw:{station_name}",
+                list(getattr(raw_data, "data", None) or []),
+                ttl_seconds=self._raw_records_ttl_seconds,
+            )
+        except (OSError, TypeError, ValueError):
+            return
+
+    def _restore_records(self, station_name: str) -> None:
+        """
+        Recharge une fois les enregistrements bruts persistés d'une station
+        dans le stockage incrémental, l'historique et les cumuls.
+
+        Après un redémarrage, le premier appel API est ainsi incrémental
+        et l'historique reprend là où il s'était arrêté.
+
+        Args:
+            station_name: nom de la station
+        """
+        if self._persistent_cache is None:
+            return
+
+        with self._restore_lock:
+            if station_name in self._restored:
+                return
+            self._restored.add(station_name)
+
+            records = self._persistent_cache.get(f"raw:{station_name}")
+            if not isinstance(records, list):
+                return
+            records = [record for record in records if isinstance(record, dict)]
+            if not records:
+                return
+            if self._record_store is not None:
+                self._record_store.merge(station_name, records)
+            self._ingest_history(station_name, RawMeteoData(records))
+
+    def get_latest_for_stations(
+        self, station_names: Iterable[str], allow_stale: bool = True
+    ) -> Iterator[StationFetchResult]:
+        """
+        Charge plusieurs stations en parallèle.
+
+        Les stations présentes dans le cache sont renvoyées immédiatement ;
+        les autres sont chargées simultanément dans un pool de threads borné
+        et renvoyées au fur et à mesure de leur arrivée. Une erreur sur une
+        station n'interrompt pas les autres : elle est portée par le résultat.
+
+        Args:
+            station_names: noms des stations à charger (doublons ignorés)
+            allow_stale: si False, une valeur périmée du cache n'est pas
+                servie : la station est rechargée avant d'être renvoyée
+                (interrogations périodiques)
+
+        Yields:
+            StationFetchResult pour chaque station, dans l'ordre d'arrivée.
+        """
+        hits: list[StationFetchResult] = []
+        pending = {}
+        for name in dict.fromkeys(station_names):
+            cached = (
+                self._cache_get_or_revalidate(name)
+                if allow_stale
+                else self._cache.get(name)
+            )
+            if cached is not None:
+                hits.append(StationFetchResult(name=name, station=cached))
+                continue
+            future = self._get_executor().submit(self._load_missing, name)
+            pending[future] = name
+
+        yield from hits
+
+        for future in as_completed(pending):
+            name = pending[future]
+            try:
+                yield StationFetchResult(name=name, station=future.result())
+            except (OSError, RuntimeError, ValueError) as exc:
+                yield StationFetchResult(name=name, station=None, error=exc)
+
+    def refresh_station(self, station_name: str) -> Optional[Station]:
+        """
+        Recharge une station depuis l'API, même si le cache est encore frais.
+
+        Args:
+            station_name: nom de la station
+
+        Returns:
+            Station si des données exploitables existent, sinon None.
+        """
+        endpoint = self._catalog.get_stations().get(station_name)
+        if not endpoint:
+            return None
+        return self._single_flight.do(
+            station_name,
+            lambda: self._load_station(station_name, endpoint, force=True),
+        )
+
+    def _refresh_in_background(self, station_name: str) -> None:
+        """
+        Programme le rechargement d'une station dans le pool de threads.
+
+        Un seul rafraîchissement par station peut être programmé à la fois.
+
+        Args:
+            station_name: nom de la station
+        """
+        with self._lock:
+            if station_name in self._refreshing:
+                return
+            self._refreshing.add(station_name)
+
+        def done(_future) -> None:
+            with self._lock:
+                self._refreshing.discard(station_name)
+
+        future = self._get_executor().submit(self.refresh_station, station_name)
+        future.add_done_callback(done)
+
+    def refresh_hot_stations(
+        self, refresh_ahead_seconds: float, hot_window_seconds: float
+    ) -> list[str]:
+        """
+        Programme le rafraîchissement des stations "chaudes" proches de
+        l'expiration.
+
+        Une station est chaude si elle a été consultée depuis moins de
+        hot_window_seconds ; elle est rafraîchie si son entrée expire dans
+        moins de refresh_ahead_seconds.
+
+        Args:
+            refresh_ahead_seconds: marge avant expiration
+            hot_window_seconds: fenêtre de consultation récente
+
+        Returns:
+            Liste des stations dont le rafraîchissement a été programmé.
+        """
+        now = time()
+        scheduled = []
+        for name, expires_at, last_access in self._cache.entries():
+            if now - last_access > hot_window_seconds:
+                continue
+            if expires_at - now <= refresh_ahead_seconds:
+                self._refresh_in_background(name)
+                scheduled.append(name)
+        return scheduled
+
+    def start_background_refresh(
+        self,
+        interval_seconds: float = 5.0,
+        refresh_ahead_seconds: float = 10.0,
+        hot_window_seconds: float = 300.0,
+    ) -> None:
+        """
+        Démarre le rafraîchissement proactif des stations chaudes.
+
+        Args:
+            interval_seconds: délai entre deux passes
+            refresh_ahead_seconds: marge avant expiration
+            hot_window_seconds: fenêtre de consultation récente
+        """
+        if self._refresher is None:
+            self._refresher = BackgroundRefresher(
+                tick=lambda: self.refresh_hot_stations(
+                    refresh_ahead_seconds, hot_window_seconds
+                ),
+                interval_seconds=interval_seconds,
+            )
+        self._refresher.start()
+
+    def stop_background_refresh(self) -> None:
+        """
+        Arrête le rafraîchissement proactif s'il est actif.
+        """
+        if self._refresher is not None:
+            self._refresher.stop()
+            self._refresher = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """
+        Retourne le pool de threads, créé au premier usage.
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="station-fetch",
+                )
+            return self._executor
+
+    def close(self) -> None:
+        """
+        Arrête le rafraîchissement proactif et le pool de threads, puis
+        écrit les modifications en attente du cache disque.
+        """
+        self.stop_background_refresh()
+        with self._lock:
+            executor, self._executor = self._executor, None
+        # Hors du verrou : l'annulation d'un rafraîchissement en attente
+        # exécute son callback, qui reprend ce verrou.
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        if self._persistent_cache is not None:
+            try:
+                self._persistent_cache.close()
+            except (OSError, TypeError, ValueError):
+                pass
@@ -0,0 +1,236 @@
+"""
+Interface en ligne de commande de l'application météo (sans Tkinter).
+
+Permet d'utiliser le service dans des tâches planifiées, des scripts ou
+des conteneurs : les stations demandées sont chargées en parallèle puis
+affichées en tableau, en JSON ou en CSV, une fois ou à intervalle
+régulier (--watch).
+
+Usage :
+    python -m src.cli --list
+    python -m src.cli "Station A" "Station B" --format json
+    python -m src.cli --all --format csv --watch 60
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+import json
+import sys
+from datetime import datetime
+from time import sleep as default_sleep
+from typing import Any, Callable, Optional, Sequence, TextIO
+
+from src.application.factory import AppFactory
+from src.application.station_directory_service import (
+    StationDirectoryService,
+    StationFetchResult,
+)
+from src.infrastructure.record_extractor import FIELD_SPECS
+from src.infrastructure.station_serializer import station_to_dict
+
+# Colonnes de sortie : nom, horodatage et mesures (clés de station_to_dict),
+# puis message d'erreur
+FIELDS = ("name", *FIELD_SPECS, "error")
+FORMATS = ("table", "json", "csv")
+NO_DATA = "Aucune donnée"
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Construit l'analyseur des arguments de la ligne de commande.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m src.cli",
+        description="Dernières mesures des stations météo de Toulouse Métropole.",
+    )
+    parser.add_argument("stations", nargs="*", help="noms des stations à charger")
+    parser.add_argument("--all", action="store_true", help="charger toutes les stations")
+    parser.add_argument("--list", action="store_true", help="lister les stations")
+    parser.add_argument(
+        "--format", choices=FORMATS, default="table", help="format de sortie"
+    )
+    parser.add_argument(
+        "--watch",
+        type=float,
+        metavar="SECONDES",
+        help="recharger et afficher à intervalle régulier",
+    )
+    parser.add_argument(
+        "--count",
+        type=int,
+        metavar="N",
+        help="nombre d'itérations en mode --watch (défaut : illimité)",
+    )
+    return parser
+
+
+def result_to_row(result: StationFetchResult) -> dict[str, Any]:
+    """
+    Convertit un résultat de chargement en ligne de sortie.
+
+    Args:
+        result: résultat du chargement groupé
+
+    Returns:
+        Dictionnaire ordonné selon FIELDS (None = valeur absente).
+    """
+    row: dict[str, Any] = dict.fromkeys(FIELDS)
+    row["name"] = result.name
+    if result.station is not None:
+        row.update(station_to_dict(result.station))
+    if result.error is not None:
+        row["error"] = str(result.error) or type(result.error).__name__
+    elif result.station is None:
+        row["error"] = NO_DATA
+    return row
+
+
+def fetch_rows(service: StationDirectoryService, names: Sequence[str]) -> list[dict]:
+    """
+    Charge les stations en parallèle et retourne les lignes de sortie.
+
+    Les valeurs périmées du cache ne sont pas servies : chaque itération
+    de --watch affiche des données rechargées une fois leur TTL écoulé.
+
+    Args:
+        service: service de récupération météo
+        names: stations à charger
+
+    Returns:
+        Lignes dans l'ordre des stations demandées.
+    """
+    results = {
+        result.name: result
+        for result in service.get_latest_for_stations(names, allow_stale=False)
+    }
+    return [result_to_row(results[name]) for name in dict.fromkeys(names)]
+
+
+def format_json(rows: list[dict], compact: bool = False) -> str:
+    """
+    Formate les lignes en document JSON (une ligne si compact).
+    """
+    if compact:
+        return json.dumps(rows, ensure_ascii=False) + "\n"
+    return json.dumps(rows, ensure_ascii=False, indent=2) + "\n"
+
+
+def format_csv(rows: list[dict], header: bool = True) -> str:
+    """
+    Formate les lignes en CSV (en-tête optionnel).
+    """
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=FIELDS, lineterminator="\n")
+    if header:
+        writer.writeheader()
+    writer.writerows(rows)
+    return buffer.getvalue()
+
+
+def format_table(rows: list[dict]) -> str:
+    """
+    Formate les lignes en tableau texte aligné ("-" = valeur absente).
+    """
+
+    def cell(value: Any) -> str:
+        if value is None:
+            return "-"
+        if isinstance(value, float):
+            return f"{value:.1f}"
+        return str(value)
+
+    cells = [list(FIELDS)] + [[cell(row[field]) for field in FIELDS] for row in rows]
+    widths = [max(len(line[index]) for line in cells) for index in range(len(FIELDS))]
+    return "".join(
+        "  ".join(text.ljust(width) for text, width in zip(line, widths)).rstrip() + "\n"
+        for line in cells
+    )
+
+
+def render(rows: list[dict], output_format: str, first: bool, watch: bool) -> str:
+    """
+    Formate une itération selon le format demandé.
+
+    Args:
+        rows: lignes à afficher
+        output_format: "table", "json" ou "csv"
+        first: True pour la première itération (en-tête CSV)
+        watch: True en mode --watch (JSON sur une ligne, tableau horodaté)
+
+    Returns:
+        Texte à écrire sur la sortie.
+    """
+    if output_format == "json":
+        return format_json(rows, compact=watch)
+    if output_format == "csv":
+        return format_csv(rows, header=first)
+    table = format_table(rows)
+    if watch:
+        return f"-- {datetime.now():%Y-%m-%d %H:%M:%S}\n{table}"
+    return table
+
+
+def main(
+    argv: Optional[Sequence[str]] = None,
+    service: Optional[StationDirectoryService] = None,
+    out: Optional[TextIO] = None,
+    sleep: Callable[[float], None] = default_sleep,
+) -> int:
+    """
+    Point d'entrée de la ligne de commande.
+
+    Args:
+        argv: arguments (sys.argv[1:] si None)
+        service: service à utiliser (AppFactory.create_service() si None)
+        out: flux de sortie (sys.stdout si None)
+        sleep: attente entre deux itérations (injectable pour les tests)
+
+    Returns:
+        0 si toutes les stations ont des données, 1 sinon.
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.watch is not None and args.watch <= 0:
+        parser.error("--watch doit être strictement positif")
+    if args.count is not None and args.count < 1:
+        parser.error("--count doit être supérieur ou égal à 1")
+    if not (args.list or args.all or args.stations):
+        parser.error("indiquer au moins une station, --all ou --list")
+
+    out = out or sys.stdout
+    service = service or AppFactory.create_service()
+    try:
+        available = service.get_station_names()
+        if args.list:
+            out.write("".join(f"{name}\n" for name in available))
+            return 0
+
+        unknown = [name for name in args.stations if name not in available]
+        if unknown:
+            parser.error(f"stations inconnues : {', '.join(unknown)}")
+        names = available if args.all else args.stations
+
+        iteration = 0
+        while True:
+            rows = fetch_rows(service, names)
+            out.write(render(rows, args.format, iteration == 0, args.watch is not None))
+            out.flush()
+            iteration += 1
+            if args.watch is None or (
+                args.count is not None and iteration >= args.count
+            ):
+                break
+            sleep(args.watch)
+    except KeyboardInterrupt:
+        return 0
+    finally:
+        service.close()
+
+    return 1 if any(row["error"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
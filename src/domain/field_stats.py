@@ -0,0 +1,53 @@
+"""
+Statistiques descriptives d'une mesure sur un ensemble de points.
+
+Ce value object est produit par les agrégations en masse (min, max,
+moyenne, cumul) et par les cumuls par fenêtre de temps.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+
+@dataclass(frozen=True)
+class FieldStats:
+    """
+    Statistiques d'une mesure (les valeurs manquantes sont ignorées).
+
+    Attributs:
+        count: nombre de valeurs présentes
+        minimum: plus petite valeur (None si count == 0)
+        maximum: plus grande valeur (None si count == 0)
+        total: somme des valeurs (cumul de pluie, calcul de la moyenne)
+    """
+
+    count: int = 0
+    minimum: Optional[float] = None
+    maximum: Optional[float] = None
+    total: float = 0.0
+
+    @property
+    def mean(self) -> Optional[float]:
+        """
+        Retourne la moyenne des valeurs présentes (None si aucune).
+        """
+        return self.total / self.count if self.count else None
+
+    @classmethod
+    def of(cls, values: Iterable[Optional[float]]) -> FieldStats:
+        """
+        Calcule les statistiques d'une suite de valeurs.
+
+        Args:
+            values: valeurs (None ou NaN = valeur manquante)
+
+        Returns:
+            FieldStats correspondant.
+        """
+        present = [v for v in values if v is not None and not math.isnan(v)]
+        if not present:
+            return cls()
+        return cls(len(present), min(present), max(present), math.fsum(present))
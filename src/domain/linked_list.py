@@ -1,16 +1,22 @@
 """
-Implémentation d'une liste chaînée simple.
+Implémentation de listes chaînées.
 
-Cette structure de données est utilisée pour stocker l'historique
-des dernières consultations dans l'application météo.
+Ce module contient :
+- une liste chaînée simple (LinkedList)
+- une liste doublement chaînée indexée par clé (IndexedLinkedList), dont
+  les opérations de suppression, de déplacement en tête et de retrait en
+  fin sont en O(1) : c'est la structure d'un historique LRU (stations
+  récentes sans doublon) ou d'un cache LRU
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Generic, Iterator, Optional, TypeVar
+from typing import Generic, Hashable, Iterator, Optional, TypeVar
 
 T = TypeVar("T")
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
 
 
 @dataclass
@@ -129,3 +135,248 @@ class LinkedList(Generic[T]):
             Liste contenant les mêmes éléments.
         """
         return list(iter(self))
+
+
+class _DoubleNode(Generic[K, V]):  # pylint: disable=too-few-public-methods
+    """
+    Maillon de la liste doublement chaînée.
+    """
+
+    __slots__ = ("key", "value", "prev", "next")
+
+    def __init__(self, key: K, value: V) -> None:
+        self.key = key
+        self.value = value
+        self.prev: Optional[_DoubleNode[K, V]] = None
+        self.next: Optional[_DoubleNode[K, V]] = None
+
+
+class IndexedLinkedList(Generic[K, V]):
+    """
+    Liste doublement chaînée dont chaque maillon est indexé par une clé.
+
+    Fonctionnalités (toutes en O(1)) :
+    - ajout ou remplacement en tête (push_front) et en fin (append)
+    - test d'appartenance et accès par clé (in, get)
+    - suppression d'une clé (remove)
+    - déplacement en tête (move_to_front)
+    - retrait en tête (pop_left) et en fin (pop_right)
+
+    Une clé n'apparaît qu'une fois : la réinsérer remplace sa valeur et la
+    déplace. Le parcours se fait de la tête vers la fin.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialise une liste vide.
+        """
+        self._head: Optional[_DoubleNode[K, V]] = None
+        self._tail: Optional[_DoubleNode[K, V]] = None
+        self._index: dict[K, _DoubleNode[K, V]] = {}
+
+    def __len__(self) -> int:
+        """
+        Retourne le nombre d'éléments dans la liste.
+        """
+        return len(self._index)
+
+    def __contains__(self, key: object) -> bool:
+        """
+        Indique si une clé est présente.
+        """
+        return key in self._index
+
+    def is_empty(self) -> bool:
+        """
+        Indique si la liste est vide.
+
+        Returns:
+            True si la liste est vide, False sinon.
+        """
+        return not self._index
+
+    def get(self, key: K) -> Optional[V]:
+        """
+        Retourne la valeur associée à une clé, sans modifier l'ordre.
+
+        Args:
+            key: clé recherchée
+
+        Returns:
+            La valeur ou None si la clé est absente.
+        """
+        node = self._index.get(key)
+        return node.value if node is not None else None
+
+    def push_front(self, key: K, value: V) -> None:
+        """
+        Ajoute un élément en tête (ou le remplace et le déplace en tête).
+
+        Args:
+            key: clé de l'élément
+            value: valeur associée
+        """
+        node = self._index.get(key)
+        if node is None:
+            node = _DoubleNode(key, value)
+            self._index[key] = node
+        else:
+            node.value = value
+            self._unlink(node)
+        self._link_front(node)
+
+    def append(self, key: K, value: V) -> None:
+        """
+        Ajoute un élément en fin (ou le remplace et le déplace en fin).
+
+        Args:
+            key: clé de l'élément
+            value: valeur associée
+        """
+        node = self._index.get(key)
+        if node is None:
+            node = _DoubleNode(key, value)
+            self._index[key] = node
+        else:
+            node.value = value
+            self._unlink(node)
+
+        node.prev = self._tail
+        if self._tail is None:
+            self._head = node
+        else:
+            self._tail.next = node
+        self._tail = node
+
+    def move_to_front(self, key: K) -> bool:
+        """
+        Déplace un élément existant en tête de liste.
+
+        Args:
+            key: clé de l'élément
+
+        Returns:
+            True si la clé était présente, False sinon.
+        """
+        node = self._index.get(key)
+        if node is None:
+            return False
+        if node is not self._head:
+            self._unlink(node)
+            self._link_front(node)
+        return True
+
+    def remove(self, key: K) -> Optional[V]:
+        """
+        Supprime un élément.
+
+        Args:
+            key: clé de l'élément
+
+        Returns:
+            La valeur supprimée ou None si la clé est absente.
+        """
+        node = self._index.pop(key, None)
+        if node is None:
+            return None
+        self._unlink(node)
+        return node.value
+
+    def pop_left(self) -> Optional[tuple[K, V]]:
+        """
+        Retire et retourne l'élément en tête de liste.
+
+        Returns:
+            Tuple (clé, valeur) ou None si la liste est vide.
+        """
+        if self._head is None:
+            return None
+        node = self._head
+        self.remove(node.key)
+        return node.key, node.value
+
+    def pop_right(self) -> Optional[tuple[K, V]]:
+        """
+        Retire et retourne l'élément en fin de liste (le moins récent
+        pour un usage LRU).
+
+        Returns:
+            Tuple (clé, valeur) ou None si la liste est vide.
+        """
+        if self._tail is None:
+            return None
+        node = self._tail
+        self.remove(node.key)
+        return node.key, node.value
+
+    def clear(self) -> None:
+        """
+        Vide la liste.
+        """
+        self._head = None
+        self._tail = None
+        self._index.clear()
+
+    def keys(self) -> list[K]:
+        """
+        Retourne les clés, de la tête vers la fin.
+        """
+        return [key for key, _ in self.items()]
+
+    def items(self) -> Iterator[tuple[K, V]]:
+        """
+        Parcourt les couples (clé, valeur), de la tête vers la fin.
+
+        Yields:
+            Les couples (clé, valeur) stockés dans la liste.
+        """
+        current = self._head
+        while current is not None:
+            yield current.key, current.value
+            current = current.next
+
+    def __iter__(self) -> Iterator[V]:
+        """
+        Permet d'itérer sur les valeurs, de la tête vers la fin.
+
+        Yields:
+            Les valeurs stockées dans la liste, dans l'ordre.
+        """
+        for _, value in self.items():
+            yield value
+
+    def to_list(self) -> list[V]:
+        """
+        Convertit la liste en liste Python (valeurs, dans l'ordre).
+
+        Returns:
+            Liste contenant les mêmes valeurs.
+        """
+        return list(iter(self))
+
+    def _link_front(self, node: _DoubleNode[K, V]) -> None:
+        """
+        Insère un maillon détaché en tête de liste.
+        """
+        node.prev = None
+        node.next = self._head
+        if self._head is None:
+            self._tail = node
+        else:
+            self._head.prev = node
+        self._head = node
+
+    def _unlink(self, node: _DoubleNode[K, V]) -> None:
+        """
+        Détache un maillon de ses voisins (l'index n'est pas modifié).
+        """
+        if node.prev is None:
+            self._head = node.next
+        else:
+            node.prev.next = node.next
+        if node.next is None:
+            self._tail = node.prev
+        else:
+            node.next.prev = node.prev
+        node.prev = None
+        node.next = None
@@ -0,0 +1,322 @@
+"""
+Cache mémoire borné avec expiration (TTL) et éviction LRU.
+
+Cette structure de données remplace un simple dictionnaire lorsque le
+nombre de clés n'est pas borné : elle limite le nombre d'entrées et
+l'empreinte mémoire estimée, supprime périodiquement les entrées expirées
+et expose des compteurs (hits, misses, évictions) pour le suivi.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections import OrderedDict
+from threading import RLock
+from time import time
+from typing import Any, Callable, Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+def deep_sizeof(obj: Any, _seen: Optional[set[int]] = None) -> int:
+    """
+    Estime l'empreinte mémoire d'un objet et de ses attributs.
+
+    Parcourt récursivement les conteneurs usuels (dict, list, tuple, set)
+    ainsi que les attributs d'instance (__dict__ ou __slots__). Les objets
+    partagés ne sont comptés qu'une fois.
+
+    Args:
+        obj: objet à mesurer
+
+    Returns:
+        Taille estimée en octets.
+    """
+    seen = _seen if _seen is not None else set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(k, seen) + deep_sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    else:
+        if hasattr(obj, "__dict__"):
+            size += deep_sizeof(vars(obj), seen)
+        for slot in getattr(type(obj), "__slots__", ()):
+            if hasattr(obj, slot):
+                size += deep_sizeof(getattr(obj, slot), seen)
+    return size
+
+
+class _Entry:  # pylint: disable=too-few-public-methods
+    """
+    Entrée interne du cache.
+    """
+
+    __slots__ = ("value", "expires_at", "last_access", "size")
+
+    def __init__(self, value, expires_at: float, last_access: float, size: int):
+        self.value = value
+        self.expires_at = expires_at
+        self.last_access = last_access
+        self.size = size
+
+
+class LruTtlCache(Generic[K, V]):  # pylint: disable=too-many-instance-attributes
+    """
+    Cache thread-safe borné en nombre d'entrées et en octets.
+
+    Fonctionnalités :
+    - expiration par entrée (TTL) avec fenêtre "stale" optionnelle
+    - éviction de l'entrée la moins récemment utilisée (LRU)
+    - balayage périodique des entrées expirées
+    - compteurs hits / stale_hits / misses / évictions / expirations
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        stale_ttl_seconds: float = 0.0,
+        sweep_interval_seconds: float = 30.0,
+        sizeof: Callable[[Any], int] = deep_sizeof,
+        clock: Callable[[], float] = time,
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """
+        Initialise un cache vide.
+
+        Args:
+            ttl_seconds: durée de validité par défaut d'une entrée
+            max_entries: nombre maximal d'entrées (None = illimité)
+            max_bytes: empreinte mémoire maximale estimée (None = illimitée)
+            stale_ttl_seconds: durée après expiration pendant laquelle une
+                entrée reste disponible via lookup() (valeur périmée)
+            sweep_interval_seconds: intervalle minimal entre deux balayages
+            sizeof: fonction d'estimation de la taille d'une valeur
+                (appelée uniquement si max_bytes est défini)
+            clock: horloge (secondes), injectable pour les tests
+        """
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._stale_ttl_seconds = stale_ttl_seconds
+        self._sweep_interval_seconds = sweep_interval_seconds
+        self._sizeof = sizeof
+        self._clock = clock
+
+        self._lock = RLock()
+        self._entries: OrderedDict[K, _Entry] = OrderedDict()
+        self._bytes = 0
+        self._next_sweep = clock() + sweep_interval_seconds
+        self._counters = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+        }
+
+    def __len__(self) -> int:
+        """
+        Retourne le nombre d'entrées présentes (expirées ou non).
+        """
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        """
+        Indique si une entrée fraîche existe pour la clé.
+        """
+        return self.peek(key) is not None  # type: ignore[arg-type]
+
+    def get(self, key: K) -> Optional[V]:
+        """
+        Retourne la valeur associée à la clé si elle n'est pas expirée.
+
+        Args:
+            key: clé recherchée
+
+        Returns:
+            Valeur fraîche ou None.
+        """
+        value, stale = self.lookup(key)
+        return None if stale else value
+
+    def lookup(self, key: K) -> tuple[Optional[V], bool]:
+        """
+        Recherche une valeur, éventuellement périmée (fenêtre stale).
+
+        Args:
+            key: clé recherchée
+
+        Returns:
+            Tuple (valeur ou None, True si la valeur est périmée).
+        """
+        with self._lock:
+            now = self._clock()
+            self._maybe_sweep(now)
+
+            entry = self._entries.get(key)
+            if entry is None:
+                self._counters["misses"] += 1
+                return None, False
+
+            if now > entry.expires_at + self._stale_ttl_seconds:
+                self._remove(key)
+                self._counters["expirations"] += 1
+                self._counters["misses"] += 1
+                return None, False
+
+            entry.last_access = now
+            self._entries.move_to_end(key)
+            stale = now > entry.expires_at
+            self._counters["stale_hits" if stale else "hits"] += 1
+            return entry.value, stale
+
+    def peek(self, key: K) -> Optional[V]:
+        """
+        Retourne la valeur fraîche sans modifier l'ordre LRU ni les compteurs.
+
+        Args:
+            key: clé recherchée
+
+        Returns:
+            Valeur fraîche ou None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or self._clock() > entry.expires_at:
+                return None
+            return entry.value
+
+    def set(self, key: K, value: V, ttl_seconds: Optional[float] = None) -> None:
+        """
+        Ajoute ou remplace une entrée puis applique les limites du cache.
+
+        Args:
+            key: clé de l'entrée
+            value: valeur à stocker
+            ttl_seconds: durée de validité (défaut du cache si None)
+        """
+        ttl = self._ttl_seconds if ttl_seconds is None else ttl_seconds
+        size = self._sizeof(value) if self._max_bytes is not None else 0
+
+        with self._lock:
+            now = self._clock()
+            previous = self._entries.get(key)
+            last_access = previous.last_access if previous is not None else now
+            if previous is not None:
+                self._remove(key)
+
+            self._entries[key] = _Entry(value, now + ttl, last_access, size)
+            self._bytes += size
+
+            self._maybe_sweep(now)
+            self._enforce_limits()
+
+    def pop(self, key: K) -> Optional[V]:
+        """
+        Supprime une entrée et retourne sa valeur.
+
+        Args:
+            key: clé à supprimer
+
+        Returns:
+            Valeur supprimée ou None si absente.
+        """
+        with self._lock:
+            entry = self._remove(key)
+            return entry.value if entry is not None else None
+
+    def clear(self) -> None:
+        """
+        Vide le cache (les compteurs sont conservés).
+        """
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def entries(self) -> list[tuple[K, float, float]]:
+        """
+        Retourne un instantané des entrées présentes.
+
+        Returns:
+            Liste de tuples (clé, expires_at, last_access).
+        """
+        with self._lock:
+            return [
+                (key, entry.expires_at, entry.last_access)
+                for key, entry in self._entries.items()
+            ]
+
+    def sweep(self) -> int:
+        """
+        Supprime toutes les entrées expirées au-delà de la fenêtre stale.
+
+        Returns:
+            Nombre d'entrées supprimées.
+        """
+        with self._lock:
+            now = self._clock()
+            self._next_sweep = now + self._sweep_interval_seconds
+            expired = [
+                key
+                for key, entry in self._entries.items()
+                if now > entry.expires_at + self._stale_ttl_seconds
+            ]
+            for key in expired:
+                self._remove(key)
+            self._counters["expirations"] += len(expired)
+            return len(expired)
+
+    def stats(self) -> dict[str, float]:
+        """
+        Retourne les compteurs d'utilisation du cache.
+
+        Returns:
+            Dictionnaire contenant hits, stale_hits, misses, evictions,
+            expirations, entries, bytes et hit_rate (0.0 à 1.0).
+        """
+        with self._lock:
+            stats: dict[str, float] = dict(self._counters)
+            stats["entries"] = len(self._entries)
+            stats["bytes"] = self._bytes
+
+        lookups = stats["hits"] + stats["stale_hits"] + stats["misses"]
+        stats["hit_rate"] = (
+            (stats["hits"] + stats["stale_hits"]) / lookups if lookups else 0.0
+        )
+        return stats
+
+    def _maybe_sweep(self, now: float) -> None:
+        """
+        Lance un balayage si l'intervalle de balayage est écoulé.
+        """
+        if now >= self._next_sweep:
+            self.sweep()
+
+    def _enforce_limits(self) -> None:
+        """
+        Évince les entrées les moins récemment utilisées tant que les
+        limites sont dépassées.
+        """
+        while self._entries and (
+            (self._max_entries is not None and len(self._entries) > self._max_entries)
+            or (self._max_bytes is not None and self._bytes > self._max_bytes)
+        ):
+            self._remove(next(iter(self._entries)))
+            self._counters["evictions"] += 1
+
+    def _remove(self, key: K) -> Optional[_Entry]:
+        """
+        Supprime une entrée et met à jour l'empreinte mémoire.
+        """
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+        return entry
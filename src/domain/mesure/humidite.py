@@ -5,7 +5,13 @@ Cette classe encapsule une valeur d'humidité relative exprimée en pourcentage.
 Elle est volontairement simple et immuable.
 """
 
+from __future__ import annotations
 
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True, slots=True)
 class Humidite:  # pylint: disable=too-few-public-methods
     """
     Représente une mesure d'humidité relative.
@@ -14,13 +20,10 @@ class Humidite:  # pylint: disable=too-few-public-methods
     - elle ne contient pas de logique métier
     - elle encapsule uniquement une valeur
     - elle est utilisée par le domaine Station
-    """
+    - elle est immuable, hashable et sans __dict__ (__slots__)
 
-    def __init__(self, value):
-        """
-        Initialise une mesure d'humidité.
+    Attributs:
+        value: valeur d'humidité en pourcentage (ou None si non disponible)
+    """
 
-        Args:
-            value: valeur d'humidité en pourcentage (ou None si non disponible)
-        """
-        self.value = value
+    value: Optional[float]
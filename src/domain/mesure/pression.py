@@ -5,7 +5,13 @@ Cette classe encapsule une pression, généralement exprimée en hPa.
 Elle est volontairement simple et utilisée par le modèle Station.
 """
 
+from __future__ import annotations
 
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True, slots=True)
 class Pression:  # pylint: disable=too-few-public-methods
     """
     Représente une mesure de pression atmosphérique.
@@ -13,13 +19,10 @@ class Pression:  # pylint: disable=too-few-public-methods
     Cette classe est un value object :
     - elle encapsule uniquement une valeur
     - elle reste volontairement minimale (pas de logique métier complexe)
-    """
+    - elle est immuable, hashable et sans __dict__ (__slots__)
 
-    def __init__(self, value):
-        """
-        Initialise une mesure de pression.
+    Attributs:
+        value: valeur de pression (hPa) ou None si non disponible
+    """
 
-        Args:
-            value: valeur de pression (hPa) ou None si non disponible
-        """
-        self.value = value
+    value: Optional[float]
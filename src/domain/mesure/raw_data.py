@@ -15,13 +15,20 @@ class RawMeteoData:  # pylint: disable=too-few-public-methods
     - elle encapsule uniquement les données reçues de l'API
     - elle ne contient aucune logique métier
     - elle sert de DTO entre l'infrastructure et l'application
+    - elle n'a pas de __dict__ (__slots__) ; son identité sert à détecter
+      des données inchangées, elle reste donc hashable par identité
     """
 
-    def __init__(self, data):
+    __slots__ = ("data", "newest_first")
+
+    def __init__(self, data, newest_first: bool = False):
         """
         Initialise les données météo brutes.
 
         Args:
             data: liste de dictionnaires représentant les enregistrements bruts
+            newest_first: True si les enregistrements sont garantis triés du
+                plus récent au plus ancien (l'agrégation peut s'arrêter tôt)
         """
         self.data = data
+        self.newest_first = newest_first
@@ -5,7 +5,13 @@ Cette classe encapsule une température exprimée en degrés Celsius.
 Elle est volontairement simple et utilisée par le modèle Station.
 """
 
+from __future__ import annotations
 
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True, slots=True)
 class Temperature:  # pylint: disable=too-few-public-methods
     """
     Représente une mesure de température.
@@ -14,13 +20,10 @@ class Temperature:  # pylint: disable=too-few-public-methods
     - elle encapsule uniquement une valeur
     - elle ne contient pas de logique métier
     - elle est utilisée dans le domaine Station
-    """
+    - elle est immuable, hashable et sans __dict__ (__slots__)
 
-    def __init__(self, value):
-        """
-        Initialise une mesure de température.
+    Attributs:
+        value: température en degrés Celsius (ou None si non disponible)
+    """
 
-        Args:
-            value: température en degrés Celsius (ou None si non disponible)
-        """
-        self.value = value
+    value: Optional[float]
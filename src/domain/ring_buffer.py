@@ -0,0 +1,126 @@
+"""
+Implémentation d'un tampon circulaire de capacité fixe.
+
+Cette structure de données est utilisée pour stocker l'historique
+des dernières consultations dans l'application météo : l'ajout est en
+O(1) et, une fois la capacité atteinte, l'élément le plus ancien est
+remplacé sans recopie ni allocation.
+"""
+
+from __future__ import annotations
+
+from typing import Generic, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class RingBuffer(Generic[T]):
+    """
+    Tampon circulaire borné.
+
+    Fonctionnalités :
+    - ajout (push) en O(1), avec éviction automatique du plus ancien
+    - parcours du plus récent au plus ancien
+    - accès au plus récent (newest)
+
+    Les éléments sont rangés dans une liste pré-allouée (pas de maillons) ;
+    l'instance elle-même n'a pas de __dict__ (__slots__).
+    """
+
+    __slots__ = ("_items", "_next", "_size")
+
+    def __init__(self, capacity: int) -> None:
+        """
+        Initialise un tampon vide.
+
+        Args:
+            capacity: nombre maximal d'éléments conservés (>= 1)
+
+        Raises:
+            ValueError: si la capacité est inférieure à 1
+        """
+        if capacity < 1:
+            raise ValueError("La capacité doit être supérieure ou égale à 1")
+        self._items: list[Optional[T]] = [None] * capacity
+        self._next = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        """
+        Retourne le nombre d'éléments présents.
+        """
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        """
+        Retourne la capacité du tampon.
+        """
+        return len(self._items)
+
+    def is_empty(self) -> bool:
+        """
+        Indique si le tampon est vide.
+
+        Returns:
+            True si le tampon est vide, False sinon.
+        """
+        return self._size == 0
+
+    def push(self, value: T) -> Optional[T]:
+        """
+        Ajoute un élément (le plus récent).
+
+        Args:
+            value: valeur à ajouter
+
+        Returns:
+            L'élément évincé si le tampon était plein, sinon None.
+        """
+        evicted = self._items[self._next] if self._size == self.capacity else None
+        self._items[self._next] = value
+        self._next = (self._next + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+        return evicted
+
+    def newest(self) -> Optional[T]:
+        """
+        Retourne l'élément le plus récent sans le retirer.
+
+        Returns:
+            La valeur la plus récente ou None si le tampon est vide.
+        """
+        if self._size == 0:
+            return None
+        return self._items[self._next - 1]
+
+    def clear(self) -> None:
+        """
+        Vide le tampon (la capacité est conservée).
+        """
+        self._items = [None] * self.capacity
+        self._next = 0
+        self._size = 0
+
+    def __iter__(self) -> Iterator[T]:
+        """
+        Permet d'itérer du plus récent au plus ancien.
+
+        Yields:
+            Les valeurs stockées, du plus récent au plus ancien.
+        """
+        items = self._items
+        index = self._next
+        for _ in range(self._size):
+            index -= 1
+            yield items[index]  # type: ignore[misc]
+
+    def to_list(self) -> list[T]:
+        """
+        Convertit le tampon en liste Python (du plus récent au plus ancien).
+
+        Returns:
+            Liste contenant les mêmes éléments.
+        """
+        return list(iter(self))
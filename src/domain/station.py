@@ -15,7 +15,7 @@ from dataclasses import dataclass
 from typing import Optional, Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Station:  # pylint: disable=too-few-public-methods
     """
     Représente la dernière lecture météo connue d'une station.
@@ -32,6 +32,8 @@ class Station:  # pylint: disable=too-few-public-methods
 
     Note:
         Certains champs peuvent être absents selon la station et les capteurs.
+        Les instances sont immuables, hashables et sans __dict__ (__slots__) :
+        un long historique de lectures reste compact en mémoire.
     """
 
     name: str
@@ -2,14 +2,17 @@
 Client HTTP chargé de récupérer les données météo depuis l'API distante.
 
 Ce module encapsule l'appel réseau afin d'isoler l'infrastructure
-du reste de l'application.
+du reste de l'application. Les requêtes sont conditionnelles (ETag /
+Last-Modified) : une réponse 304 réutilise les données précédentes.
 """
 
 from __future__ import annotations
 
-import requests
+from threading import Lock
+from typing import Optional
 
 from src.domain.mesure.raw_data import RawMeteoData
+from src.infrastructure.http_session import HttpSessionPool
 
 
 class ApiFetcher:  # pylint: disable=too-few-public-methods
@@ -19,42 +22,119 @@ class ApiFetcher:  # pylint: disable=too-few-public-methods
     Cette classe est volontairement simple :
     - une responsabilité unique (appel API)
     - aucune logique métier
+
+    Le fetcher mémorise les validateurs HTTP (ETag, Last-Modified) de la
+    dernière réponse de son endpoint ; si le serveur répond 304 Not
+    Modified, le même objet RawMeteoData que précédemment est retourné
+    (sans téléchargement ni décodage JSON du corps). Les autres URLs
+    (variantes incrémentales) sont demandées sans condition : un validateur
+    ne vaut que pour la ressource exacte qui l'a fourni.
     """
 
-    def __init__(self, endpoint: str, timeout_seconds: int = 10):
+    def __init__(
+        self,
+        endpoint: str,
+        timeout_seconds: int = 10,
+        session: Optional[HttpSessionPool] = None,
+    ):
         """
         Initialise le fetcher HTTP.
 
         Args:
             endpoint: URL de l'API à interroger
             timeout_seconds: délai maximal de la requête HTTP
+            session: pool de connexions partagé (keep-alive). Si None,
+                une connexion ponctuelle est ouverte à chaque appel.
         """
         self._endpoint = endpoint
         self._timeout = timeout_seconds
+        self._session = session
+
+        self._lock = Lock()
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        self._last_data: Optional[RawMeteoData] = None
 
-    def fetch(self) -> RawMeteoData:
+    def fetch(self, url: Optional[str] = None) -> RawMeteoData:
         """
         Exécute l'appel HTTP et retourne les données brutes.
 
+        Args:
+            url: URL à interroger (endpoint du fetcher si None) ; une
+                autre URL est demandée sans en-têtes conditionnels et ne
+                modifie ni les validateurs ni les données mémorisées
+
         Returns:
-            RawMeteoData: données météo brutes issues de l'API
+            RawMeteoData: données météo brutes issues de l'API (le même
+            objet que l'appel précédent si les données n'ont pas changé)
 
         Raises:
             requests.RequestException: en cas d'erreur réseau ou HTTP
         """
-        response = requests.get(self._endpoint, timeout=self._timeout)
+        conditional = url is None or url == self._endpoint
+        url = url or self._endpoint
+        previous = None
+        headers = None
+        if conditional:
+            with self._lock:
+                previous = self._last_data
+                headers = self._conditional_headers() if previous is not None else None
+
+        if self._session is not None:
+            response = self._session.get(url, timeout=self._timeout, headers=headers)
+        else:
+            import requests  # pylint: disable=import-outside-toplevel
+
+            response = requests.get(url, timeout=self._timeout, headers=headers)
+
+        if response.status_code == 304 and previous is not None:
+            return previous
+
         response.raise_for_status()
+        data = parse_payload(response.json())
+        if not conditional:
+            return data
+
+        with self._lock:
+            self._etag = response.headers.get("ETag")
+            self._last_modified = response.headers.get("Last-Modified")
+            self._last_data = data
+        return data
+
+    def _conditional_headers(self) -> Optional[dict[str, str]]:
+        """
+        Construit les en-têtes de requête conditionnelle.
+
+        Returns:
+            En-têtes If-None-Match / If-Modified-Since, ou None si aucun
+            validateur n'est connu.
+        """
+        headers = {}
+        if self._etag:
+            headers["If-None-Match"] = self._etag
+        if self._last_modified:
+            headers["If-Modified-Since"] = self._last_modified
+        return headers or None
 
-        payload = response.json()
 
-        # API Toulouse Explore v2.1 : données dans "results"
-        results = payload.get("results")
-        if isinstance(results, list):
-            return RawMeteoData(results)
+def parse_payload(payload: dict) -> RawMeteoData:
+    """
+    Convertit la réponse JSON de l'API en données brutes.
+
+    Args:
+        payload: corps JSON décodé de la réponse
+
+    Returns:
+        RawMeteoData: enregistrements extraits (liste vide si format inconnu)
+    """
+    # API Toulouse Explore v2.1 : données dans "results"
+    results = payload.get("results")
+    if isinstance(results, list):
+        return RawMeteoData(results)
 
-        # Fallback si structure différente
-        data = payload.get("data")
-        if isinstance(data, list):
-            return RawMeteoData(data)
+    # Fallback si structure différente
+    data = payload.get("data")
+    if isinstance(data, list):
+        return RawMeteoData(data)
 
-        return RawMeteoData([])
+    return RawMeteoData([])
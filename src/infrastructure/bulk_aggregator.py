@@ -0,0 +1,328 @@
+"""
+Agrégation en masse d'enregistrements météo (rattrapages, analyses).
+
+Un lot RawMeteoData est converti en un seul parcours en colonnes typées
+(NaN pour les valeurs manquantes). Les calculs portent ensuite sur les
+colonnes entières :
+- dernière valeur non nulle par champ (même règle que reading_aggregator)
+- min / max / moyenne par champ
+- cumuls par fenêtre de temps (heure, jour, ...)
+
+NumPy est utilisé s'il est installé (calculs vectorisés) ; sinon, les
+mêmes résultats sont calculés en Python pur sur des array('d').
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from src.domain.field_stats import FieldStats
+from src.infrastructure.record_extractor import (
+    FIELD_SPECS,
+    PRESSURE_KEYS,
+    RecordSchema,
+    build_generic_extractors,
+    to_float,
+    utc_timestamp,
+)
+
+try:
+    import numpy as np  # pylint: disable=import-error
+except ImportError:  # NumPy est optionnel : repli en Python pur
+    np = None  # pylint: disable=invalid-name
+
+HAS_NUMPY = np is not None
+
+# Pression extraite sans conversion : Pa -> hPa est appliqué sur la colonne.
+BULK_SPECS = {**FIELD_SPECS, "pressure_hpa": (to_float, (PRESSURE_KEYS,))}
+BULK_EXTRACTORS = build_generic_extractors(BULK_SPECS)
+
+COLUMN_NAMES = tuple(name for name, _ in BULK_EXTRACTORS.fields)
+
+NAN = float("nan")
+
+
+@dataclass(frozen=True)
+class RecordColumns:
+    """
+    Lot d'enregistrements sous forme de colonnes, dans l'ordre du lot.
+
+    Attributs:
+        timestamps: horodatages POSIX (secondes ; NaN si absent), un
+            horodatage naïf étant considéré comme UTC
+        columns: colonne de valeurs par champ (NaN = valeur manquante)
+        vectorized: True si les colonnes sont des tableaux NumPy,
+            False si ce sont des array('d')
+        naive: True si les horodatages du lot sont naïfs (sans fuseau) :
+            latest_values les restitue alors naïfs, comme
+            aggregate_latest_values
+    """
+
+    timestamps: Any
+    columns: dict[str, Any]
+    vectorized: bool
+    naive: bool = False
+
+    def __len__(self) -> int:
+        """
+        Retourne le nombre d'enregistrements du lot.
+        """
+        return len(self.timestamps)
+
+
+def to_columns(raw_data, use_numpy: Optional[bool] = None) -> RecordColumns:
+    """
+    Convertit un lot d'enregistrements bruts en colonnes typées.
+
+    Args:
+        raw_data: objet contenant les enregistrements bruts (attribut .data)
+        use_numpy: force (True) ou désactive (False) NumPy ; par défaut,
+            NumPy est utilisé s'il est installé
+
+    Returns:
+        RecordColumns du lot.
+
+    Raises:
+        RuntimeError: si use_numpy est True et que NumPy n'est pas installé
+    """
+    vectorized = HAS_NUMPY if use_numpy is None else use_numpy
+    if vectorized and not HAS_NUMPY:
+        raise RuntimeError("NumPy n'est pas installé")
+
+    stamps, values, naive = _extract(list(getattr(raw_data, "data", None) or []))
+
+    if vectorized:
+        columns = {name: np.array(column, dtype=float) for name, column in values.items()}
+        pressure = columns["pressure_hpa"]
+        columns["pressure_hpa"] = np.where(pressure > 2000, pressure / 100.0, pressure)
+        return RecordColumns(np.array(stamps, dtype=float), columns, True, naive)
+
+    columns = {name: array("d", column) for name, column in values.items()}
+    pressure = columns["pressure_hpa"]
+    for index, value in enumerate(pressure):
+        if value > 2000:
+            pressure[index] = value / 100.0
+    return RecordColumns(array("d", stamps), columns, False, naive)
+
+
+def _extract(
+    records: list[dict],
+) -> tuple[list[float], dict[str, list[float]], bool]:
+    """
+    Parcourt une fois les enregistrements et extrait chaque champ.
+
+    Args:
+        records: enregistrements bruts
+
+    Returns:
+        Tuple (horodatages POSIX, valeurs par champ, horodatages naïfs),
+        NaN pour les manques.
+    """
+    schema = RecordSchema.detect(records, BULK_SPECS, BULK_EXTRACTORS)
+
+    stamps: list[float] = []
+    values: dict[str, list[float]] = {name: [] for name in COLUMN_NAMES}
+    targets = tuple(values.values())
+    naive = False
+    for record in records:
+        extractors = (
+            schema.extractors_for(record) if schema is not None else BULK_EXTRACTORS
+        )
+        stamp = extractors.timestamp(record)
+        if stamp is None:
+            stamps.append(NAN)
+        else:
+            naive = stamp.tzinfo is None
+            stamps.append(utc_timestamp(stamp))
+        for target, (_, extract) in zip(targets, extractors.fields):
+            value = extract(record)
+            target.append(NAN if value is None else value)
+    return stamps, values, naive
+
+
+def latest_values(columns: RecordColumns) -> dict:
+    """
+    Retourne, pour chaque champ, la valeur de l'enregistrement le plus
+    récent qui en fournit une (mêmes règles que aggregate_latest_values :
+    non datés en dernier, premier enregistrement retenu à égalité).
+
+    Args:
+        columns: lot converti par to_columns
+
+    Returns:
+        Dictionnaire timestamp (datetime UTC, naïf si le lot l'est, ou
+        None) + valeurs par champ.
+    """
+    if columns.vectorized:
+        return _latest_values_numpy(columns)
+
+    timestamps = columns.timestamps
+    dated = [ts for ts in timestamps if not math.isnan(ts)]
+    result: dict[str, Any] = {
+        "timestamp": _to_datetime(max(dated), columns.naive) if dated else None
+    }
+
+    order = [-math.inf if math.isnan(ts) else ts for ts in timestamps]
+    for name, column in columns.columns.items():
+        best = None
+        for index, value in enumerate(column):
+            if not math.isnan(value) and (best is None or order[index] > order[best]):
+                best = index
+        result[name] = column[best] if best is not None else None
+    return result
+
+
+def summarize(columns: RecordColumns) -> dict[str, FieldStats]:
+    """
+    Calcule min / max / moyenne / somme de chaque champ sur tout le lot.
+
+    Args:
+        columns: lot converti par to_columns
+
+    Returns:
+        Dictionnaire champ -> FieldStats.
+    """
+    if not columns.vectorized:
+        return {name: FieldStats.of(column) for name, column in columns.columns.items()}
+
+    stats = {}
+    for name, column in columns.columns.items():
+        present = column[~np.isnan(column)]
+        stats[name] = (
+            FieldStats(
+                int(present.size),
+                float(present.min()),
+                float(present.max()),
+                float(present.sum()),
+            )
+            if present.size
+            else FieldStats()
+        )
+    return stats
+
+
+def bucket_rollups(
+    columns: RecordColumns, bucket_seconds: float
+) -> list[tuple[datetime, dict[str, FieldStats]]]:
+    """
+    Calcule les statistiques de chaque champ par fenêtre de temps.
+
+    Les fenêtres sont alignées sur l'époque POSIX (UTC) : 3600 donne des
+    heures pleines, 86400 des jours UTC. Les enregistrements non datés
+    sont ignorés.
+
+    Args:
+        columns: lot converti par to_columns
+        bucket_seconds: durée d'une fenêtre en secondes
+
+    Returns:
+        Liste (début de fenêtre UTC, champ -> FieldStats), par ordre
+        chronologique.
+    """
+    if columns.vectorized:
+        return _bucket_rollups_numpy(columns, bucket_seconds)
+
+    buckets: dict[float, list[int]] = {}
+    for index, ts in enumerate(columns.timestamps):
+        if not math.isnan(ts):
+            start = math.floor(ts / bucket_seconds) * bucket_seconds
+            buckets.setdefault(start, []).append(index)
+
+    return [
+        (
+            _to_datetime(start),
+            {
+                name: FieldStats.of(column[index] for index in buckets[start])
+                for name, column in columns.columns.items()
+            },
+        )
+        for start in sorted(buckets)
+    ]
+
+
+def _latest_values_numpy(columns: RecordColumns) -> dict:
+    """
+    Version vectorisée de latest_values.
+    """
+    timestamps = columns.timestamps
+    undated = np.isnan(timestamps)
+    result: dict[str, Any] = {
+        "timestamp": (
+            None
+            if undated.all()
+            else _to_datetime(timestamps[~undated].max(), columns.naive)
+        )
+    }
+
+    order = np.where(undated, -np.inf, timestamps)
+    for name, column in columns.columns.items():
+        present = np.flatnonzero(~np.isnan(column))
+        if present.size == 0:
+            result[name] = None
+            continue
+        # argmax retourne la première occurrence du maximum
+        result[name] = float(column[present[np.argmax(order[present])]])
+    return result
+
+
+def _bucket_rollups_numpy(
+    columns: RecordColumns, bucket_seconds: float
+) -> list[tuple[datetime, dict[str, FieldStats]]]:
+    """
+    Version vectorisée de bucket_rollups (réductions par segment).
+    """
+    dated = ~np.isnan(columns.timestamps)
+    starts = np.floor(columns.timestamps[dated] / bucket_seconds) * bucket_seconds
+    if starts.size == 0:
+        return []
+
+    order = np.argsort(starts, kind="stable")
+    keys, first = np.unique(starts[order], return_index=True)
+
+    per_field = {
+        name: _segment_stats(column[dated][order], first)
+        for name, column in columns.columns.items()
+    }
+    return [
+        (
+            _to_datetime(float(start)),
+            {name: stats[position] for name, stats in per_field.items()},
+        )
+        for position, start in enumerate(keys)
+    ]
+
+
+def _segment_stats(values, first) -> list[FieldStats]:
+    """
+    Calcule les statistiques de chaque segment contigu d'une colonne.
+
+    Args:
+        values: colonne triée par fenêtre (NaN = valeur manquante)
+        first: indice de début de chaque segment
+
+    Returns:
+        FieldStats par segment.
+    """
+    present = ~np.isnan(values)
+    counts = np.add.reduceat(present.astype(np.int64), first)
+    minima = np.minimum.reduceat(np.where(present, values, np.inf), first)
+    maxima = np.maximum.reduceat(np.where(present, values, -np.inf), first)
+    totals = np.add.reduceat(np.where(present, values, 0.0), first)
+    return [
+        FieldStats(int(count), float(low), float(high), float(total))
+        if count
+        else FieldStats()
+        for count, low, high, total in zip(counts, minima, maxima, totals)
+    ]
+
+
+def _to_datetime(timestamp: float, naive: bool = False) -> datetime:
+    """
+    Convertit un horodatage POSIX en datetime UTC (naïf si demandé).
+    """
+    stamp = datetime.fromtimestamp(float(timestamp), timezone.utc)
+    return stamp.replace(tzinfo=None) if naive else stamp
@@ -0,0 +1,264 @@
+"""
+Stockage colonnaire en mémoire des séries temporelles par station.
+
+Les enregistrements bruts reçus de l'API (listes de dictionnaires) sont
+convertis une seule fois en colonnes typées (array de flottants) : une
+colonne d'horodatages triée et une colonne par mesure, les valeurs
+manquantes étant représentées par NaN. Les requêtes d'historique (et les
+graphiques) lisent ensuite des tranches de colonnes, sans nouvel appel
+API ni nouveau parcours des dictionnaires.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from threading import Lock
+from typing import Iterable, Optional
+
+from src.domain.mesure.raw_data import RawMeteoData
+from src.infrastructure.record_extractor import (
+    GENERIC_EXTRACTORS,
+    RecordSchema,
+    utc_timestamp,
+)
+
+# Colonnes de mesures, dans l'ordre des extracteurs
+SERIES_COLUMNS = tuple(name for name, _ in GENERIC_EXTRACTORS.fields)
+
+NAN = float("nan")
+
+
+@dataclass(frozen=True)
+class SeriesSlice:
+    """
+    Tranche de série temporelle d'une station (copie des colonnes).
+
+    Attributs:
+        timestamps: horodatages POSIX (secondes, UTC), croissants
+        columns: colonne de valeurs par mesure (NaN = valeur manquante)
+    """
+
+    timestamps: array = field(default_factory=lambda: array("d"))
+    columns: dict[str, array] = field(
+        default_factory=lambda: {name: array("d") for name in SERIES_COLUMNS}
+    )
+
+    def __len__(self) -> int:
+        """
+        Retourne le nombre de points de la tranche.
+        """
+        return len(self.timestamps)
+
+    def datetimes(self) -> list[datetime]:
+        """
+        Retourne les horodatages sous forme de datetime UTC.
+        """
+        return [datetime.fromtimestamp(ts, timezone.utc) for ts in self.timestamps]
+
+    def values(self, name: str) -> list[Optional[float]]:
+        """
+        Retourne une colonne sous forme de liste (None pour NaN).
+
+        Args:
+            name: nom de la mesure (ex: "temperature_c")
+
+        Returns:
+            Valeurs de la colonne, dans l'ordre chronologique.
+        """
+        return [None if math.isnan(value) else value for value in self.columns[name]]
+
+
+class _StationColumns:  # pylint: disable=too-few-public-methods
+    """
+    Colonnes internes d'une station.
+    """
+
+    __slots__ = ("timestamps", "columns")
+
+    def __init__(self) -> None:
+        self.timestamps = array("d")
+        self.columns = {name: array("d") for name in SERIES_COLUMNS}
+
+
+def records_to_rows(records: Iterable[dict]) -> list[tuple[float, tuple[float, ...]]]:
+    """
+    Convertit des enregistrements bruts en lignes (horodatage, mesures).
+
+    Les enregistrements sans horodatage sont ignorés ; pour un même
+    horodatage, le premier enregistrement rencontré est conservé.
+
+    Args:
+        records: enregistrements bruts
+
+    Returns:
+        Lignes triées par horodatage POSIX croissant ; les mesures suivent
+        l'ordre de SERIES_COLUMNS (NaN = valeur manquante).
+    """
+    records = list(records)
+    schema = RecordSchema.detect(records)
+
+    rows: dict[float, tuple[float, ...]] = {}
+    for record in records:
+        extractors = (
+            schema.extractors_for(record) if schema is not None else GENERIC_EXTRACTORS
+        )
+        stamp = extractors.timestamp(record)
+        if stamp is None:
+            continue
+        key = utc_timestamp(stamp)
+        if key in rows:
+            continue
+        rows[key] = tuple(
+            NAN if value is None else value
+            for value in (extract(record) for _, extract in extractors.fields)
+        )
+    return sorted(rows.items())
+
+
+class ColumnarStationStore:
+    """
+    Séries temporelles colonnaires par station.
+
+    Responsabilités :
+    - ingérer des lots RawMeteoData (dédupliqués par horodatage)
+    - conserver les colonnes triées (ajout en fin dans le cas courant)
+    - fournir des tranches par intervalle de temps (recherche dichotomique)
+    """
+
+    def __init__(self, max_points_per_station: Optional[int] = None):
+        """
+        Initialise un stockage vide.
+
+        Args:
+            max_points_per_station: nombre maximal de points conservés par
+                station ; les plus anciens sont supprimés au-delà
+                (None = illimité)
+        """
+        self._max_points = max_points_per_station
+        self._lock = Lock()
+        self._series: dict[str, _StationColumns] = {}
+
+    def stations(self) -> list[str]:
+        """
+        Retourne les stations ayant au moins un point.
+        """
+        with self._lock:
+            return [name for name, series in self._series.items() if series.timestamps]
+
+    def count(self, station_name: str) -> int:
+        """
+        Retourne le nombre de points conservés pour une station.
+        """
+        with self._lock:
+            series = self._series.get(station_name)
+            return len(series.timestamps) if series is not None else 0
+
+    def ingest(self, station_name: str, raw_data: RawMeteoData) -> int:
+        """
+        Ajoute un lot d'enregistrements bruts à la série d'une station.
+
+        Les horodatages déjà connus sont ignorés.
+
+        Args:
+            station_name: nom de la station
+            raw_data: données brutes (attribut .data)
+
+        Returns:
+            Nombre de points réellement ajoutés.
+        """
+        rows = records_to_rows(getattr(raw_data, "data", None) or [])
+        if not rows:
+            return 0
+
+        with self._lock:
+            series = self._series.setdefault(station_name, _StationColumns())
+            timestamps = series.timestamps
+            new_rows = [row for row in rows if not _contains(timestamps, row[0])]
+            if not new_rows:
+                return 0
+
+            if not timestamps or new_rows[0][0] > timestamps[-1]:
+                _append_rows(series, new_rows)
+            else:
+                _rebuild(series, new_rows)
+
+            if self._max_points is not None and len(timestamps) > self._max_points:
+                excess = len(timestamps) - self._max_points
+                del timestamps[:excess]
+                for column in series.columns.values():
+                    del column[:excess]
+
+            return len(new_rows)
+
+    def range(
+        self,
+        station_name: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> SeriesSlice:
+        """
+        Retourne les points d'une station dans l'intervalle [start, end[.
+
+        Args:
+            station_name: nom de la station
+            start: début inclus (None = depuis le premier point)
+            end: fin exclue (None = jusqu'au dernier point)
+
+        Returns:
+            SeriesSlice (vide si la station est inconnue).
+        """
+        with self._lock:
+            series = self._series.get(station_name)
+            if series is None:
+                return SeriesSlice()
+
+            timestamps = series.timestamps
+            low = bisect_left(timestamps, utc_timestamp(start)) if start else 0
+            high = (
+                bisect_left(timestamps, utc_timestamp(end)) if end else len(timestamps)
+            )
+            return SeriesSlice(
+                timestamps=timestamps[low:high],
+                columns={
+                    name: column[low:high] for name, column in series.columns.items()
+                },
+            )
+
+
+def _contains(timestamps: array, key: float) -> bool:
+    """
+    Indique si un horodatage est présent dans une colonne triée.
+    """
+    index = bisect_left(timestamps, key)
+    return index < len(timestamps) and timestamps[index] == key
+
+
+def _append_rows(
+    series: _StationColumns, rows: list[tuple[float, tuple[float, ...]]]
+) -> None:
+    """
+    Ajoute en fin de colonnes des lignes plus récentes que le dernier point.
+    """
+    series.timestamps.extend(key for key, _ in rows)
+    for index, column in enumerate(series.columns.values()):
+        column.extend(values[index] for _, values in rows)
+
+
+def _rebuild(series: _StationColumns, rows: list[tuple[float, tuple[float, ...]]]) -> None:
+    """
+    Fusionne des lignes dans les colonnes existantes en conservant le tri.
+    """
+    columns = list(series.columns.values())
+    existing = [
+        (key, tuple(column[index] for column in columns))
+        for index, key in enumerate(series.timestamps)
+    ]
+    merged = sorted(existing + rows, key=lambda row: row[0])
+
+    series.timestamps[:] = array("d", (key for key, _ in merged))
+    for index, column in enumerate(columns):
+        column[:] = array("d", (values[index] for _, values in merged))
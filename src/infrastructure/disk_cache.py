@@ -0,0 +1,235 @@
+"""
+Cache persistant sur disque (fichier JSON).
+
+Ce module conserve entre deux exécutions les données déjà récupérées
+(lectures agrégées, enregistrements bruts) afin qu'un redémarrage ou
+plusieurs processus courts n'interrogent pas l'API inutilement.
+
+Format du fichier (versionné) :
+    {"version": 1, "entries": {clé: {"expires_at": float, "value": ...}}}
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from threading import Lock, Timer
+from time import time
+from typing import Any, Callable, Optional
+
+FORMAT_VERSION = 1
+
+
+class JsonDiskCache:
+    """
+    Cache clé -> valeur JSON persisté dans un fichier.
+
+    Caractéristiques :
+    - chargement paresseux du fichier (une seule lecture au démarrage)
+    - expiration par entrée (TTL)
+    - écritures atomiques (fichier temporaire + os.replace)
+    - écritures différées possibles : les modifications d'une fenêtre de
+      flush_delay_seconds sont regroupées en une seule écriture (flush()
+      ou close() écrivent immédiatement)
+    - fusion avec le contenu du fichier lors de l'écriture, afin que
+      plusieurs processus partageant le fichier ne s'écrasent pas
+    - un fichier d'une autre version (ou illisible) est ignoré
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        ttl_seconds: float = 60,
+        clock: Callable[[], float] = time,
+        flush_delay_seconds: float = 0,
+    ):
+        """
+        Initialise le cache persistant.
+
+        Args:
+            path: chemin du fichier JSON
+            ttl_seconds: durée de validité par défaut d'une entrée
+            clock: horloge (secondes), injectable pour les tests
+            flush_delay_seconds: délai avant l'écriture des modifications
+                (0 = écriture à chaque modification)
+        """
+        self._path = Path(path)
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._flush_delay_seconds = flush_delay_seconds
+        self._lock = Lock()
+        self._entries: Optional[dict[str, dict]] = None
+        # Modifications pas encore écrites et écriture différée programmée
+        self._dirty = False
+        self._timer: Optional[Timer] = None
+
+    def get(self, key: str) -> Any:
+        """
+        Retourne la valeur associée à la clé si elle n'est pas expirée.
+
+        Args:
+            key: clé recherchée
+
+        Returns:
+            Valeur JSON désérialisée, ou None.
+        """
+        entry = self.get_entry(key)
+        return entry[0] if entry is not None else None
+
+    def get_entry(self, key: str) -> Optional[tuple[Any, float]]:
+        """
+        Retourne la valeur et sa date d'expiration si elle n'est pas expirée.
+
+        Args:
+            key: clé recherchée
+
+        Returns:
+            Tuple (valeur, expires_at), ou None.
+        """
+        with self._lock:
+            entry = self._loaded().get(key)
+        if entry is None or self._clock() > entry["expires_at"]:
+            return None
+        return entry["value"], entry["expires_at"]
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """
+        Enregistre une valeur puis écrit le fichier (ou programme l'écriture).
+
+        Args:
+            key: clé de l'entrée
+            value: valeur sérialisable en JSON
+            ttl_seconds: durée de validité (défaut du cache si None)
+        """
+        self.set_many({key: value}, ttl_seconds)
+
+    def set_many(
+        self, items: dict[str, Any], ttl_seconds: Optional[float] = None
+    ) -> None:
+        """
+        Enregistre plusieurs valeurs en une seule écriture du fichier
+        (immédiate, ou différée si flush_delay_seconds > 0).
+
+        Args:
+            items: dictionnaire clé -> valeur sérialisable en JSON
+            ttl_seconds: durée de validité (défaut du cache si None)
+        """
+        ttl = self._ttl_seconds if ttl_seconds is None else ttl_seconds
+        expires_at = self._clock() + ttl
+
+        with self._lock:
+            entries = self._loaded()
+            for key, value in items.items():
+                entries[key] = {"expires_at": expires_at, "value": value}
+            if self._flush_delay_seconds <= 0:
+                self._flush(entries)
+                return
+            self._dirty = True
+            if self._timer is None:
+                self._timer = Timer(self._flush_delay_seconds, self._flush_later)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        """
+        Écrit immédiatement les modifications en attente (sans effet s'il
+        n'y en a pas).
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty:
+                return
+            self._flush(self._loaded())
+            self._dirty = False
+
+    def close(self) -> None:
+        """
+        Écrit les modifications en attente avant l'arrêt.
+        """
+        self.flush()
+
+    def _flush_later(self) -> None:
+        """
+        Écriture différée (thread du Timer) : best-effort, une erreur
+        disque laisse les modifications en attente pour le prochain flush.
+        """
+        try:
+            self.flush()
+        except (OSError, TypeError, ValueError):
+            pass
+
+    def _loaded(self) -> dict[str, dict]:
+        """
+        Retourne les entrées en mémoire, en lisant le fichier au premier appel.
+        """
+        if self._entries is None:
+            self._entries = self._read_file()
+        return self._entries
+
+    def _read_file(self) -> dict[str, dict]:
+        """
+        Lit et valide le fichier de cache.
+
+        Returns:
+            Entrées valides du fichier (dictionnaire vide si absent,
+            illisible ou d'une autre version).
+        """
+        try:
+            with self._path.open("r", encoding="utf-8") as handle:
+                payload = json.load(handle)
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(payload, dict) or payload.get("version") != FORMAT_VERSION:
+            return {}
+
+        entries = payload.get("entries")
+        if not isinstance(entries, dict):
+            return {}
+
+        return {
+            key: entry
+            for key, entry in entries.items()
+            if isinstance(entry, dict)
+            and isinstance(entry.get("expires_at"), (int, float))
+            and "value" in entry
+        }
+
+    def _flush(self, entries: dict[str, dict]) -> None:
+        """
+        Fusionne avec le fichier courant puis l'écrit de façon atomique.
+
+        Les entrées expirées sont supprimées ; en cas de conflit, l'entrée
+        expirant le plus tard est conservée.
+
+        Args:
+            entries: entrées en mémoire (mises à jour en place)
+        """
+        now = self._clock()
+        for key, entry in self._read_file().items():
+            current = entries.get(key)
+            if current is None or entry["expires_at"] > current["expires_at"]:
+                entries[key] = entry
+
+        for key in [k for k, e in entries.items() if now > e["expires_at"]]:
+            del entries[key]
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"version": FORMAT_VERSION, "entries": entries}
+
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self._path.parent,
+            prefix=f".{self._path.name}.",
+            suffix=".tmp",
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, self._path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
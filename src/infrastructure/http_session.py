@@ -0,0 +1,132 @@
+"""
+Pool de connexions HTTP persistantes.
+
+Ce module fournit une session HTTP partagée (keep-alive) afin que les
+appels successifs vers l'API OpenData réutilisent les connexions TCP/TLS
+déjà ouvertes au lieu de refaire une poignée de main à chaque requête.
+
+requests n'est importé qu'à la création d'une session : importer ce
+module ne coûte rien au démarrage.
+"""
+
+from __future__ import annotations
+
+from threading import Lock
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    import requests
+
+
+class HttpSessionPool:
+    """
+    Session HTTP longue durée avec pool de connexions.
+
+    Responsabilités :
+    - conserver les connexions ouvertes (keep-alive) entre les appels
+    - limiter le nombre de connexions par hôte
+    - exposer des statistiques d'utilisation du pool
+
+    La session peut être partagée entre plusieurs threads : le pool
+    urllib3 sous-jacent est thread-safe et les compteurs sont protégés
+    par un verrou.
+    """
+
+    def __init__(
+        self,
+        max_hosts: int = 4,
+        max_connections_per_host: int = 10,
+        block_when_full: bool = False,
+    ):
+        """
+        Initialise la session et son adaptateur HTTP.
+
+        Args:
+            max_hosts: nombre d'hôtes distincts dont le pool est conservé
+            max_connections_per_host: connexions conservées par hôte
+            block_when_full: si True, attend qu'une connexion se libère
+                au lieu d'en ouvrir une supplémentaire (limite stricte)
+        """
+        # pylint: disable-next=import-outside-toplevel
+        import requests
+        from requests.adapters import HTTPAdapter  # pylint: disable=import-outside-toplevel
+
+        self._adapter = HTTPAdapter(
+            pool_connections=max_hosts,
+            pool_maxsize=max_connections_per_host,
+            pool_block=block_when_full,
+        )
+        self._session = requests.Session()
+        self._session.headers["Connection"] = "keep-alive"
+        self._session.mount("https://", self._adapter)
+        self._session.mount("http://", self._adapter)
+
+        self._lock = Lock()
+        self._requests_sent = 0
+
+    def get(
+        self,
+        url: str,
+        timeout: float,
+        headers: Optional[dict[str, str]] = None,
+    ) -> requests.Response:
+        """
+        Exécute une requête GET en réutilisant une connexion du pool.
+
+        Args:
+            url: URL à interroger
+            timeout: délai maximal de la requête HTTP
+            headers: en-têtes supplémentaires éventuels
+
+        Returns:
+            requests.Response: réponse HTTP brute
+
+        Raises:
+            requests.RequestException: en cas d'erreur réseau
+        """
+        with self._lock:
+            self._requests_sent += 1
+        return self._session.get(url, timeout=timeout, headers=headers)
+
+    def stats(self) -> dict[str, int]:
+        """
+        Retourne des statistiques sur l'utilisation du pool.
+
+        Returns:
+            Dictionnaire contenant :
+            - requests_sent : requêtes envoyées via la session
+            - hosts : nombre d'hôtes ayant un pool actif
+            - connections_opened : connexions TCP réellement ouvertes
+            - idle_connections : connexions disponibles pour réutilisation
+            - connections_reused : requêtes servies sans nouvelle connexion
+        """
+        pools = self._adapter.poolmanager.pools
+        connections_opened = 0
+        idle_connections = 0
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            connections_opened += pool.num_connections
+            if pool.pool is not None:
+                # La file urllib3 contient des emplacements vides (None).
+                idle_connections += sum(
+                    1 for conn in list(pool.pool.queue) if conn is not None
+                )
+
+        with self._lock:
+            requests_sent = self._requests_sent
+
+        return {
+            "requests_sent": requests_sent,
+            "hosts": len(pools),
+            "connections_opened": connections_opened,
+            "idle_connections": idle_connections,
+            "connections_reused": max(0, requests_sent - connections_opened),
+        }
+
+    def close(self) -> None:
+        """
+        Ferme la session et toutes les connexions du pool.
+        """
+        self._session.close()
@@ -4,13 +4,23 @@ Clients météo (Strategy pattern).
 Ce module définit une stratégie d'accès aux données météo (MeteoClient)
 et des implémentations concrètes (HTTP réel, mock) afin de découpler
 l'application de la source de données.
+
+Une variante asynchrone (AsyncMeteoClient) permet d'interroger de
+nombreuses stations depuis une seule boucle asyncio.
 """
 
 from __future__ import annotations
 
-from typing import Protocol, Any
+from collections import OrderedDict
+from threading import Lock
+from typing import TYPE_CHECKING, Protocol, Any, Optional
+
+from src.infrastructure.api_fetcher import ApiFetcher, parse_payload
+from src.infrastructure.http_session import HttpSessionPool
+from src.infrastructure.station_registry import StationRegistry
 
-from src.infrastructure.api_fetcher import ApiFetcher
+if TYPE_CHECKING:
+    import asyncio
 
 
 class MeteoClient(Protocol):  # pylint: disable=too-few-public-methods
@@ -19,6 +29,8 @@ class MeteoClient(Protocol):  # pylint: disable=too-few-public-methods
 
     Une implémentation doit pouvoir récupérer des données brutes depuis
     un endpoint et retourner un objet contenant un attribut .data.
+    Si les données n'ont pas changé depuis l'appel précédent, elle peut
+    retourner le même objet : le service évite alors de les ré-agréger.
     """
 
     def fetch(self, endpoint: str) -> Any:
@@ -34,33 +46,134 @@ class MeteoClient(Protocol):  # pylint: disable=too-few-public-methods
         raise NotImplementedError
 
 
-class HttpMeteoClient:  # pylint: disable=too-few-public-methods
+class AsyncMeteoClient(Protocol):  # pylint: disable=too-few-public-methods
+    """
+    Interface (port) d'un client météo asynchrone.
+
+    Équivalent de MeteoClient dont la méthode fetch est une coroutine.
+    """
+
+    async def fetch(self, endpoint: str) -> Any:
+        """
+        Récupère les données brutes depuis l'endpoint.
+
+        Args:
+            endpoint: URL / identifiant de la source
+
+        Returns:
+            Objet contenant les données brutes (ex: RawMeteoData).
+        """
+        raise NotImplementedError
+
+
+class HttpMeteoClient:
     """
     Implémentation HTTP réelle du client météo.
 
     Cette classe est volontairement simple et ne gère pas de logique métier.
+    Elle possède un pool de connexions persistantes partagé par tous les
+    appels, ce qui évite une nouvelle poignée de main TCP/TLS par station.
+    Un ApiFetcher est conservé par endpoint afin de mémoriser ses
+    validateurs HTTP (requêtes conditionnelles ETag / Last-Modified).
+    Le pool (et donc requests) n'est créé qu'au premier appel réseau.
     """
 
-    def __init__(self, timeout_seconds: int = 10):
+    def __init__(
+        self,
+        timeout_seconds: int = 10,
+        pool: Optional[HttpSessionPool] = None,
+        pool_size: int = 10,
+        max_tracked_endpoints: int = 256,
+    ):
         """
         Initialise le client HTTP.
 
         Args:
             timeout_seconds: délai maximum de la requête HTTP
+            pool: pool de connexions à utiliser (créé au premier appel si None)
+            pool_size: nombre de connexions conservées par hôte
+            max_tracked_endpoints: nombre maximal d'endpoints dont les
+                validateurs HTTP sont conservés (éviction LRU)
         """
         self._timeout_seconds = timeout_seconds
+        self._pool = pool
+        self._pool_size = pool_size
+        self._max_tracked_endpoints = max_tracked_endpoints
+        self._fetchers: OrderedDict[str, ApiFetcher] = OrderedDict()
+        self._fetchers_lock = Lock()
+        self._pool_lock = Lock()
 
     def fetch(self, endpoint: str):
         """
         Appelle l'API via HTTP et retourne les données brutes.
 
+        Les validateurs HTTP sont mémorisés par URL exacte. Les requêtes
+        incrémentales (paramètres where / limit, différents à chaque appel)
+        passent par le fetcher de leur endpoint de base, sans en-têtes
+        conditionnels : elles ne créent pas un fetcher par URL et ne
+        réutilisent jamais les validateurs d'une autre requête.
+
         Args:
             endpoint: URL de l'API
 
         Returns:
             RawMeteoData: données brutes issues de l'API
         """
-        return ApiFetcher(endpoint, timeout_seconds=self._timeout_seconds).fetch()
+        if not StationRegistry.is_incremental(endpoint):
+            return self._fetcher_for(endpoint).fetch()
+        return self._fetcher_for(StationRegistry.base_endpoint(endpoint)).fetch(endpoint)
+
+    def _fetcher_for(self, endpoint: str) -> ApiFetcher:
+        """
+        Retourne le fetcher associé à l'endpoint (créé si besoin).
+
+        Args:
+            endpoint: URL de l'API
+
+        Returns:
+            ApiFetcher partageant le pool de connexions du client.
+        """
+        with self._fetchers_lock:
+            fetcher = self._fetchers.get(endpoint)
+            if fetcher is None:
+                fetcher = ApiFetcher(
+                    endpoint,
+                    timeout_seconds=self._timeout_seconds,
+                    session=self._get_pool(),
+                )
+                self._fetchers[endpoint] = fetcher
+                if len(self._fetchers) > self._max_tracked_endpoints:
+                    self._fetchers.popitem(last=False)
+            else:
+                self._fetchers.move_to_end(endpoint)
+            return fetcher
+
+    def pool_stats(self) -> dict[str, int]:
+        """
+        Retourne les statistiques du pool de connexions.
+
+        Returns:
+            Dictionnaire de compteurs (voir HttpSessionPool.stats).
+        """
+        return self._get_pool().stats()
+
+    def close(self) -> None:
+        """
+        Ferme les connexions persistantes du client.
+        """
+        with self._pool_lock:
+            pool = self._pool
+        if pool is not None:
+            pool.close()
+
+    def _get_pool(self) -> HttpSessionPool:
+        """
+        Retourne le pool de connexions, créé au premier usage.
+        """
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = HttpSessionPool(max_connections_per_host=self._pool_size)
+            return self._pool
 
 
 class MockMeteoClient:  # pylint: disable=too-few-public-methods
@@ -91,3 +204,98 @@ class MockMeteoClient:  # pylint: disable=too-few-public-methods
             Payload fourni au constructeur.
         """
         return self._payload
+
+
+class AsyncHttpMeteoClient:
+    """
+    Implémentation HTTP asynchrone du client météo (aiohttp).
+
+    Le client possède son propre pool de connexions persistantes et limite
+    le nombre de requêtes simultanées via un sémaphore. La session est
+    créée paresseusement dans la boucle asyncio qui l'utilise.
+    """
+
+    def __init__(
+        self,
+        timeout_seconds: int = 10,
+        max_connections: int = 100,
+        max_connections_per_host: int = 10,
+        max_concurrency: int = 50,
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """
+        Initialise le client HTTP asynchrone.
+
+        Args:
+            timeout_seconds: délai maximum d'une requête HTTP
+            max_connections: taille totale du pool de connexions
+            max_connections_per_host: connexions simultanées par hôte
+            max_concurrency: nombre maximal de requêtes en vol
+        """
+        self._timeout_seconds = timeout_seconds
+        self._max_connections = max_connections
+        self._max_connections_per_host = max_connections_per_host
+        self._max_concurrency = max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._session = None
+        self._client_error: type[Exception] = OSError
+
+    def _get_session(self):
+        """
+        Retourne la session aiohttp et son sémaphore, créés au premier usage.
+
+        Raises:
+            RuntimeError: si aiohttp n'est pas installé
+        """
+        if self._session is None or self._session.closed:
+            import asyncio  # pylint: disable=import-outside-toplevel
+
+            try:
+                import aiohttp  # pylint: disable=import-outside-toplevel
+            except ImportError as exc:
+                raise RuntimeError(
+                    "aiohttp est requis pour AsyncHttpMeteoClient "
+                    "(pip install aiohttp)."
+                ) from exc
+
+            self._client_error = aiohttp.ClientError
+            connector = aiohttp.TCPConnector(
+                limit=self._max_connections,
+                limit_per_host=self._max_connections_per_host,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self._timeout_seconds),
+            )
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        return self._session, self._semaphore
+
+    async def fetch(self, endpoint: str):
+        """
+        Appelle l'API via HTTP et retourne les données brutes.
+
+        Args:
+            endpoint: URL de l'API
+
+        Returns:
+            RawMeteoData: données brutes issues de l'API
+
+        Raises:
+            RuntimeError: en cas d'erreur HTTP ou réseau
+        """
+        session, semaphore = self._get_session()
+        async with semaphore:
+            try:
+                async with session.get(endpoint) as response:
+                    response.raise_for_status()
+                    payload = await response.json(content_type=None)
+            except self._client_error as exc:
+                raise RuntimeError(str(exc)) from exc
+        return parse_payload(payload)
+
+    async def close(self) -> None:
+        """
+        Ferme la session et les connexions persistantes.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
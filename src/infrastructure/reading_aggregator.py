@@ -6,88 +6,83 @@ afin de reconstruire une lecture complète en utilisant les
 dernières valeurs non nulles disponibles pour chaque champ.
 """
 
+from __future__ import annotations
+
 from datetime import datetime
+from typing import Optional
 
 from src.infrastructure.record_extractor import (
-    extract_timestamp,
-    extract_temperature_c,
-    extract_humidity_pct,
-    extract_pressure_hpa,
-    extract_rain_mm,
-    extract_wind_speed,
-    extract_wind_direction_deg,
+    GENERIC_EXTRACTORS,
+    RecordSchema,
 )
 
 
-def aggregate_latest_values(records: list[dict]) -> dict:
+def aggregate_latest_values(records: list[dict], newest_first: bool = False) -> dict:
     """
     Agrège une liste d'enregistrements météo bruts.
 
-    La fonction parcourt les enregistrements du plus récent au plus ancien
-    et récupère, pour chaque champ, la première valeur non nulle rencontrée.
+    Pour chaque champ, la valeur retenue est la valeur non nulle de
+    l'enregistrement le plus récent qui en fournit une. Les enregistrements
+    sans horodatage sont considérés comme les plus anciens ; à horodatage
+    égal, le premier enregistrement rencontré l'emporte.
+
+    L'agrégation se fait en un seul parcours, sans tri : chaque horodatage
+    n'est converti qu'une fois et les enregistrements plus anciens que
+    toutes les valeurs déjà retenues sont ignorés sans extraction.
+    Le schéma du lot est résolu une fois (RecordSchema) : les
+    enregistrements conformes sont lus par accès direct aux clés.
+
+    Si les enregistrements sont triés du plus récent au plus ancien (ordre
+    order_by=heure_utc desc de l'API, fenêtre du StationRecordStore), le
+    parcours s'arrête au premier enregistrement plus ancien que toutes les
+    valeurs retenues : la suite du lot n'est pas lue.
 
     Args:
         records: liste de dictionnaires représentant les données brutes
+        newest_first: True si records est trié du plus récent au plus
+            ancien (non vérifié ; sinon le résultat peut différer)
 
     Returns:
         Dictionnaire contenant les valeurs agrégées.
     """
-    sorted_records = sorted(
-        records,
-        key=lambda r: extract_timestamp(r) or datetime.min,
-        reverse=True,
-    )
-
-    timestamp = None
-    temperature_c = None
-    humidity_pct = None
-    pressure_hpa = None
-    rain_mm = None
-    wind_speed = None
-    wind_direction_deg = None
-
-    for record in sorted_records:
-        if timestamp is None:
-            timestamp = extract_timestamp(record)
-
-        if temperature_c is None:
-            temperature_c = extract_temperature_c(record)
-
-        if humidity_pct is None:
-            humidity_pct = extract_humidity_pct(record)
-
-        if pressure_hpa is None:
-            pressure_hpa = extract_pressure_hpa(record)
-
-        if rain_mm is None:
-            rain_mm = extract_rain_mm(record)
-
-        if wind_speed is None:
-            wind_speed = extract_wind_speed(record)
-
-        if wind_direction_deg is None:
-            wind_direction_deg = extract_wind_direction_deg(record)
-
-        if all(
-            value is not None
-            for value in (
-                timestamp,
-                temperature_c,
-                humidity_pct,
-                pressure_hpa,
-                rain_mm,
-                wind_speed,
-                wind_direction_deg,
-            )
-        ):
-            break
-
-    return {
-        "timestamp": timestamp,
-        "temperature_c": temperature_c,
-        "humidity_pct": humidity_pct,
-        "pressure_hpa": pressure_hpa,
-        "rain_mm": rain_mm,
-        "wind_speed": wind_speed,
-        "wind_direction_deg": wind_direction_deg,
-    }
+    schema = RecordSchema.detect(records)
+
+    newest: Optional[datetime] = None
+    values = dict.fromkeys(name for name, _ in GENERIC_EXTRACTORS.fields)
+    # best[champ] = horodatage de l'enregistrement ayant fourni la valeur
+    best: dict[str, Optional[datetime]] = {}
+    # Horodatage le plus ancien parmi les valeurs retenues, lorsque tous les
+    # champs ont une valeur datée : tout enregistrement plus ancien est ignoré.
+    floor: Optional[datetime] = None
+
+    for record in records:
+        extractors = (
+            schema.extractors_for(record) if schema is not None else GENERIC_EXTRACTORS
+        )
+        stamp = extractors.timestamp(record)
+        if stamp is not None and (newest is None or stamp > newest):
+            newest = stamp
+
+        if floor is not None and (stamp is None or stamp <= floor):
+            if newest_first:
+                # Lot trié : tous les enregistrements suivants sont plus anciens
+                break
+            continue
+
+        updated = False
+        for name, extract in extractors.fields:
+            if name in best:
+                current = best[name]
+                if stamp is None or (current is not None and stamp <= current):
+                    continue
+
+            value = extract(record)
+            if value is not None:
+                values[name] = value
+                best[name] = stamp
+                updated = True
+
+        if updated and len(best) == len(values):
+            floor = None if None in best.values() else min(best.values())
+
+    return {"timestamp": newest, **values}
@@ -8,8 +8,76 @@ fonctions d'extraction robustes et réutilisables pour l'agrégation.
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Any, Optional
+from datetime import datetime, timezone
+from typing import Any, Callable, NamedTuple, Optional
+
+# Nombre d'horodatages texte distincts mémorisés par parse_datetime
+# (plus de 40 jours de grille à 15 minutes)
+TIMESTAMP_CACHE_SIZE = 4096
+_PARSED_TIMESTAMPS: dict[str, Optional[datetime]] = {}
+# Absence d'entrée (None est une valeur mémorisée : texte non convertible)
+_MISSING: Any = object()
+
+# Clés candidates de chaque champ, par ordre de priorité
+TIMESTAMP_KEYS = (
+    "heure_de_paris",
+    "heure_utc",
+    "date",
+    "datetime",
+    "timestamp",
+    "time",
+)
+TEMPERATURE_KEYS = (
+    "temperature_en_degre_c",
+    "temperature_air",
+    "temp_air",
+    "temperature",
+    "temp",
+    "temp_c",
+    "temperature_c",
+    "ta",
+    "t",
+)
+HUMIDITY_KEYS = (
+    "humidite",
+    "humidite_relative",
+    "humidite_relative_en_pourcentage",
+    "hygrometrie",
+    "hr",
+    "u",
+)
+PRESSURE_KEYS = (
+    "pression",
+    "pression_atmo",
+    "pression_atmospherique",
+    "pressure",
+    "pres",
+    "ps",
+    "p",
+    "qnh",
+)
+RAIN_KEYS = (
+    "pluie",
+    "precipitations",
+    "rain",
+    "rr",
+)
+WIND_SPEED_KEYS = (
+    "force_moyenne_du_vecteur_vent",
+    "vent_vitesse",
+    "vitesse_vent",
+    "wind_speed",
+    "ff",
+)
+WIND_GUST_KEYS = ("force_rafale_max",)
+WIND_DIRECTION_KEYS = (
+    "direction_du_vecteur_vent_moyen",
+    "direction_du_vecteur_de_vent_max_en_degres",
+    "vent_direction",
+    "direction_vent",
+    "wind_dir",
+    "dd",
+)
 
 
 def first_value(record: dict, *keys: str) -> Any:
@@ -26,13 +94,18 @@ def first_value(record: dict, *keys: str) -> Any:
     Returns:
         La première valeur non nulle trouvée, sinon None.
     """
-    inner = record.get("data") if isinstance(record.get("data"), dict) else record
+    inner = record.get("data")
+    if not isinstance(inner, dict):
+        inner = record
 
     for key in keys:
-        if key in inner and inner[key] is not None:
-            return inner[key]
-        if key in record and record[key] is not None:
-            return record[key]
+        value = inner.get(key)
+        if value is not None:
+            return value
+        if inner is not record:
+            value = record.get(key)
+            if value is not None:
+                return value
     return None
 
 
@@ -40,6 +113,12 @@ def parse_datetime(value: Any) -> Optional[datetime]:
     """
     Convertit une valeur ISO 8601 en datetime.
 
+    Les horodatages de l'API se répètent d'une station et d'une requête à
+    l'autre (grille de 15 minutes) : les conversions de chaînes sont
+    mémorisées, y compris les échecs. La mémoire est bornée
+    (TIMESTAMP_CACHE_SIZE) et vidée lorsqu'elle est pleine ; les datetime
+    étant immuables, les instances mémorisées sont partagées.
+
     Args:
         value: valeur texte/objet convertible en chaîne
 
@@ -48,12 +127,63 @@ def parse_datetime(value: Any) -> Optional[datetime]:
     """
     if not value:
         return None
+    text = value if isinstance(value, str) else str(value)
+    parsed = _PARSED_TIMESTAMPS.get(text, _MISSING)
+    if parsed is _MISSING:
+        parsed = parse_iso_text(text)
+        if len(_PARSED_TIMESTAMPS) >= TIMESTAMP_CACHE_SIZE:
+            _PARSED_TIMESTAMPS.clear()
+        _PARSED_TIMESTAMPS[text] = parsed
+    return parsed
+
+
+def parse_iso_text(text: str) -> Optional[datetime]:
+    """
+    Convertit une chaîne ISO 8601 en datetime (sans mémorisation).
+
+    Les formats de l'API (YYYY-MM-DDTHH:MM:SS+00:00, ou suffixe "Z"
+    depuis Python 3.11) sont convertis directement ; le remplacement de
+    "Z" n'est tenté qu'en cas d'échec.
+
+    Args:
+        text: horodatage texte
+
+    Returns:
+        datetime si parsing OK, sinon None.
+    """
     try:
-        return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
-    except (TypeError, ValueError):
+        return datetime.fromisoformat(text)
+    except ValueError:
+        pass
+    try:
+        return datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
         return None
 
 
+def utc_timestamp(stamp: datetime) -> float:
+    """
+    Convertit un datetime en horodatage POSIX, un datetime naïf étant
+    considéré comme UTC (et non comme l'heure locale de la machine).
+
+    Args:
+        stamp: datetime naïf ou avec fuseau
+
+    Returns:
+        Secondes depuis l'époque UTC.
+    """
+    if stamp.tzinfo is None:
+        stamp = stamp.replace(tzinfo=timezone.utc)
+    return stamp.timestamp()
+
+
+def clear_timestamp_cache() -> None:
+    """
+    Vide la mémoire des horodatages convertis.
+    """
+    _PARSED_TIMESTAMPS.clear()
+
+
 def to_float(value: Any) -> Optional[float]:
     """
     Convertit une valeur en float.
@@ -72,6 +202,26 @@ def to_float(value: Any) -> Optional[float]:
         return None
 
 
+def to_hpa(value: Any) -> Optional[float]:
+    """
+    Convertit une pression en hPa (conversion automatique Pa -> hPa).
+
+    Args:
+        value: pression brute (hPa ou Pa)
+
+    Returns:
+        Pression en hPa si conversion OK, sinon None.
+    """
+    pressure = to_float(value)
+    if pressure is None:
+        return None
+
+    if pressure > 2000:
+        return pressure / 100.0
+
+    return pressure
+
+
 def extract_timestamp(record: dict) -> Optional[datetime]:
     """
     Extrait le timestamp de l'enregistrement.
@@ -82,17 +232,7 @@ def extract_timestamp(record: dict) -> Optional[datetime]:
     Returns:
         datetime si disponible, sinon None.
     """
-    return parse_datetime(
-        first_value(
-            record,
-            "heure_de_paris",
-            "heure_utc",
-            "date",
-            "datetime",
-            "timestamp",
-            "time",
-        )
-    )
+    return parse_datetime(first_value(record, *TIMESTAMP_KEYS))
 
 
 def extract_temperature_c(record: dict) -> Optional[float]:
@@ -105,20 +245,7 @@ def extract_temperature_c(record: dict) -> Optional[float]:
     Returns:
         Température en °C si disponible, sinon None.
     """
-    return to_float(
-        first_value(
-            record,
-            "temperature_en_degre_c",
-            "temperature_air",
-            "temp_air",
-            "temperature",
-            "temp",
-            "temp_c",
-            "temperature_c",
-            "ta",
-            "t",
-        )
-    )
+    return to_float(first_value(record, *TEMPERATURE_KEYS))
 
 
 def extract_humidity_pct(record: dict) -> Optional[float]:
@@ -131,17 +258,7 @@ def extract_humidity_pct(record: dict) -> Optional[float]:
     Returns:
         Humidité en % si disponible, sinon None.
     """
-    return to_float(
-        first_value(
-            record,
-            "humidite",
-            "humidite_relative",
-            "humidite_relative_en_pourcentage",
-            "hygrometrie",
-            "hr",
-            "u",
-        )
-    )
+    return to_float(first_value(record, *HUMIDITY_KEYS))
 
 
 def extract_pressure_hpa(record: dict) -> Optional[float]:
@@ -156,26 +273,7 @@ def extract_pressure_hpa(record: dict) -> Optional[float]:
     Returns:
         Pression en hPa si disponible, sinon None.
     """
-    pressure = to_float(
-        first_value(
-            record,
-            "pression",
-            "pression_atmo",
-            "pression_atmospherique",
-            "pressure",
-            "pres",
-            "ps",
-            "p",
-            "qnh",
-        )
-    )
-    if pressure is None:
-        return None
-
-    if pressure > 2000:
-        return pressure / 100.0
-
-    return pressure
+    return to_hpa(first_value(record, *PRESSURE_KEYS))
 
 
 def extract_rain_mm(record: dict) -> Optional[float]:
@@ -188,15 +286,7 @@ def extract_rain_mm(record: dict) -> Optional[float]:
     Returns:
         Pluie en mm si disponible, sinon None.
     """
-    return to_float(
-        first_value(
-            record,
-            "pluie",
-            "precipitations",
-            "rain",
-            "rr",
-        )
-    )
+    return to_float(first_value(record, *RAIN_KEYS))
 
 
 def extract_wind_speed(record: dict) -> Optional[float]:
@@ -209,20 +299,11 @@ def extract_wind_speed(record: dict) -> Optional[float]:
     Returns:
         Vitesse de vent si disponible, sinon None.
     """
-    wind_speed = to_float(
-        first_value(
-            record,
-            "force_moyenne_du_vecteur_vent",
-            "vent_vitesse",
-            "vitesse_vent",
-            "wind_speed",
-            "ff",
-        )
-    )
+    wind_speed = to_float(first_value(record, *WIND_SPEED_KEYS))
     if wind_speed is not None:
         return wind_speed
 
-    return to_float(first_value(record, "force_rafale_max"))
+    return to_float(first_value(record, *WIND_GUST_KEYS))
 
 
 def extract_wind_direction_deg(record: dict) -> Optional[float]:
@@ -235,14 +316,239 @@ def extract_wind_direction_deg(record: dict) -> Optional[float]:
     Returns:
         Direction en degrés si disponible, sinon None.
     """
-    return to_float(
-        first_value(
-            record,
-            "direction_du_vecteur_vent_moyen",
-            "direction_du_vecteur_de_vent_max_en_degres",
-            "vent_direction",
-            "direction_vent",
-            "wind_dir",
-            "dd",
+    return to_float(first_value(record, *WIND_DIRECTION_KEYS))
+
+
+# Champ -> (conversion, groupes de clés candidates). Les groupes sont essayés
+# dans l'ordre : le premier donnant une valeur convertie non nulle l'emporte.
+FieldSpecs = dict[str, tuple[Callable[[Any], Any], tuple[tuple[str, ...], ...]]]
+
+FIELD_SPECS: FieldSpecs = {
+    "timestamp": (parse_datetime, (TIMESTAMP_KEYS,)),
+    "temperature_c": (to_float, (TEMPERATURE_KEYS,)),
+    "humidity_pct": (to_float, (HUMIDITY_KEYS,)),
+    "pressure_hpa": (to_hpa, (PRESSURE_KEYS,)),
+    "rain_mm": (to_float, (RAIN_KEYS,)),
+    "wind_speed": (to_float, (WIND_SPEED_KEYS, WIND_GUST_KEYS)),
+    "wind_direction_deg": (to_float, (WIND_DIRECTION_KEYS,)),
+}
+
+
+class FieldExtractors(NamedTuple):
+    """
+    Fonctions d'extraction d'un enregistrement.
+
+    Attributes:
+        timestamp: extraction de l'horodatage
+        fields: tuples (nom du champ, extraction) des mesures
+    """
+
+    timestamp: Callable[[dict], Optional[datetime]]
+    fields: tuple[tuple[str, Callable[[dict], Optional[float]]], ...]
+
+
+# Chemin générique : sonde toutes les clés candidates à chaque appel
+GENERIC_EXTRACTORS = FieldExtractors(
+    extract_timestamp,
+    (
+        ("temperature_c", extract_temperature_c),
+        ("humidity_pct", extract_humidity_pct),
+        ("pressure_hpa", extract_pressure_hpa),
+        ("rain_mm", extract_rain_mm),
+        ("wind_speed", extract_wind_speed),
+        ("wind_direction_deg", extract_wind_direction_deg),
+    ),
+)
+
+
+def build_generic_extractors(specs: FieldSpecs) -> FieldExtractors:
+    """
+    Construit des extracteurs génériques (sondage de toutes les clés
+    candidates) pour des spécifications de champs.
+
+    Args:
+        specs: champ -> (conversion, groupes de clés candidates) ; doit
+            contenir "timestamp"
+
+    Returns:
+        FieldExtractors équivalents à ceux de FIELD_SPECS pour ces champs.
+    """
+
+    def extractor(convert, groups):
+        def extract(record: dict) -> Any:
+            for keys in groups:
+                value = convert(first_value(record, *keys))
+                if value is not None:
+                    return value
+            return None
+
+        return extract
+
+    fields = {name: extractor(*spec) for name, spec in specs.items()}
+    return FieldExtractors(fields.pop("timestamp"), tuple(fields.items()))
+
+
+class RecordSchema:
+    """
+    Schéma d'enregistrement résolu une seule fois pour un lot.
+
+    Un jeu de données a un schéma fixe : les clés présentes sont les mêmes
+    pour tous ses enregistrements. Le schéma détermine donc une fois pour
+    toutes quelle clé concrète fournit chaque champ, et produit des
+    extracteurs compilés (accès direct aux clés). Un enregistrement dont
+    les clés diffèrent utilise le chemin générique.
+    """
+
+    def __init__(
+        self,
+        record: dict,
+        specs: Optional[FieldSpecs] = None,
+        generic: FieldExtractors = GENERIC_EXTRACTORS,
+    ):
+        """
+        Résout le schéma à partir d'un enregistrement représentatif.
+
+        Args:
+            record: premier enregistrement du lot
+            specs: champs à extraire (FIELD_SPECS si None)
+            generic: extracteurs génériques équivalents à specs, utilisés
+                pour les enregistrements d'un autre schéma
+        """
+        specs = FIELD_SPECS if specs is None else specs
+        self.generic = generic
+        data = record.get("data")
+        self._nested = isinstance(data, dict)
+        self._outer_keys = frozenset(record)
+        self._inner_keys = frozenset(data) if self._nested else self._outer_keys
+        self._has_data_key = "data" in self._outer_keys
+        self.is_direct = not self._nested and all(
+            groups[0][0] in self._outer_keys for _, groups in specs.values()
         )
-    )
+
+        compiled = {
+            name: self._compile(convert, groups)
+            for name, (convert, groups) in specs.items()
+        }
+        self.extractors = FieldExtractors(
+            compiled.pop("timestamp"),
+            tuple(compiled.items()),
+        )
+
+    @classmethod
+    def detect(
+        cls,
+        records: list[dict],
+        specs: Optional[FieldSpecs] = None,
+        generic: FieldExtractors = GENERIC_EXTRACTORS,
+    ) -> Optional[RecordSchema]:
+        """
+        Détecte le schéma d'un lot à partir de son premier enregistrement.
+
+        Aucun schéma n'est retourné lorsque chaque champ est fourni par sa
+        première clé candidate d'un enregistrement non imbriqué : le chemin
+        générique ne fait alors qu'un accès par champ et la vérification du
+        schéma coûterait plus qu'elle ne rapporte.
+
+        Args:
+            records: enregistrements bruts du lot
+            specs: champs à extraire (FIELD_SPECS si None)
+            generic: extracteurs génériques équivalents à specs
+
+        Returns:
+            RecordSchema, ou None si le lot est vide ou déjà direct.
+        """
+        if not records or not isinstance(records[0], dict):
+            return None
+        schema = cls(records[0], specs, generic)
+        return None if schema.is_direct else schema
+
+    def matches(self, record: dict) -> bool:
+        """
+        Indique si un enregistrement a exactement les clés du schéma.
+
+        Args:
+            record: dictionnaire brut
+
+        Returns:
+            True si les extracteurs compilés s'appliquent.
+        """
+        if record.keys() != self._outer_keys:
+            return False
+        if self._nested:
+            data = record["data"]
+            return isinstance(data, dict) and data.keys() == self._inner_keys
+        return not (self._has_data_key and isinstance(record["data"], dict))
+
+    def extractors_for(self, record: dict) -> FieldExtractors:
+        """
+        Retourne les extracteurs adaptés à un enregistrement.
+
+        Args:
+            record: dictionnaire brut
+
+        Returns:
+            Extracteurs compilés si le schéma correspond, sinon génériques.
+        """
+        return self.extractors if self.matches(record) else self.generic
+
+    def _resolve(self, keys: tuple[str, ...]) -> tuple[tuple[bool, str], ...]:
+        """
+        Retourne les clés présentes dans le schéma, dans l'ordre de priorité
+        du chemin générique (dictionnaire imbriqué puis enregistrement).
+
+        Args:
+            keys: clés candidates
+
+        Returns:
+            Tuples (lecture dans record["data"], clé).
+        """
+        lookups = []
+        for key in keys:
+            if key in self._inner_keys:
+                lookups.append((self._nested, key))
+            if self._nested and key in self._outer_keys:
+                lookups.append((False, key))
+        return tuple(lookups)
+
+    def _compile(
+        self,
+        convert: Callable[[Any], Any],
+        groups: tuple[tuple[str, ...], ...],
+    ) -> Callable[[dict], Any]:
+        """
+        Construit l'extraction d'un champ par accès direct aux clés résolues.
+
+        Args:
+            convert: conversion de la valeur brute
+            groups: groupes de clés candidates du champ
+
+        Returns:
+            Fonction record -> valeur convertie (ou None).
+        """
+        lookups = tuple(
+            resolved for resolved in map(self._resolve, groups) if resolved
+        )
+
+        if not lookups:
+            return lambda record: None
+
+        if len(lookups) == 1 and len(lookups[0]) == 1:
+            from_inner, key = lookups[0][0]
+            if from_inner:
+                return lambda record: convert(record["data"][key])
+            return lambda record: convert(record[key])
+
+        def extract(record: dict) -> Any:
+            inner = record["data"] if self._nested else record
+            for group in lookups:
+                value = None
+                for from_inner, key in group:
+                    value = (inner if from_inner else record)[key]
+                    if value is not None:
+                        break
+                value = convert(value)
+                if value is not None:
+                    return value
+            return None
+
+        return extract
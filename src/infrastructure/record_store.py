@@ -0,0 +1,126 @@
+"""
+Stockage local des enregistrements bruts par station.
+
+Ce module conserve les enregistrements déjà reçus de l'API afin de ne
+demander ensuite que les enregistrements plus récents (récupération
+incrémentale). Les enregistrements sont dédupliqués par horodatage UTC.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from threading import Lock
+from typing import Iterable, Optional
+
+from src.domain.mesure.raw_data import RawMeteoData
+from src.infrastructure.record_extractor import first_value, parse_datetime
+
+
+def record_utc_timestamp(record: dict) -> Optional[datetime]:
+    """
+    Retourne l'horodatage UTC (heure_utc) d'un enregistrement.
+
+    Args:
+        record: dictionnaire brut
+
+    Returns:
+        datetime si disponible, sinon None.
+    """
+    return parse_datetime(first_value(record, "heure_utc"))
+
+
+class StationRecordStore:
+    """
+    Fenêtre glissante d'enregistrements bruts par station.
+
+    Responsabilités :
+    - fusionner les nouveaux enregistrements (dédupliqués par heure_utc)
+    - connaître l'horodatage le plus récent reçu pour chaque station
+    - fournir un instantané RawMeteoData stable tant que rien ne change
+    """
+
+    def __init__(self, max_records_per_station: int = 500):
+        """
+        Initialise un stockage vide.
+
+        Args:
+            max_records_per_station: taille maximale de la fenêtre ; les
+                enregistrements les plus anciens sont supprimés au-delà
+        """
+        self._max_records = max_records_per_station
+        self._lock = Lock()
+        # records[station] = {heure_utc: record}
+        self._records: dict[str, dict[datetime, dict]] = {}
+        self._newest: dict[str, datetime] = {}
+        self._snapshots: dict[str, RawMeteoData] = {}
+
+    def newest_timestamp(self, station_name: str) -> Optional[datetime]:
+        """
+        Retourne l'horodatage UTC le plus récent connu pour une station.
+
+        Args:
+            station_name: nom de la station
+
+        Returns:
+            datetime, ou None si aucun enregistrement horodaté n'est connu.
+        """
+        with self._lock:
+            return self._newest.get(station_name)
+
+    def merge(self, station_name: str, records: Iterable[dict]) -> int:
+        """
+        Ajoute des enregistrements à la fenêtre d'une station.
+
+        Les enregistrements sans heure_utc ou déjà connus sont ignorés.
+
+        Args:
+            station_name: nom de la station
+            records: enregistrements bruts reçus de l'API
+
+        Returns:
+            Nombre d'enregistrements réellement ajoutés.
+        """
+        with self._lock:
+            known = self._records.setdefault(station_name, {})
+            added = 0
+            for record in records:
+                timestamp = record_utc_timestamp(record)
+                if timestamp is None or timestamp in known:
+                    continue
+                known[timestamp] = record
+                added += 1
+
+            if not added:
+                return 0
+
+            if len(known) > self._max_records:
+                for timestamp in sorted(known)[: len(known) - self._max_records]:
+                    del known[timestamp]
+
+            self._newest[station_name] = max(known)
+            self._snapshots.pop(station_name, None)
+            return added
+
+    def snapshot(self, station_name: str) -> RawMeteoData:
+        """
+        Retourne les enregistrements connus, du plus récent au plus ancien.
+
+        Le même objet est retourné tant qu'aucun enregistrement n'a été
+        ajouté, ce qui permet d'éviter une nouvelle agrégation.
+
+        Args:
+            station_name: nom de la station
+
+        Returns:
+            RawMeteoData contenant la fenêtre de la station.
+        """
+        with self._lock:
+            snapshot = self._snapshots.get(station_name)
+            if snapshot is None:
+                known = self._records.get(station_name, {})
+                snapshot = RawMeteoData(
+                    [known[ts] for ts in sorted(known, reverse=True)],
+                    newest_first=True,
+                )
+                self._snapshots[station_name] = snapshot
+            return snapshot
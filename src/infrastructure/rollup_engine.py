@@ -0,0 +1,222 @@
+"""
+Cumuls par fenêtre de temps (heure, jour) maintenus au fil de l'eau.
+
+Chaque lot d'enregistrements reçu met à jour, pour chaque station et
+chaque résolution, les accumulateurs de la fenêtre concernée (nombre,
+minimum, maximum, somme). Les statistiques horaires ou journalières sont
+ainsi disponibles immédiatement, sans ré-agréger l'historique.
+"""
+
+from __future__ import annotations
+
+import math
+from datetime import datetime, timezone
+from threading import Lock
+from typing import Optional
+
+from src.domain.field_stats import FieldStats
+from src.domain.mesure.raw_data import RawMeteoData
+from src.infrastructure.columnar_store import SERIES_COLUMNS, records_to_rows
+from src.infrastructure.record_extractor import utc_timestamp
+
+# Résolution -> durée d'une fenêtre (secondes, alignée sur l'époque UTC)
+RESOLUTIONS = {"hour": 3600.0, "day": 86400.0}
+
+# Fenêtres conservées par défaut par station et par résolution (100 jours
+# en horaire) : le moteur est alimenté en continu, sa mémoire doit rester
+# bornée.
+DEFAULT_MAX_BUCKETS = 2_400
+
+
+class _StationRollups:  # pylint: disable=too-few-public-methods
+    """
+    Accumulateurs d'une station.
+
+    buckets[résolution][début] = un accumulateur [nombre, min, max, somme]
+    par champ, dans l'ordre de SERIES_COLUMNS.
+    """
+
+    __slots__ = ("seen", "buckets", "horizon")
+
+    def __init__(self, resolutions: dict[str, float]) -> None:
+        self.seen: set[float] = set()
+        self.buckets: dict[str, dict[float, list[list[float]]]] = {
+            name: {} for name in resolutions
+        }
+        # Enregistrements plus anciens ignorés (fenêtres déjà supprimées)
+        self.horizon = -math.inf
+
+
+class RollupEngine:
+    """
+    Cumuls min / max / moyenne / somme par station et par fenêtre de temps.
+
+    Responsabilités :
+    - ingérer des lots RawMeteoData (chaque horodatage n'est compté qu'une
+      fois, même si le lot est reçu à nouveau)
+    - mettre à jour les fenêtres de chaque résolution de façon incrémentale
+    - limiter le nombre de fenêtres conservées par station et résolution,
+      ainsi que les horodatages mémorisés pour la déduplication
+    """
+
+    def __init__(
+        self,
+        resolutions: Optional[dict[str, float]] = None,
+        max_buckets: int = DEFAULT_MAX_BUCKETS,
+    ):
+        """
+        Initialise un moteur sans données.
+
+        Args:
+            resolutions: résolution -> durée d'une fenêtre en secondes
+                (RESOLUTIONS si None)
+            max_buckets: nombre maximal de fenêtres conservées par station
+                et par résolution ; les plus anciennes sont supprimées
+                au-delà, avec les horodatages qu'elles couvraient
+
+        Raises:
+            ValueError: si max_buckets n'est pas un entier positif (un
+                moteur illimité grossirait sans fin)
+        """
+        if max_buckets is None or max_buckets < 1:
+            raise ValueError("max_buckets doit être supérieur ou égal à 1")
+        self._resolutions = dict(RESOLUTIONS if resolutions is None else resolutions)
+        self._max_buckets = max_buckets
+        self._lock = Lock()
+        self._stations: dict[str, _StationRollups] = {}
+
+    @property
+    def resolutions(self) -> list[str]:
+        """
+        Retourne les résolutions disponibles.
+        """
+        return list(self._resolutions)
+
+    def ingest(self, station_name: str, raw_data: RawMeteoData) -> int:
+        """
+        Ajoute un lot d'enregistrements aux cumuls d'une station.
+
+        Args:
+            station_name: nom de la station
+            raw_data: données brutes (attribut .data)
+
+        Returns:
+            Nombre d'enregistrements nouvellement comptés.
+        """
+        rows = records_to_rows(getattr(raw_data, "data", None) or [])
+        if not rows:
+            return 0
+
+        with self._lock:
+            station = self._stations.get(station_name)
+            if station is None:
+                station = _StationRollups(self._resolutions)
+                self._stations[station_name] = station
+
+            added = 0
+            for timestamp, values in rows:
+                if timestamp in station.seen or timestamp < station.horizon:
+                    continue
+                station.seen.add(timestamp)
+                added += 1
+                for resolution, seconds in self._resolutions.items():
+                    start = math.floor(timestamp / seconds) * seconds
+                    _accumulate(station.buckets[resolution], start, values)
+
+            if added:
+                self._trim(station)
+            return added
+
+    def rollups(
+        self,
+        station_name: str,
+        resolution: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> list[tuple[datetime, dict[str, FieldStats]]]:
+        """
+        Retourne les fenêtres d'une station dont le début est dans
+        [start, end[.
+
+        Args:
+            station_name: nom de la station
+            resolution: résolution ("hour", "day", ...)
+            start: début inclus (None = première fenêtre)
+            end: fin exclue (None = dernière fenêtre)
+
+        Returns:
+            Liste (début de fenêtre UTC, champ -> FieldStats), par ordre
+            chronologique (vide si la station est inconnue).
+
+        Raises:
+            ValueError: si la résolution est inconnue
+        """
+        if resolution not in self._resolutions:
+            raise ValueError(f"Résolution inconnue : {resolution}")
+
+        low = utc_timestamp(start) if start is not None else -math.inf
+        high = utc_timestamp(end) if end is not None else math.inf
+
+        with self._lock:
+            station = self._stations.get(station_name)
+            if station is None:
+                return []
+            buckets = station.buckets[resolution]
+            return [
+                (
+                    datetime.fromtimestamp(bucket_start, timezone.utc),
+                    {
+                        name: _to_stats(accumulator)
+                        for name, accumulator in zip(
+                            SERIES_COLUMNS, buckets[bucket_start]
+                        )
+                    },
+                )
+                for bucket_start in sorted(buckets)
+                if low <= bucket_start < high
+            ]
+
+    def _trim(self, station: _StationRollups) -> None:
+        """
+        Supprime les fenêtres les plus anciennes au-delà de max_buckets.
+        """
+        for resolution, seconds in self._resolutions.items():
+            buckets = station.buckets[resolution]
+            excess = len(buckets) - self._max_buckets
+            if excess <= 0:
+                continue
+            for bucket_start in sorted(buckets)[:excess]:
+                del buckets[bucket_start]
+                station.horizon = max(station.horizon, bucket_start + seconds)
+
+        station.seen = {ts for ts in station.seen if ts >= station.horizon}
+
+
+def _accumulate(
+    buckets: dict[float, list[list[float]]], start: float, values: tuple[float, ...]
+) -> None:
+    """
+    Ajoute les valeurs d'un enregistrement à une fenêtre (NaN ignorés).
+    """
+    bucket = buckets.get(start)
+    if bucket is None:
+        bucket = [[0, math.inf, -math.inf, 0.0] for _ in SERIES_COLUMNS]
+        buckets[start] = bucket
+
+    for accumulator, value in zip(bucket, values):
+        if math.isnan(value):
+            continue
+        accumulator[0] += 1
+        accumulator[1] = min(accumulator[1], value)
+        accumulator[2] = max(accumulator[2], value)
+        accumulator[3] += value
+
+
+def _to_stats(accumulator: list[float]) -> FieldStats:
+    """
+    Convertit un accumulateur en FieldStats.
+    """
+    count, minimum, maximum, total = accumulator
+    if not count:
+        return FieldStats()
+    return FieldStats(int(count), minimum, maximum, total)
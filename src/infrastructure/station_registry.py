@@ -7,6 +7,12 @@ ainsi que les URLs complètes permettant d'interroger l'API OpenData.
 
 from __future__ import annotations
 
+from datetime import datetime
+from urllib.parse import parse_qsl, quote, urlencode, urlsplit, urlunsplit
+
+# Paramètres ajoutés par incremental_endpoint()
+INCREMENTAL_PARAMS = frozenset({"where", "limit"})
+
 
 class StationRegistry:  # pylint: disable=too-few-public-methods
     """
@@ -46,3 +52,57 @@ class StationRegistry:  # pylint: disable=too-few-public-methods
             Dictionnaire associant le nom de la station à son endpoint API.
         """
         return cls.STATIONS
+
+    @staticmethod
+    def incremental_endpoint(endpoint: str, since: datetime, limit: int = 100) -> str:
+        """
+        Construit l'URL ne demandant que les enregistrements postérieurs
+        à un horodatage (paramètres where / limit de l'API Explore v2.1).
+
+        Args:
+            endpoint: URL de base de la station
+            since: horodatage UTC du dernier enregistrement connu
+            limit: nombre maximal d'enregistrements demandés (100 au plus)
+
+        Returns:
+            URL complète de la requête incrémentale.
+        """
+        where = quote(f"heure_utc > date'{since.isoformat()}'", safe="")
+        separator = "&" if "?" in endpoint else "?"
+        return f"{endpoint}{separator}where={where}&limit={limit}"
+
+    @staticmethod
+    def base_endpoint(url: str) -> str:
+        """
+        Retire d'une URL les paramètres where / limit d'une requête
+        incrémentale : toutes les requêtes d'une station ont la même base.
+
+        Args:
+            url: URL complète (incrémentale ou non)
+
+        Returns:
+            URL sans paramètres incrémentaux (forme normalisée).
+        """
+        parts = urlsplit(url)
+        query = [
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if key not in INCREMENTAL_PARAMS
+        ]
+        return urlunsplit(parts._replace(query=urlencode(query, quote_via=quote)))
+
+    @staticmethod
+    def is_incremental(url: str) -> bool:
+        """
+        Indique si une URL porte des paramètres de requête incrémentale.
+
+        Args:
+            url: URL complète
+
+        Returns:
+            True si la requête contient where ou limit.
+        """
+        return any(
+            key in INCREMENTAL_PARAMS
+            for key, _ in parse_qsl(urlsplit(url).query, keep_blank_values=True)
+        )
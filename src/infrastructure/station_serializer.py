@@ -0,0 +1,74 @@
+"""
+Conversion des objets Station vers / depuis des structures JSON.
+
+Ce module isole le mapping entre le modèle domaine et un format
+sérialisable (dictionnaire de types simples), utilisé par le cache
+persistant et les sorties texte.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Optional
+
+from src.domain.mesure.humidite import Humidite
+from src.domain.mesure.pression import Pression
+from src.domain.mesure.temperature import Temperature
+from src.domain.station import Station
+from src.infrastructure.record_extractor import parse_datetime
+
+
+def station_to_dict(station: Station) -> dict[str, Any]:
+    """
+    Convertit une Station en dictionnaire sérialisable en JSON.
+
+    Args:
+        station: objet Station (domain)
+
+    Returns:
+        Dictionnaire de valeurs simples (timestamp au format ISO 8601).
+    """
+    timestamp = station.timestamp
+    if isinstance(timestamp, datetime):
+        timestamp = timestamp.isoformat()
+
+    return {
+        "name": station.name,
+        "timestamp": timestamp,
+        "temperature_c": getattr(station.temperature, "value", None),
+        "humidity_pct": getattr(station.humidity, "value", None),
+        "pressure_hpa": getattr(station.pressure, "value", None),
+        "rain_mm": station.rain,
+        "wind_speed": station.wind_speed,
+        "wind_direction_deg": station.wind_direction,
+    }
+
+
+def station_from_dict(data: dict[str, Any]) -> Optional[Station]:
+    """
+    Reconstruit une Station à partir d'un dictionnaire produit par
+    station_to_dict.
+
+    Args:
+        data: dictionnaire sérialisé
+
+    Returns:
+        Station, ou None si le dictionnaire est incomplet.
+    """
+    if not isinstance(data, dict) or not data.get("name"):
+        return None
+
+    timestamp = parse_datetime(data.get("timestamp"))
+    if timestamp is None:
+        return None
+
+    return Station(
+        name=data["name"],
+        timestamp=timestamp,
+        temperature=Temperature(data.get("temperature_c")),
+        humidity=Humidite(data.get("humidity_pct")),
+        pressure=Pression(data.get("pressure_hpa")),
+        rain=data.get("rain_mm"),
+        wind_speed=data.get("wind_speed"),
+        wind_direction=data.get("wind_direction_deg"),
+    )
@@ -2,27 +2,79 @@
 Interface graphique Tkinter de l'application météo.
 
 Ce module contient :
-- un worker en thread séparé pour ne pas bloquer l'UI
-- une file (Queue) pour les jobs
+- un pool de workers (JobPool) pour ne pas bloquer l'UI : demandes
+  dédupliquées par station et servies par priorité
 - un EventBus (Observer) pour diffuser les résultats
-- une liste chaînée pour l'historique des consultations
+- un événement virtuel Tk (<<MeteoResult>>) qui réveille l'UI à l'arrivée
+  d'un résultat, sans scrutation périodique
+- un tampon circulaire pour l'historique des consultations
+- un chargement du catalogue des stations hors du thread Tk, après
+  l'affichage de la fenêtre
+- un tableau de bord de toutes les stations, rafraîchi périodiquement par
+  un chargement groupé, dont seules les cellules modifiées sont redessinées
 """
 
 from __future__ import annotations
 
 import tkinter as tk
+from datetime import datetime
+from itertools import zip_longest
 from tkinter import ttk, messagebox
-from typing import Optional
-from threading import Thread
+from typing import Iterable, Optional, Sequence
+from threading import Lock, Thread
 from queue import Queue, Empty
 
-from src.application.station_directory_service import StationDirectoryService
-from src.application.event_bus import EventBus, ReadingLoaded, ReadingFailed
-from src.domain.linked_list import LinkedList
+from src.application.station_directory_service import (
+    StationDirectoryService,
+    StationFetchResult,
+)
+from src.application.event_bus import (
+    CatalogLoaded,
+    EventBus,
+    ReadingFailed,
+    ReadingLoaded,
+    StationsRefreshed,
+)
+from src.application.job_pool import PRIORITY_BACKGROUND, PRIORITY_USER, JobPool
+from src.domain.ring_buffer import RingBuffer
+from src.infrastructure.station_serializer import station_to_dict
 
 
 MISSING_TEXT = "Non disponible"
 
+# Fenêtre de regroupement des lectures chargées (secondes)
+LOADED_BATCH_WINDOW_SECONDS = 0.05
+
+# Événement virtuel généré (depuis n'importe quel thread) à l'arrivée d'un résultat
+RESULT_EVENT = "<<MeteoResult>>"
+
+# Intervalle de scrutation si Tcl n'est pas compilé avec les threads
+FALLBACK_POLL_MS = 150
+
+# Nombre de chargements de stations exécutés en parallèle
+JOB_WORKERS = 4
+
+# Genres de demandes du pool partagé (clé = (genre, station)) : un clic de
+# l'utilisateur passe devant les rafraîchissements du tableau de bord
+JOB_STATION = "station"
+JOB_DASHBOARD = "dashboard"
+
+# Tableau de bord : colonnes (identifiant, en-tête, largeur en pixels)
+DASHBOARD_COLUMNS = (
+    ("timestamp", "Horodatage", 190),
+    ("temperature", "Temp. (°C)", 75),
+    ("humidity", "Humidité (%)", 85),
+    ("pressure", "Pression (hPa)", 95),
+    ("rain", "Pluie (mm)", 70),
+    ("wind", "Vent (km/h)", 75),
+    ("direction", "Dir. (°)", 55),
+    ("status", "État", 110),
+)
+DASHBOARD_REFRESH_MS = 30_000
+# Fenêtre de regroupement des stations rafraîchies (secondes)
+DASHBOARD_BATCH_WINDOW_SECONDS = 0.2
+DASHBOARD_WAITING_ROW = (MISSING_TEXT,) * (len(DASHBOARD_COLUMNS) - 1) + ("En attente",)
+
 
 def fmt_value(text: Optional[str]) -> str:
     """
@@ -61,45 +113,166 @@ def fmt_number(value, unit: str = "", nd: int = 1) -> str:
     return f"{float_value:.{nd}f}{unit}"
 
 
+def tcl_is_threaded(root: tk.Misc) -> bool:
+    """
+    Indique si l'interpréteur Tcl est compilé avec le support des threads.
+
+    Args:
+        root: widget racine Tkinter
+
+    Returns:
+        True si event_generate peut être appelé depuis un autre thread.
+    """
+    try:
+        return root.tk.eval("set tcl_platform(threaded)") == "1"
+    except tk.TclError:
+        return False
+
+
+def dashboard_row(
+    result: StationFetchResult, previous: Optional[Sequence[str]] = None
+) -> tuple[str, ...]:
+    """
+    Formate le résultat d'une station en cellules du tableau de bord.
+
+    En cas d'erreur ou d'absence de données, les dernières valeurs
+    affichées sont conservées et seul l'état change.
+
+    Args:
+        result: résultat du chargement groupé
+        previous: cellules actuellement affichées pour la station
+
+    Returns:
+        Cellules dans l'ordre de DASHBOARD_COLUMNS.
+    """
+    if result.station is None:
+        status = "Erreur" if result.error is not None else "Aucune donnée"
+        kept = tuple(previous or DASHBOARD_WAITING_ROW)[:-1]
+        return kept + (status,)
+
+    values = station_to_dict(result.station)
+    return (
+        fmt_value(values["timestamp"]),
+        fmt_number(values["temperature_c"]),
+        fmt_number(values["humidity_pct"], nd=0),
+        fmt_number(values["pressure_hpa"]),
+        fmt_number(values["rain_mm"]),
+        fmt_number(values["wind_speed"]),
+        fmt_number(values["wind_direction_deg"], nd=0),
+        "OK",
+    )
+
+
+def changed_cells(
+    previous: Sequence[str], current: Sequence[str]
+) -> list[tuple[int, str]]:
+    """
+    Retourne les cellules qui diffèrent entre deux lignes.
+
+    Args:
+        previous: cellules affichées
+        current: nouvelles cellules
+
+    Returns:
+        Liste (indice de colonne, nouvelle valeur).
+    """
+    return [
+        (index, new)
+        for index, (old, new) in enumerate(zip_longest(previous, current))
+        if old != new
+    ]
+
+
 class MeteoWorker:  # pylint: disable=too-few-public-methods
     """
-    Worker consommant une file de jobs et publiant des événements.
+    Chargement d'une station et publication du résultat.
 
-    Le worker tourne dans un thread séparé. Il appelle le service métier
-    puis publie ReadingLoaded / ReadingFailed via l'EventBus.
+    run() est exécuté par les threads du JobPool. Il appelle le service
+    métier puis publie ReadingLoaded / ReadingFailed (station choisie) ou
+    StationsRefreshed (tableau de bord) via l'EventBus.
     """
 
-    def __init__(
-        self,
-        service: StationDirectoryService,
-        bus: EventBus,
-        job_queue: Queue[str],
-    ):
+    def __init__(self, service: StationDirectoryService, bus: EventBus):
         """
         Initialise le worker.
 
         Args:
             service: service applicatif de récupération météo
             bus: bus d'événements (Observer)
-            job_queue: file des stations à charger
         """
         self._service = service
         self._bus = bus
-        self._job_queue = job_queue
 
-    def run_forever(self) -> None:
+    def run(self, job: tuple[str, str]) -> None:
         """
-        Boucle infinie consommant les jobs et publiant des événements.
+        Exécute une demande du pool partagé.
+
+        Args:
+            job: (JOB_STATION ou JOB_DASHBOARD, nom de la station)
         """
-        while True:
-            station = self._job_queue.get()
-            try:
-                data = self._service.get_latest_for_station(station)
-                self._bus.publish(ReadingLoaded(station=station, data=data))
-            except (RuntimeError, ValueError) as exc:
-                self._bus.publish(ReadingFailed(station=station, error=str(exc)))
-            finally:
-                self._job_queue.task_done()
+        kind, station = job
+        if kind == JOB_DASHBOARD:
+            self.refresh(station)
+        else:
+            self.load(station)
+
+    def fail(self, job: tuple[str, str], exc: Exception) -> None:
+        """
+        Publie l'échec inattendu d'une demande (erreur non prévue par load
+        ou refresh, remontée par le JobPool) : l'UI n'attend pas un
+        résultat qui n'arrivera jamais.
+
+        Args:
+            job: (JOB_STATION ou JOB_DASHBOARD, nom de la station)
+            exc: exception levée par la demande
+        """
+        kind, station = job
+        if kind == JOB_DASHBOARD:
+            result = StationFetchResult(name=station, station=None, error=exc)
+            self._bus.publish(StationsRefreshed(results=(result,)))
+        else:
+            self._bus.publish(ReadingFailed(station=station, error=repr(exc)))
+
+    def load(self, station: str) -> None:
+        """
+        Charge une station et publie un événement (ReadingFailed en cas
+        d'erreur, afin que l'UI réactive le bouton).
+
+        Args:
+            station: nom de la station
+        """
+        try:
+            data = self._service.get_latest_for_station(station)
+            self._bus.publish(ReadingLoaded(station=station, data=data))
+        except (OSError, RuntimeError, ValueError) as exc:
+            # OSError : erreurs réseau de requests (ConnectionError, Timeout)
+            self._bus.publish(ReadingFailed(station=station, error=str(exc)))
+
+    def refresh(self, station: str) -> None:
+        """
+        Charge une station du tableau de bord et publie StationsRefreshed
+        (l'erreur éventuelle est portée par le résultat).
+
+        Args:
+            station: nom de la station
+        """
+        try:
+            result = StationFetchResult(
+                name=station, station=self._service.get_latest_for_station(station)
+            )
+        except (OSError, RuntimeError, ValueError) as exc:
+            result = StationFetchResult(name=station, station=None, error=exc)
+        self._bus.publish(StationsRefreshed(results=(result,)))
+
+    def load_catalog(self) -> None:
+        """
+        Charge la liste des stations et publie CatalogLoaded.
+        """
+        try:
+            stations = tuple(self._service.get_station_names())
+        except (OSError, RuntimeError, ValueError):
+            stations = ()
+        self._bus.publish(CatalogLoaded(stations=stations))
 
 
 # pylint: disable=too-many-instance-attributes,too-few-public-methods
@@ -108,70 +281,116 @@ class MeteoApp:
     Application Tkinter.
 
     Cette classe contient l'état UI (widgets) et orchestre :
-    - la soumission de jobs dans une Queue
+    - la soumission de jobs dans un JobPool unique (station choisie et
+      tableau de bord, servis par priorité)
     - la réception d'événements via un EventBus
-    - l'actualisation de l'affichage
+    - l'actualisation de l'affichage (station choisie, tableau de bord)
     """
 
-    def __init__(self, service: StationDirectoryService):
+    def __init__(self, service: StationDirectoryService, workers: int = JOB_WORKERS):
         """
         Initialise l'application.
 
         Args:
             service: service applicatif principal
+            workers: nombre de chargements exécutés en parallèle
         """
         self.service = service
 
-        self.history: LinkedList[str] = LinkedList()
         self.history_max_size = 20
+        self.history: RingBuffer[str] = RingBuffer(self.history_max_size)
 
-        self.job_queue: Queue[str] = Queue()
         self.bus = EventBus()
+        worker = MeteoWorker(service=self.service, bus=self.bus)
+        # Un seul pool : les demandes de l'utilisateur (PRIORITY_USER)
+        # passent devant les rafraîchissements en attente (PRIORITY_BACKGROUND)
+        self.jobs: JobPool[tuple[str, str]] = JobPool(
+            worker.run,
+            workers=workers,
+            name="meteo-worker",
+            on_error=worker.fail,
+        )
+        self._dashboard_rows: dict[str, tuple[str, ...]] = {}
+        self._dashboard_timer: Optional[str] = None
+        # Dernière station demandée par l'utilisateur (annulée si remplacée)
+        self._requested: Optional[str] = None
         self.result_queue: Queue[object] = Queue()
+        self._wake_lock = Lock()
+        self._wake_pending = False
 
         self.root = tk.Tk()
         self.root.title("Météo – Stations Toulouse")
-        self.root.geometry("650x540")
+        self.root.geometry("900x620")
         self.root.resizable(False, False)
 
+        # Réveil sur événement : la boucle Tk reste inactive sans résultat.
+        # event_generate n'est sûr depuis un autre thread qu'avec un Tcl
+        # multi-thread ; sinon, repli sur la scrutation périodique.
+        self._event_driven = tcl_is_threaded(self.root)
+        if self._event_driven:
+            self.root.bind(RESULT_EVENT, lambda _evt: self._drain_results())
+        else:
+            self.root.after(FALLBACK_POLL_MS, self._poll_results)
+
         self._build_ui()
+        self._build_station_tab(self.station_tab)
+        self._build_dashboard(self.dashboard_tab)
         self._wire_observers()
-        self._start_worker()
-
-        self.root.after(150, self._poll_results)
+        self.jobs.start()
+
+        # Le catalogue est chargé une fois la boucle Tk démarrée, dans un
+        # thread : la fenêtre s'affiche sans attendre la liste des stations.
+        self.root.after_idle(
+            lambda: Thread(
+                target=worker.load_catalog, name="meteo-catalog", daemon=True
+            ).start()
+        )
 
     def _wire_observers(self) -> None:
         """
         Abonne l'UI aux événements du bus.
 
         Les handlers pushent les événements dans result_queue afin que
-        l'UI les traite dans le thread Tkinter.
+        l'UI les traite dans le thread Tkinter. Les lectures chargées sont
+        regroupées par fenêtre (dernière lecture par station) : un
+        rafraîchissement en masse donne une seule mise à jour de l'UI.
         """
 
-        def on_loaded(evt: ReadingLoaded) -> None:
-            self.result_queue.put(evt)
+        def on_loaded(events: list[ReadingLoaded]) -> None:
+            self.result_queue.put(events)
+            self._wake_ui()
 
         def on_failed(evt: ReadingFailed) -> None:
             self.result_queue.put(evt)
+            self._wake_ui()
 
-        self.bus.subscribe(ReadingLoaded, on_loaded)
-        self.bus.subscribe(ReadingFailed, on_failed)
+        def on_refreshed(events: list[StationsRefreshed]) -> None:
+            results = tuple(result for evt in events for result in evt.results)
+            self.result_queue.put(StationsRefreshed(results=results))
+            self._wake_ui()
 
-    def _start_worker(self) -> None:
-        """
-        Démarre le worker dans un thread daemon.
-        """
-        worker = MeteoWorker(
-            service=self.service,
-            bus=self.bus,
-            job_queue=self.job_queue,
+        def on_catalog(evt: CatalogLoaded) -> None:
+            self.result_queue.put(evt)
+            self._wake_ui()
+
+        self.bus.subscribe_batch(
+            ReadingLoaded,
+            on_loaded,
+            window_seconds=LOADED_BATCH_WINDOW_SECONDS,
+            key=lambda evt: evt.station,
         )
-        thread = Thread(target=worker.run_forever, daemon=True)
-        thread.start()
+        self.bus.subscribe(ReadingFailed, on_failed)
+        self.bus.subscribe_batch(
+            StationsRefreshed,
+            on_refreshed,
+            window_seconds=DASHBOARD_BATCH_WINDOW_SECONDS,
+            key=lambda evt: tuple(result.name for result in evt.results),
+        )
+        self.bus.subscribe(CatalogLoaded, on_catalog)
 
     def _build_ui(self) -> None:
         """
-        Construit l'interface graphique (widgets Tkinter).
+        Construit l'interface graphique (titre et onglets).
         """
         title = ttk.Label(
             self.root,
@@ -180,7 +399,25 @@ class MeteoApp:
         )
         title.pack(pady=15)
 
-        frame_select = ttk.Frame(self.root)
+        self.notebook = ttk.Notebook(self.root)
+        self.notebook.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+
+        self.station_tab = ttk.Frame(self.notebook)
+        self.notebook.add(self.station_tab, text="Station")
+
+        self.dashboard_tab = ttk.Frame(self.notebook)
+        self.notebook.add(self.dashboard_tab, text="Tableau de bord")
+
+        self.notebook.bind("<<NotebookTabChanged>>", lambda _evt: self._on_tab_changed())
+
+    def _build_station_tab(self, tab: ttk.Frame) -> None:
+        """
+        Construit l'onglet de consultation d'une station.
+
+        Args:
+            tab: cadre de l'onglet
+        """
+        frame_select = ttk.Frame(tab)
         frame_select.pack(pady=10)
 
         ttk.Label(frame_select, text="Station :").pack(side=tk.LEFT, padx=5)
@@ -194,24 +431,17 @@ class MeteoApp:
         )
         self.station_combo.pack(side=tk.LEFT)
 
-        stations = self.service.get_station_names()
-        self.station_combo["values"] = stations
-        if stations:
-            self.station_combo.current(0)
-        else:
-            messagebox.showwarning("Stations", "Aucune station disponible.")
-
         self.fetch_button = ttk.Button(
-            self.root,
+            tab,
             text="Afficher la météo",
             command=self._enqueue_job,
         )
         self.fetch_button.pack(pady=10)
 
-        self.status_label = ttk.Label(self.root, text="")
+        self.status_label = ttk.Label(tab, text="Chargement des stations...")
         self.status_label.pack(pady=2)
 
-        self.result_frame = ttk.LabelFrame(self.root, text="Dernière mesure")
+        self.result_frame = ttk.LabelFrame(tab, text="Dernière mesure")
         self.result_frame.pack(fill="x", padx=20, pady=10)
 
         self.labels = {}
@@ -233,7 +463,7 @@ class MeteoApp:
             self.labels[field] = value
 
         self.history_frame = ttk.LabelFrame(
-            self.root,
+            tab,
             text="Historique (dernières consultations)",
         )
         self.history_frame.pack(fill="both", expand=False, padx=20, pady=10)
@@ -241,9 +471,123 @@ class MeteoApp:
         self.history_listbox = tk.Listbox(self.history_frame, height=6)
         self.history_listbox.pack(fill="both", padx=10, pady=8)
 
+    def _build_dashboard(self, tab: ttk.Frame) -> None:
+        """
+        Construit l'onglet tableau de bord (une ligne par station).
+
+        Args:
+            tab: cadre de l'onglet
+        """
+        self.dashboard_status = ttk.Label(tab, text="")
+        self.dashboard_status.pack(anchor="w", padx=10, pady=6)
+
+        self.dashboard_tree = ttk.Treeview(
+            tab,
+            columns=[column for column, _, _ in DASHBOARD_COLUMNS],
+        )
+        self.dashboard_tree.heading("#0", text="Station")
+        self.dashboard_tree.column("#0", width=200, stretch=False)
+        for column, heading, width in DASHBOARD_COLUMNS:
+            self.dashboard_tree.heading(column, text=heading)
+            self.dashboard_tree.column(column, width=width, anchor="center")
+
+        scrollbar = ttk.Scrollbar(
+            tab, orient=tk.VERTICAL, command=self.dashboard_tree.yview
+        )
+        self.dashboard_tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill="y")
+        self.dashboard_tree.pack(fill="both", expand=True, padx=(10, 0), pady=(0, 10))
+
+    def _populate_stations(self, stations: Sequence[str]) -> None:
+        """
+        Remplit la liste déroulante et le tableau de bord avec le catalogue.
+
+        Args:
+            stations: noms des stations disponibles
+        """
+        self.status_label.config(text="")
+        self.station_combo["values"] = list(stations)
+        if not stations:
+            messagebox.showwarning("Stations", "Aucune station disponible.")
+            return
+        self.station_combo.current(0)
+
+        for name in stations:
+            if name not in self._dashboard_rows:
+                self.dashboard_tree.insert(
+                    "", tk.END, iid=name, text=name, values=DASHBOARD_WAITING_ROW
+                )
+                self._dashboard_rows[name] = DASHBOARD_WAITING_ROW
+
+        if self._dashboard_timer is not None:
+            # Tableau de bord déjà affiché : chargement des nouvelles lignes
+            self._refresh_dashboard()
+
+    def _on_tab_changed(self) -> None:
+        """
+        Démarre le rafraîchissement périodique quand le tableau de bord
+        est affiché, l'arrête sinon.
+        """
+        if self.notebook.select() == str(self.dashboard_tab):
+            self._refresh_dashboard()
+        elif self._dashboard_timer is not None:
+            self.root.after_cancel(self._dashboard_timer)
+            self._dashboard_timer = None
+
+    def _refresh_dashboard(self) -> None:
+        """
+        Demande le rechargement de chaque station (priorité d'arrière-plan)
+        et planifie le suivant.
+
+        Une demande par station : un clic de l'utilisateur est servi dès
+        qu'un worker se libère, sans attendre la fin du rafraîchissement.
+        """
+        if self._dashboard_timer is not None:
+            self.root.after_cancel(self._dashboard_timer)
+        for name in self._dashboard_rows:
+            self.jobs.submit((JOB_DASHBOARD, name), PRIORITY_BACKGROUND)
+        self._dashboard_timer = self.root.after(
+            DASHBOARD_REFRESH_MS, self._refresh_dashboard
+        )
+
+    def _render_dashboard(self, results: Iterable[StationFetchResult]) -> None:
+        """
+        Met à jour le tableau de bord : seules les cellules modifiées sont
+        redessinées.
+
+        Args:
+            results: résultats des stations rafraîchies (un lot du bus)
+        """
+        updated = 0
+        for result in results:
+            previous = self._dashboard_rows.get(result.name)
+            row = dashboard_row(result, previous)
+            if previous is None:
+                self.dashboard_tree.insert(
+                    "", tk.END, iid=result.name, text=result.name, values=row
+                )
+            else:
+                cells = changed_cells(previous, row)
+                for index, value in cells:
+                    self.dashboard_tree.set(result.name, DASHBOARD_COLUMNS[index][0], value)
+                if not cells:
+                    continue
+            self._dashboard_rows[result.name] = row
+            updated += 1
+
+        self.dashboard_status.config(
+            text=(
+                f"Mis à jour à {datetime.now():%H:%M:%S} – "
+                f"{updated} station(s) modifiée(s)"
+            )
+        )
+
     def _enqueue_job(self) -> None:
         """
-        Envoie une demande de chargement dans la file de jobs.
+        Envoie une demande de chargement (priorité utilisateur) au pool.
+
+        Une demande précédente pour une autre station, encore en attente,
+        est annulée : seule la dernière sélection est affichée.
         """
         station = self.station_var.get()
         if not station:
@@ -252,16 +596,74 @@ class MeteoApp:
 
         self.fetch_button.config(state="disabled")
         self.status_label.config(text="Chargement en cours...")
-        self.job_queue.put(station)
+        if self._requested not in (None, station):
+            self.jobs.cancel((JOB_STATION, self._requested))
+        self._requested = station
+        self.jobs.submit((JOB_STATION, station), PRIORITY_USER)
+
+    def _wake_ui(self) -> None:
+        """
+        Signale au thread Tkinter qu'un résultat est disponible.
+
+        Appelé depuis les threads producteurs : un seul événement virtuel
+        est en attente à la fois, les résultats arrivés entre-temps sont
+        traités par le même réveil.
+        """
+        if not self._event_driven:
+            return
+        with self._wake_lock:
+            if self._wake_pending:
+                return
+            self._wake_pending = True
+        try:
+            self.root.event_generate(RESULT_EVENT, when="tail")
+        except (tk.TclError, RuntimeError):
+            # Le résultat est déjà en file : sans réveil, il attendrait le
+            # prochain événement. Repli sur la scrutation périodique.
+            with self._wake_lock:
+                self._wake_pending = False
+            self._fall_back_to_polling()
+
+    def _fall_back_to_polling(self) -> None:
+        """
+        Abandonne le réveil par événement virtuel au profit de la
+        scrutation périodique (FALLBACK_POLL_MS).
+        """
+        with self._wake_lock:
+            if not self._event_driven:
+                return
+            self._event_driven = False
+        try:
+            self.root.after(FALLBACK_POLL_MS, self._poll_results)
+        except (tk.TclError, RuntimeError):
+            # Fenêtre détruite : plus rien à afficher
+            pass
 
     def _poll_results(self) -> None:
         """
-        Poll la file des résultats et met à jour l'UI.
+        Scrute périodiquement la file des résultats (repli sans threads Tcl).
         """
+        self._drain_results()
+        self.root.after(FALLBACK_POLL_MS, self._poll_results)
+
+    def _drain_results(self) -> None:
+        """
+        Traite tous les résultats en attente et met à jour l'UI.
+        """
+        with self._wake_lock:
+            self._wake_pending = False
         try:
             while True:
                 evt = self.result_queue.get_nowait()
 
+                if isinstance(evt, CatalogLoaded):
+                    self._populate_stations(evt.stations)
+                    continue
+
+                if isinstance(evt, StationsRefreshed):
+                    self._render_dashboard(evt.results)  # type: ignore[arg-type]
+                    continue
+
                 self.fetch_button.config(state="normal")
                 self.status_label.config(text="")
 
@@ -269,33 +671,41 @@ class MeteoApp:
                     messagebox.showerror("Erreur", evt.error)
                     continue
 
-                if isinstance(evt, ReadingLoaded):
-                    if evt.data is None:
-                        messagebox.showwarning(
-                            "Aucune donnée",
-                            "Aucune donnée disponible pour cette station.",
-                        )
-                        continue
-                    self._render_data(evt.station, evt.data)
+                if isinstance(evt, list):
+                    self._render_loaded(evt)
 
         except Empty:
             pass
-        finally:
-            self.root.after(150, self._poll_results)
 
-    def _push_history(self, station_name: str, timestamp_str: str) -> None:
+    def _render_loaded(self, events: list[ReadingLoaded]) -> None:
         """
-        Ajoute une entrée à l'historique (liste chaînée), taille limitée.
+        Traite un lot de lectures chargées : chacune est ajoutée à
+        l'historique, seule la dernière est affichée.
+
+        Args:
+            events: lot livré par le bus (une lecture par station)
         """
-        entry = f"{station_name} | {timestamp_str}"
-        self.history.prepend(entry)
+        loaded = [evt for evt in events if evt.data is not None]
+        if len(loaded) < len(events):
+            messagebox.showwarning(
+                "Aucune donnée",
+                "Aucune donnée disponible pour cette station.",
+            )
+        if not loaded:
+            return
 
-        if len(self.history) > self.history_max_size:
-            entries = self.history.to_list()[: self.history_max_size]
-            self.history = LinkedList()
-            for item in reversed(entries):
-                self.history.prepend(item)
+        for evt in loaded[:-1]:
+            self.history.push(
+                f"{evt.station} | {getattr(evt.data, 'timestamp', '')}"
+            )
+        self._render_data(loaded[-1].station, loaded[-1].data)
 
+    def _push_history(self, station_name: str, timestamp_str: str) -> None:
+        """
+        Ajoute une entrée à l'historique (tampon circulaire) : au-delà de
+        history_max_size, l'entrée la plus ancienne est évincée en O(1).
+        """
+        self.history.push(f"{station_name} | {timestamp_str}")
         self._refresh_history_view()
 
     def _refresh_history_view(self) -> None:
@@ -341,6 +751,11 @@ class MeteoApp:
 
     def run(self) -> None:
         """
-        Lance la boucle principale Tkinter.
+        Lance la boucle principale Tkinter, puis arrête les workers et
+        ferme le service (écriture du cache disque) à la fermeture.
         """
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            self.jobs.stop(timeout=1)
+            self.service.close()
@@ -0,0 +1,121 @@
+"""
+Tests unitaires du service AsyncStationDirectoryService.
+
+Ces tests vérifient :
+- l'utilisation du cache en mode asynchrone
+- le chargement simultané de plusieurs stations dans une seule boucle
+- l'isolation des erreurs par station
+"""
+
+import asyncio
+
+from test_station_directory_service import FakeCatalog, FakeRawData
+
+from src.application.async_station_directory_service import (
+    AsyncStationDirectoryService,
+)
+from src.domain.station import Station
+
+
+class FakeAsyncClient:  # pylint: disable=too-few-public-methods
+    """
+    Faux client asynchrone mesurant le nombre d'appels simultanés.
+    """
+
+    def __init__(self, raw_data: FakeRawData):
+        """
+        Initialise le client fake.
+
+        Args:
+            raw_data: données brutes à retourner lors de fetch()
+        """
+        self._raw_data = raw_data
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def fetch(self, endpoint: str):
+        """
+        Simule un appel API non bloquant.
+
+        Raises:
+            RuntimeError: pour l'endpoint "endpoint://boom"
+        """
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if endpoint == "endpoint://boom":
+            raise RuntimeError("boom")
+        return self._raw_data
+
+
+def test_async_service_uses_cache(sample_records):
+    """
+    Vérifie que le service asynchrone retourne une Station et utilise le cache.
+    """
+    client = FakeAsyncClient(FakeRawData(sample_records))
+    service = AsyncStationDirectoryService(
+        catalog=FakeCatalog({"A": "endpoint://a"}),
+        client=client,
+        cache_ttl_seconds=9999,
+    )
+
+    async def scenario():
+        first = await service.get_latest_for_station("A")
+        second = await service.get_latest_for_station("A")
+        unknown = await service.get_latest_for_station("UNKNOWN")
+        return first, second, unknown
+
+    first, second, unknown = asyncio.run(scenario())
+
+    assert isinstance(first, Station)
+    assert second is first
+    assert unknown is None
+    assert client.calls == 1
+
+
+def test_async_service_bulk_fetch_is_concurrent(sample_records):
+    """
+    Vérifie que toutes les stations sont interrogées simultanément.
+    """
+    stations = {f"S{i}": f"endpoint://{i}" for i in range(20)}
+    stations["KO"] = "endpoint://boom"
+    client = FakeAsyncClient(FakeRawData(sample_records))
+    service = AsyncStationDirectoryService(
+        catalog=FakeCatalog(stations),
+        client=client,
+    )
+
+    async def scenario():
+        return [r async for r in service.get_latest_for_stations(stations)]
+
+    results = {r.name: r for r in asyncio.run(scenario())}
+
+    assert len(results) == 21
+    assert client.max_in_flight == 21
+    assert isinstance(results["S0"].station, Station)
+    assert isinstance(results["KO"].error, RuntimeError)
+
+
+def test_async_service_coalesces_concurrent_misses(sample_records):
+    """
+    Vérifie que des coroutines simultanées pour la même station ne
+    déclenchent qu'un seul appel API.
+    """
+    client = FakeAsyncClient(FakeRawData(sample_records))
+    service = AsyncStationDirectoryService(
+        catalog=FakeCatalog({"A": "endpoint://a"}),
+        client=client,
+    )
+
+    async def scenario():
+        return await asyncio.gather(
+            *(service.get_latest_for_station("A") for _ in range(10))
+        )
+
+    results = asyncio.run(scenario())
+
+    assert client.calls == 1
+    assert all(station is results[0] for station in results)
@@ -0,0 +1,210 @@
+"""
+Tests unitaires de l'agrégation en masse (colonnes typées).
+
+Ces tests vérifient, avec et sans NumPy :
+- la conversion d'un lot en colonnes (NaN, conversion Pa -> hPa)
+- la dernière valeur par champ, identique à aggregate_latest_values
+- les statistiques globales et par fenêtre de temps
+- l'équivalence des chemins NumPy et Python pur sur un lot aléatoire
+- les horodatages naïfs lus comme UTC, quel que soit le fuseau local
+"""
+
+import math
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.domain.mesure.raw_data import RawMeteoData
+from src.infrastructure import bulk_aggregator
+from src.infrastructure.bulk_aggregator import (
+    bucket_rollups,
+    latest_values,
+    summarize,
+    to_columns,
+)
+from src.infrastructure.columnar_store import ColumnarStationStore
+from src.infrastructure.reading_aggregator import aggregate_latest_values
+
+RECORDS = [
+    {"heure_utc": "2026-01-20T10:30:00Z", "temperature_en_degre_c": 4.0, "pluie": 0.2},
+    {"heure_utc": "2026-01-20T09:15:00Z", "temperature_en_degre_c": 2.0, "pluie": 0.4},
+    {"heure_utc": "2026-01-20T10:00:00Z", "pression": 101325, "pluie": 0.0},
+    {"heure_utc": "2026-01-20T09:45:00Z", "temperature_en_degre_c": 1.0},
+    {"humidite": 55},
+]
+
+
+@pytest.fixture(
+    name="use_numpy",
+    params=[
+        False,
+        pytest.param(
+            True,
+            marks=pytest.mark.skipif(
+                not bulk_aggregator.HAS_NUMPY, reason="NumPy non installé"
+            ),
+        ),
+    ],
+)
+def fixture_use_numpy(request):
+    """
+    Exécute chaque test en Python pur puis, si disponible, avec NumPy.
+    """
+    return request.param
+
+
+def test_to_columns_converts_missing_values_and_pressure(use_numpy):
+    """
+    Vérifie les colonnes produites : NaN pour les manques, pression en hPa.
+    """
+    columns = to_columns(RawMeteoData(RECORDS), use_numpy=use_numpy)
+
+    assert len(columns) == 5
+    assert math.isnan(columns.timestamps[4])
+    assert math.isnan(columns.columns["temperature_c"][2])
+    assert abs(columns.columns["pressure_hpa"][2] - 1013.25) < 1e-6
+
+
+def test_latest_values_matches_reading_aggregator(use_numpy, sample_records):
+    """
+    Vérifie que la dernière valeur par champ est celle de l'agrégateur.
+    """
+    for records in (RECORDS, sample_records):
+        expected = aggregate_latest_values(records)
+        result = latest_values(to_columns(RawMeteoData(records), use_numpy=use_numpy))
+        assert result == expected
+
+
+def test_summarize_and_hourly_rollups(use_numpy):
+    """
+    Vérifie les statistiques globales et les cumuls horaires.
+    """
+    columns = to_columns(RawMeteoData(RECORDS), use_numpy=use_numpy)
+
+    temperature = summarize(columns)["temperature_c"]
+    assert (temperature.count, temperature.minimum, temperature.maximum) == (3, 1.0, 4.0)
+    assert temperature.mean == pytest.approx(7.0 / 3)
+
+    rollups = bucket_rollups(columns, 3600)
+    assert [start for start, _ in rollups] == [
+        datetime(2026, 1, 20, 9, tzinfo=timezone.utc),
+        datetime(2026, 1, 20, 10, tzinfo=timezone.utc),
+    ]
+    nine, ten = (stats for _, stats in rollups)
+    assert nine["temperature_c"].mean == pytest.approx(1.5)
+    assert nine["rain_mm"].total == pytest.approx(0.4)
+    assert ten["rain_mm"].total == pytest.approx(0.2)
+    assert ten["humidity_pct"].count == 0 and ten["humidity_pct"].mean is None
+
+
+def _random_records(count: int, seed: int = 7) -> list[dict]:
+    """
+    Génère un lot mélangé : valeurs manquantes, horodatages répétés et
+    enregistrements non datés.
+    """
+    rng = random.Random(seed)
+    start = datetime(2026, 1, 20, tzinfo=timezone.utc)
+    records = []
+    for _ in range(count):
+        record = {
+            "temperature_en_degre_c": rng.choice((None, rng.uniform(-5, 35))),
+            "humidite": rng.choice((None, rng.randint(20, 100))),
+            "pression": rng.choice((None, rng.randint(98000, 103000), 1012.5)),
+            "pluie": rng.choice((None, 0.0, rng.uniform(0, 5))),
+            "force_moyenne_du_vecteur_vent": rng.choice((None, rng.randint(0, 40))),
+            "direction_du_vecteur_vent_moyen": rng.choice((None, rng.randint(0, 359))),
+        }
+        if rng.random() > 0.05:
+            stamp = start + timedelta(minutes=15 * rng.randrange(count // 2))
+            record["heure_utc"] = stamp.isoformat()
+        records.append(record)
+    return records
+
+
+def _stats_tuple(stats):
+    """
+    Convertit des FieldStats en tuple comparable (somme arrondie).
+    """
+    return (stats.count, stats.minimum, stats.maximum, round(stats.total, 6))
+
+
+@pytest.mark.skipif(not bulk_aggregator.HAS_NUMPY, reason="NumPy non installé")
+def test_numpy_and_python_paths_agree_on_random_batch():
+    """
+    Vérifie que le chemin vectorisé (reduceat) et le chemin Python pur
+    donnent les mêmes résultats sur un même lot.
+    """
+    raw = RawMeteoData(_random_records(2000))
+    python = to_columns(raw, use_numpy=False)
+    vectorized = to_columns(raw, use_numpy=True)
+    assert vectorized.vectorized and not python.vectorized
+
+    assert latest_values(vectorized) == latest_values(python)
+    assert latest_values(python) == aggregate_latest_values(raw.data)
+
+    assert {
+        name: _stats_tuple(stats) for name, stats in summarize(vectorized).items()
+    } == {name: _stats_tuple(stats) for name, stats in summarize(python).items()}
+
+    for seconds in (900, 3600, 86400):
+        expected = bucket_rollups(python, seconds)
+        result = bucket_rollups(vectorized, seconds)
+        assert [start for start, _ in result] == [start for start, _ in expected]
+        for (_, got), (_, want) in zip(result, expected):
+            assert {k: _stats_tuple(v) for k, v in got.items()} == {
+                k: _stats_tuple(v) for k, v in want.items()
+            }
+
+
+@pytest.fixture(name="local_timezone")
+def fixture_local_timezone(monkeypatch):
+    """
+    Place le processus dans un fuseau local décalé de UTC le temps du test.
+    """
+    if not hasattr(time, "tzset"):
+        pytest.skip("time.tzset indisponible sur cette plateforme")
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def test_naive_timestamps_are_read_as_utc(use_numpy, local_timezone):  # pylint: disable=unused-argument
+    """
+    Vérifie qu'un heure_utc sans fuseau n'est pas décalé de l'heure locale :
+    même résultat (naïf) que aggregate_latest_values, fenêtres alignées
+    sur l'heure UTC.
+    """
+    records = [
+        {"heure_utc": "2026-01-20T10:30:00", "temperature_en_degre_c": 4.0},
+        {"heure_utc": "2026-01-20T09:45:00", "humidite": 66},
+    ]
+    columns = to_columns(RawMeteoData(records), use_numpy=use_numpy)
+
+    latest = latest_values(columns)
+    assert latest == aggregate_latest_values(records)
+    assert latest["timestamp"] == datetime(2026, 1, 20, 10, 30)
+    assert [start for start, _ in bucket_rollups(columns, 3600)] == [
+        datetime(2026, 1, 20, 9, tzinfo=timezone.utc),
+        datetime(2026, 1, 20, 10, tzinfo=timezone.utc),
+    ]
+
+    store = ColumnarStationStore()
+    store.ingest("A", RawMeteoData(records))
+    assert store.range("A", start=datetime(2026, 1, 20, 10)).values(
+        "temperature_c"
+    ) == [4.0]
+
+
+def test_numpy_required_when_forced(monkeypatch):
+    """
+    Vérifie l'erreur explicite lorsque NumPy est exigé mais absent.
+    """
+    monkeypatch.setattr(bulk_aggregator, "HAS_NUMPY", False)
+
+    with pytest.raises(RuntimeError):
+        to_columns(RawMeteoData(RECORDS), use_numpy=True)
+    assert not to_columns(RawMeteoData(RECORDS)).vectorized
@@ -0,0 +1,171 @@
+"""
+Tests unitaires de l'interface en ligne de commande.
+
+Ces tests vérifient :
+- les sorties JSON, CSV et tableau
+- le mode --watch (itérations, en-tête CSV unique)
+- la validation des stations et le code de retour
+"""
+
+import io
+import json
+import subprocess
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from src.application.station_directory_service import StationDirectoryService
+from src.cli import FIELDS, NO_DATA, main
+from src.domain.lru_cache import LruTtlCache
+from src.infrastructure.meteo_clients import MockMeteoClient
+
+
+@pytest.fixture(name="service")
+def fixture_service(sample_records):
+    """
+    Fournit un service sans réseau : "A" et "B" renvoient des données,
+    "Vide" n'a pas d'endpoint exploitable.
+    """
+    payload = SimpleNamespace(data=sample_records)
+    catalog = SimpleNamespace(get_stations=lambda: {"A": "a", "B": "b", "Vide": ""})
+    return StationDirectoryService(catalog=catalog, client=MockMeteoClient(payload))
+
+
+def run(service, *argv):
+    """
+    Exécute la CLI et retourne (code de retour, sortie).
+    """
+    out = io.StringIO()
+    code = main(list(argv), service=service, out=out, sleep=lambda _s: None)
+    return code, out.getvalue()
+
+
+def test_cli_json_output(service):
+    """
+    Vérifie la sortie JSON pour deux stations, dans l'ordre demandé.
+    """
+    code, output = run(service, "B", "A", "--format", "json")
+
+    rows = json.loads(output)
+    assert code == 0
+    assert [row["name"] for row in rows] == ["B", "A"]
+    assert tuple(rows[0]) == FIELDS
+    assert rows[0]["temperature_c"] == 12.3
+    assert rows[0]["pressure_hpa"] == 1013.25
+    assert rows[0]["error"] is None
+
+
+def test_cli_all_stations_reports_missing_data(service):
+    """
+    Vérifie --all et le code de retour quand une station n'a pas de données.
+    """
+    code, output = run(service, "--all", "--format", "csv")
+
+    lines = output.splitlines()
+    assert code == 1
+    assert lines[0] == ",".join(FIELDS)
+    assert len(lines) == 4
+    assert lines[3].startswith("Vide,") and lines[3].endswith(NO_DATA)
+
+
+def test_cli_watch_repeats_and_writes_csv_header_once(service):
+    """
+    Vérifie le mode --watch avec un nombre d'itérations borné.
+    """
+    code, output = run(service, "A", "--format", "csv", "--watch", "5", "--count", "3")
+
+    lines = output.splitlines()
+    assert code == 0
+    assert len(lines) == 4
+    assert lines.count(",".join(FIELDS)) == 1
+
+
+def test_cli_watch_does_not_print_stale_values(sample_records):
+    """
+    Vérifie qu'une itération de --watch après l'expiration du TTL affiche
+    les données rechargées, et non la valeur périmée du cache.
+    """
+    now = [1000.0]
+    payload = [SimpleNamespace(data=sample_records)]
+    service = StationDirectoryService(
+        catalog=SimpleNamespace(get_stations=lambda: {"A": "a"}),
+        client=SimpleNamespace(fetch=lambda _endpoint: payload[0]),
+        cache=LruTtlCache(ttl_seconds=60, stale_ttl_seconds=600, clock=lambda: now[0]),
+    )
+
+    def sleep(seconds):
+        now[0] += seconds
+        updated = [dict(record) for record in sample_records]
+        updated[1]["temperature_en_degre_c"] = 20.0
+        payload[0] = SimpleNamespace(data=updated)
+
+    out = io.StringIO()
+    argv = ["A", "--format", "json", "--watch", "120", "--count", "2"]
+    assert main(argv, service=service, out=out, sleep=sleep) == 0
+
+    passes = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [rows[0]["temperature_c"] for rows in passes] == [12.3, 20.0]
+
+
+def test_cli_table_and_list(service):
+    """
+    Vérifie le tableau texte et la liste des stations.
+    """
+    code, output = run(service, "A")
+    header, row = output.splitlines()
+    assert code == 0
+    assert header.split() == list(FIELDS)
+    assert row.split()[:3] == ["A", "2026-01-20T10:03:00+00:00", "12.3"]
+
+    assert run(service, "--list") == (0, "A\nB\nVide\n")
+
+
+def test_cli_rejects_unknown_station(service):
+    """
+    Vérifie qu'une station inconnue est une erreur d'usage.
+    """
+    with pytest.raises(SystemExit) as exc_info:
+        run(service, "Inconnue")
+    assert exc_info.value.code == 2
+
+
+@pytest.mark.parametrize("count", ["0", "-3"])
+def test_cli_rejects_count_below_one(service, count):
+    """
+    Vérifie que --count 0 ou négatif est une erreur d'usage (et ne lance
+    pas une boucle --watch sans fin).
+    """
+    with pytest.raises(SystemExit) as exc_info:
+        run(service, "A", "--watch", "1", "--count", count)
+    assert exc_info.value.code == 2
+
+
+def test_cli_does_not_import_tkinter():
+    """
+    Vérifie que la CLI (et la factory) n'importent pas Tkinter.
+    """
+    code = (
+        "import sys, src.cli; "
+        "sys.exit(1 if any(m.startswith('tkinter') for m in sys.modules) else 0)"
+    )
+    root = Path(__file__).resolve().parents[1]
+    result = subprocess.run([sys.executable, "-c", code], cwd=root, check=False)
+    assert result.returncode == 0
+
+
+def test_service_creation_defers_http_imports():
+    """
+    Vérifie que requests n'est importé qu'au premier appel réseau.
+    """
+    code = (
+        "import sys, src.cli; "
+        "from src.application.factory import AppFactory; "
+        "AppFactory.create_service().close(); "
+        "sys.exit(1 if any(m.startswith(('requests', 'urllib3')) "
+        "for m in sys.modules) else 0)"
+    )
+    root = Path(__file__).resolve().parents[1]
+    result = subprocess.run([sys.executable, "-c", code], cwd=root, check=False)
+    assert result.returncode == 0
@@ -0,0 +1,87 @@
+"""
+Tests unitaires du stockage colonnaire des séries temporelles.
+
+Ces tests vérifient :
+- la conversion des enregistrements en colonnes (NaN pour les manques)
+- la déduplication par horodatage et le maintien du tri
+- les tranches par intervalle de temps
+- la taille maximale par station
+"""
+
+import math
+from datetime import datetime, timezone
+
+from src.domain.mesure.raw_data import RawMeteoData
+from src.infrastructure.columnar_store import ColumnarStationStore
+
+
+def _record(minute: int, **values) -> dict:
+    """
+    Construit un enregistrement horodaté à 10:MM UTC.
+    """
+    return {"heure_utc": f"2026-01-20T10:{minute:02d}:00+00:00", **values}
+
+
+def _at(minute: int) -> datetime:
+    """
+    Retourne le datetime UTC correspondant à 10:MM.
+    """
+    return datetime(2026, 1, 20, 10, minute, tzinfo=timezone.utc)
+
+
+def test_ingest_builds_sorted_columns_with_nan():
+    """
+    Vérifie la conversion d'un lot (ordre de l'API) en colonnes triées.
+    """
+    store = ColumnarStationStore()
+    added = store.ingest(
+        "A",
+        RawMeteoData(
+            [
+                _record(15, temperature_en_degre_c=9.0, pression=101325),
+                _record(0, humidite=70),
+                {"pluie": 1.0},
+            ]
+        ),
+    )
+
+    series = store.range("A")
+
+    assert added == 2
+    assert series.datetimes() == [_at(0), _at(15)]
+    assert series.values("temperature_c") == [None, 9.0]
+    assert series.values("humidity_pct") == [70.0, None]
+    assert abs(series.columns["pressure_hpa"][1] - 1013.25) < 1e-6
+    assert math.isnan(series.columns["rain_mm"][0])
+
+
+def test_ingest_deduplicates_and_merges_out_of_order():
+    """
+    Vérifie que les horodatages connus sont ignorés et qu'un lot plus
+    ancien est inséré à sa place.
+    """
+    store = ColumnarStationStore()
+    store.ingest("A", RawMeteoData([_record(30, humidite=1), _record(15, humidite=2)]))
+
+    assert store.ingest("A", RawMeteoData([_record(30, humidite=99)])) == 0
+    assert store.ingest("A", RawMeteoData([_record(45, humidite=3)])) == 1
+    assert store.ingest("A", RawMeteoData([_record(0, humidite=4)])) == 1
+
+    series = store.range("A")
+    assert series.datetimes() == [_at(0), _at(15), _at(30), _at(45)]
+    assert series.values("humidity_pct") == [4.0, 2.0, 1.0, 3.0]
+
+
+def test_range_slices_and_bounds():
+    """
+    Vérifie les tranches [start, end[ et la taille maximale par station.
+    """
+    store = ColumnarStationStore(max_points_per_station=3)
+    store.ingest("A", RawMeteoData([_record(m, humidite=m) for m in range(0, 60, 10)]))
+
+    assert store.count("A") == 3
+    assert store.range("A").values("humidity_pct") == [30.0, 40.0, 50.0]
+    assert store.range("A", start=_at(35), end=_at(50)).values("humidity_pct") == [40.0]
+    assert len(store.range("A", start=_at(55))) == 0
+    assert len(store.range("inconnue")) == 0
+    assert store.stations() == ["A"]
@@ -0,0 +1,171 @@
+"""
+Tests unitaires du formatage du tableau de bord (sans fenêtre Tk).
+
+Ces tests vérifient :
+- la conversion d'un résultat de chargement en cellules
+- la conservation des dernières valeurs en cas d'erreur
+- la détection des seules cellules modifiées
+- le partage du pool de workers avec les demandes de l'utilisateur
+- la publication d'un échec lors d'une erreur réseau ou imprévue
+"""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from src.application.event_bus import (
+    EventBus,
+    ReadingFailed,
+    ReadingLoaded,
+    StationsRefreshed,
+)
+from src.application.job_pool import PRIORITY_BACKGROUND, PRIORITY_USER, JobPool
+from src.application.station_directory_service import StationFetchResult
+from src.domain.mesure.humidite import Humidite
+from src.domain.mesure.pression import Pression
+from src.domain.mesure.temperature import Temperature
+from src.domain.station import Station
+from src.ui.tkinter_app import (
+    DASHBOARD_COLUMNS,
+    DASHBOARD_WAITING_ROW,
+    JOB_DASHBOARD,
+    JOB_STATION,
+    MISSING_TEXT,
+    MeteoWorker,
+    changed_cells,
+    dashboard_row,
+)
+
+
+def _result(temperature: float) -> StationFetchResult:
+    """
+    Construit un résultat de chargement réussi.
+    """
+    return StationFetchResult(
+        name="A",
+        station=Station(
+            name="A",
+            timestamp=datetime(2026, 1, 20, 10, tzinfo=timezone.utc),
+            temperature=Temperature(temperature),
+            humidity=Humidite(70.0),
+            pressure=Pression(1013.25),
+            rain=0.0,
+        ),
+    )
+
+
+def test_dashboard_row_formats_station():
+    """
+    Vérifie les cellules d'une station chargée.
+    """
+    row = dashboard_row(_result(9.5))
+
+    assert len(row) == len(DASHBOARD_COLUMNS)
+    assert row == (
+        "2026-01-20T10:00:00+00:00",
+        "9.5",
+        "70",
+        "1013.2",
+        "0.0",
+        MISSING_TEXT,
+        MISSING_TEXT,
+        "OK",
+    )
+
+
+def test_dashboard_row_keeps_previous_values_on_error():
+    """
+    Vérifie qu'une erreur ne change que la colonne d'état.
+    """
+    previous = dashboard_row(_result(9.5))
+    failed = StationFetchResult(name="A", station=None, error=RuntimeError("boom"))
+
+    assert dashboard_row(failed, previous) == previous[:-1] + ("Erreur",)
+    assert dashboard_row(StationFetchResult(name="A", station=None))[-1] == "Aucune donnée"
+    assert dashboard_row(failed)[:-1] == DASHBOARD_WAITING_ROW[:-1]
+
+
+def test_changed_cells_returns_only_differences():
+    """
+    Vérifie que seules les cellules modifiées sont signalées.
+    """
+    before = dashboard_row(_result(9.5))
+    after = dashboard_row(_result(10.0))
+
+    assert changed_cells(before, after) == [(1, "10.0")]
+    assert not changed_cells(after, after)
+
+
+def test_user_job_is_served_before_queued_dashboard_refreshes():
+    """
+    Vérifie qu'un clic mis en attente après un rafraîchissement du tableau
+    de bord est servi en premier par le pool partagé.
+    """
+    calls = []
+    service = SimpleNamespace(get_latest_for_station=calls.append)
+    bus = EventBus()
+    loaded, refreshed = [], []
+    bus.subscribe(ReadingLoaded, lambda evt: loaded.append(evt.station))
+    bus.subscribe(
+        StationsRefreshed,
+        lambda evt: refreshed.extend(result.name for result in evt.results),
+    )
+    pool = JobPool(MeteoWorker(service=service, bus=bus).run, workers=1)
+
+    for name in ("A", "B", "C"):
+        pool.submit((JOB_DASHBOARD, name), PRIORITY_BACKGROUND)
+    pool.submit((JOB_STATION, "C"), PRIORITY_USER)
+    assert pool.pending()[0] == (JOB_STATION, "C")
+
+    pool.start()
+    assert pool.join(timeout=5)
+    pool.stop()
+
+    assert calls == ["C", "A", "B", "C"]
+    assert loaded == ["C"]
+    assert refreshed == ["A", "B", "C"]
+
+
+def test_worker_publishes_failure_on_network_error():
+    """
+    Vérifie qu'une erreur réseau (OSError) est publiée comme un échec.
+    """
+
+    def unreachable(station):
+        raise ConnectionError(f"{station} injoignable")
+
+    service = SimpleNamespace(get_latest_for_station=unreachable)
+    bus = EventBus()
+    failed, refreshed = [], []
+    bus.subscribe(ReadingFailed, failed.append)
+    bus.subscribe(StationsRefreshed, lambda evt: refreshed.extend(evt.results))
+    worker = MeteoWorker(service=service, bus=bus)
+
+    worker.run((JOB_STATION, "A"))
+    worker.run((JOB_DASHBOARD, "A"))
+
+    assert [(evt.station, evt.error) for evt in failed] == [("A", "A injoignable")]
+    assert isinstance(refreshed[0].error, ConnectionError)
+
+
+def test_pool_publishes_failure_on_unexpected_error():
+    """
+    Vérifie qu'une erreur imprévue (KeyError) remontée au pool est publiée
+    comme un échec : l'UI réactive le bouton au lieu d'attendre.
+    """
+
+    def broken(_station):
+        raise KeyError("heure_utc")
+
+    bus = EventBus()
+    failed = []
+    bus.subscribe(ReadingFailed, failed.append)
+    worker = MeteoWorker(service=SimpleNamespace(get_latest_for_station=broken), bus=bus)
+    pool = JobPool(worker.run, workers=1, on_error=worker.fail)
+
+    pool.start()
+    pool.submit((JOB_STATION, "B"))
+    assert pool.join(timeout=5)
+    pool.stop()
+
+    assert [evt.station for evt in failed] == ["B"]
+    assert "KeyError" in failed[0].error
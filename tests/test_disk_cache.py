@@ -0,0 +1,118 @@
+"""
+Tests unitaires du cache persistant JSON.
+
+Ces tests vérifient :
+- la persistance entre deux instances (redémarrage)
+- l'expiration par entrée
+- l'ignorance des fichiers d'un ancien format
+- la fusion des écritures de plusieurs instances
+- le regroupement des écritures différées
+"""
+
+import json
+
+from src.infrastructure.disk_cache import FORMAT_VERSION, JsonDiskCache
+
+
+class FakeClock:  # pylint: disable=too-few-public-methods
+    """
+    Horloge contrôlée par le test.
+    """
+
+    def __init__(self):
+        """
+        Initialise l'horloge à t=1000.
+        """
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        """
+        Retourne l'instant courant simulé.
+        """
+        return self.now
+
+
+def test_disk_cache_survives_restart(tmp_path):
+    """
+    Vérifie qu'une valeur écrite est relue par une nouvelle instance et
+    qu'aucun fichier temporaire ne subsiste.
+    """
+    path = tmp_path / "cache.json"
+    JsonDiskCache(path).set("raw:A", [{"pluie": 0.0}])
+
+    assert JsonDiskCache(path).get("raw:A") == [{"pluie": 0.0}]
+    assert json.loads(path.read_text())["version"] == FORMAT_VERSION
+    assert [p.name for p in tmp_path.iterdir()] == ["cache.json"]
+
+
+def test_disk_cache_expires_entries(tmp_path):
+    """
+    Vérifie le TTL par entrée.
+    """
+    clock = FakeClock()
+    cache = JsonDiskCache(tmp_path / "cache.json", ttl_seconds=60, clock=clock)
+    cache.set("short", 1)
+    cache.set("long", 2, ttl_seconds=3600)
+
+    clock.now += 120
+    assert cache.get("short") is None
+    assert cache.get("long") == 2
+
+
+def test_disk_cache_ignores_legacy_format(tmp_path):
+    """
+    Vérifie qu'un fichier d'un autre format est ignoré puis remplacé.
+    """
+    path = tmp_path / "cache.json"
+    path.write_text(json.dumps([{"id": 42, "pluie": 0.0}]))
+
+    cache = JsonDiskCache(path)
+    assert cache.get("raw:A") is None
+
+    cache.set("raw:A", [])
+    assert JsonDiskCache(path).get("raw:A") == []
+
+
+def test_disk_cache_merges_concurrent_writers(tmp_path):
+    """
+    Vérifie que deux instances partageant le fichier ne s'écrasent pas.
+    """
+    path = tmp_path / "cache.json"
+    first = JsonDiskCache(path)
+    second = JsonDiskCache(path)
+    first.get("warm-up")
+    second.get("warm-up")
+
+    first.set("a", 1)
+    second.set("b", 2)
+
+    reloaded = JsonDiskCache(path)
+    assert reloaded.get("a") == 1
+    assert reloaded.get("b") == 2
+
+
+def test_disk_cache_batches_deferred_writes(tmp_path, monkeypatch):
+    """
+    Vérifie qu'en mode différé plusieurs modifications donnent une seule
+    écriture, faite par flush() (ou close()).
+    """
+    path = tmp_path / "cache.json"
+    cache = JsonDiskCache(path, flush_delay_seconds=3600)
+    writes = []
+    flush = cache._flush  # pylint: disable=protected-access
+
+    def counting_flush(entries):
+        writes.append(len(entries))
+        flush(entries)
+
+    monkeypatch.setattr(cache, "_flush", counting_flush)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert not path.exists()
+    assert cache.get("a") == 1
+
+    cache.flush()
+    cache.close()
+    assert writes == [2]
+    assert JsonDiskCache(path).get("b") == 2
@@ -2,10 +2,57 @@
 Tests unitaires du module event_bus.
 
 Ces tests vérifient le bon fonctionnement du bus d'événements
-implémentant le pattern Observer.
+implémentant le pattern Observer, en mode direct et avec dispatcher
+(files par abonnement, politiques de débordement) et les abonnements
+groupés (lots, coalescence par clé).
 """
 
-from src.application.event_bus import EventBus, ReadingLoaded, ReadingFailed
+import asyncio
+import threading
+
+import pytest
+
+from src.application.event_bus import (
+    DROP_NEWEST,
+    DROP_OLDEST,
+    RAISE,
+    AsyncioDispatcher,
+    EventBus,
+    ReadingFailed,
+    ReadingLoaded,
+    ThreadPoolDispatcher,
+    start_timer,
+)
+
+
+class ManualDispatcher:
+    """
+    Dispatcher de test : les tâches sont exécutées à la demande.
+    """
+
+    def __init__(self):
+        self.tasks = []
+
+    def submit(self, task):
+        """
+        Mémorise la tâche sans l'exécuter.
+        """
+        self.tasks.append(task)
+
+    def run_all(self):
+        """
+        Exécute les tâches planifiées.
+        """
+        while self.tasks:
+            self.tasks.pop(0)()
+
+
+@pytest.fixture(name="dispatcher")
+def fixture_dispatcher():
+    """
+    Fournit un dispatcher manuel.
+    """
+    return ManualDispatcher()
 
 
 def test_event_bus_subscribe_and_publish_loaded():
@@ -40,3 +87,386 @@ def test_event_bus_subscribe_and_publish_failed():
     bus.publish(ReadingFailed(station="B", error="boom"))
 
     assert received == [("B", "boom")]
+
+
+def test_event_bus_unsubscribe_stops_delivery():
+    """
+    Vérifie qu'un gestionnaire désabonné n'est plus appelé.
+    """
+    bus = EventBus()
+    received = []
+    subscription = bus.subscribe(ReadingLoaded, lambda evt: received.append(evt.station))
+
+    bus.publish(ReadingLoaded(station="A", data=None))
+    subscription.unsubscribe()
+    bus.publish(ReadingLoaded(station="B", data=None))
+
+    assert received == ["A"]
+    assert subscription.active is False
+    assert bus.subscriber_count(ReadingLoaded) == 0
+    assert bus.unsubscribe(subscription) is False
+
+
+def test_event_bus_dispatcher_runs_handlers_later_in_order(dispatcher):
+    """
+    Vérifie qu'avec un dispatcher, publish() ne bloque pas sur le
+    gestionnaire et qu'une seule tâche vide la file dans l'ordre.
+    """
+    bus = EventBus(dispatcher=dispatcher)
+    received = []
+    subscription = bus.subscribe(ReadingLoaded, lambda evt: received.append(evt.station))
+
+    for station in "ABC":
+        bus.publish(ReadingLoaded(station=station, data=None))
+
+    assert not received
+    assert subscription.pending == 3
+    assert len(dispatcher.tasks) == 1
+
+    dispatcher.run_all()
+    assert received == ["A", "B", "C"]
+    assert subscription.pending == 0
+
+
+@pytest.mark.parametrize(
+    "overflow, expected",
+    [(DROP_OLDEST, ["C", "D"]), (DROP_NEWEST, ["A", "B"])],
+)
+def test_event_bus_bounded_backlog_drops_events(dispatcher, overflow, expected):
+    """
+    Vérifie les politiques de débordement qui perdent des événements.
+    """
+    bus = EventBus(dispatcher=dispatcher)
+    received = []
+    subscription = bus.subscribe(
+        ReadingLoaded,
+        lambda evt: received.append(evt.station),
+        max_backlog=2,
+        overflow=overflow,
+    )
+
+    for station in "ABCD":
+        bus.publish(ReadingLoaded(station=station, data=None))
+    dispatcher.run_all()
+
+    assert received == expected
+    assert subscription.dropped == 2
+
+
+def test_event_bus_bounded_backlog_can_raise(dispatcher):
+    """
+    Vérifie la politique RAISE et la validation des paramètres.
+    """
+    bus = EventBus(dispatcher=dispatcher)
+    bus.subscribe(ReadingLoaded, lambda evt: None, max_backlog=1, overflow=RAISE)
+    bus.publish(ReadingLoaded(station="A", data=None))
+
+    with pytest.raises(RuntimeError):
+        bus.publish(ReadingLoaded(station="B", data=None))
+    with pytest.raises(ValueError):
+        bus.subscribe(ReadingLoaded, lambda evt: None, overflow="block")
+
+
+def test_event_bus_handler_errors_do_not_stop_queue(dispatcher):
+    """
+    Vérifie qu'un échec du gestionnaire est compté sans bloquer la file.
+    """
+    bus = EventBus(dispatcher=dispatcher)
+    received = []
+
+    def handler(evt):
+        if evt.station == "A":
+            raise RuntimeError("boom")
+        received.append(evt.station)
+
+    subscription = bus.subscribe(ReadingLoaded, handler)
+    bus.publish(ReadingLoaded(station="A", data=None))
+    bus.publish(ReadingLoaded(station="B", data=None))
+    dispatcher.run_all()
+
+    assert received == ["B"]
+    assert subscription.errors == 1
+
+
+def test_event_bus_unexpected_handler_error_keeps_draining(dispatcher, caplog):
+    """
+    Vérifie qu'une exception imprévue (KeyError) est comptée et journalisée
+    sans arrêter la vidange, et que les événements suivants sont livrés.
+    """
+    bus = EventBus(dispatcher=dispatcher)
+    received = []
+
+    def handler(evt):
+        if evt.data is None:
+            raise KeyError("heure_utc")
+        received.append(evt.data)
+
+    subscription = bus.subscribe(ReadingLoaded, handler)
+    bus.publish(ReadingLoaded(station="K", data=None))
+    bus.publish(ReadingLoaded(station="K", data=1))
+    dispatcher.run_all()
+    bus.publish(ReadingLoaded(station="K", data=2))
+    dispatcher.run_all()
+
+    assert received == [1, 2]
+    assert subscription.errors == 1
+    assert subscription.pending == 0
+    assert "KeyError" in caplog.text
+
+
+def test_event_bus_thread_pool_runs_off_publisher_thread():
+    """
+    Vérifie que les gestionnaires s'exécutent dans le pool et qu'un
+    gestionnaire lent ne bloque pas les autres.
+    """
+    pool = ThreadPoolDispatcher(max_workers=2)
+    bus = EventBus(dispatcher=pool)
+    release = threading.Event()
+    threads = []
+
+    bus.subscribe(ReadingLoaded, lambda evt: release.wait(timeout=5))
+    bus.subscribe(ReadingLoaded, lambda evt: threads.append(threading.get_ident()))
+
+    for _ in range(10):
+        bus.publish(ReadingLoaded(station="A", data=None))
+    for _ in range(100):
+        if len(threads) == 10:
+            break
+        threading.Event().wait(0.01)
+
+    release.set()
+    pool.shutdown()
+    assert len(threads) == 10
+    assert threading.get_ident() not in threads
+
+
+def test_event_bus_asyncio_dispatcher_runs_in_loop():
+    """
+    Vérifie la livraison dans une boucle asyncio depuis un autre thread.
+    """
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        done = asyncio.Event()
+        received = []
+
+        def handler(evt):
+            received.append(evt.station)
+            done.set()
+
+        bus = EventBus(dispatcher=AsyncioDispatcher(loop))
+        bus.subscribe(ReadingFailed, handler)
+
+        publisher = threading.Thread(
+            target=bus.publish, args=(ReadingFailed(station="B", error="x"),)
+        )
+        publisher.start()
+        await asyncio.wait_for(done.wait(), timeout=5)
+        publisher.join()
+        return received
+
+    assert asyncio.run(scenario()) == ["B"]
+
+
+class ManualScheduler:
+    """
+    Scheduler de test : les fins de fenêtre sont déclenchées à la demande.
+    """
+
+    def __init__(self):
+        self.delays = []
+        self.tasks = []
+
+    def __call__(self, delay, task):
+        self.delays.append(delay)
+        self.tasks.append(task)
+
+    def fire(self):
+        """
+        Déclenche les fins de fenêtre planifiées.
+        """
+        while self.tasks:
+            self.tasks.pop(0)()
+
+
+def test_event_bus_batch_delivers_one_list_per_window():
+    """
+    Vérifie que les événements d'une fenêtre sont livrés en un seul lot.
+    """
+    scheduler = ManualScheduler()
+    bus = EventBus()
+    batches = []
+    subscription = bus.subscribe_batch(
+        ReadingLoaded, batches.append, window_seconds=0.2, scheduler=scheduler
+    )
+
+    for station in "ABA":
+        bus.publish(ReadingLoaded(station=station, data=None))
+
+    assert not batches
+    assert subscription.pending == 3
+    assert scheduler.delays == [0.2]
+
+    scheduler.fire()
+    assert [[evt.station for evt in batch] for batch in batches] == [["A", "B", "A"]]
+
+    bus.publish(ReadingLoaded(station="C", data=None))
+    assert len(scheduler.tasks) == 1
+
+
+def test_event_bus_batch_coalesces_latest_event_per_key():
+    """
+    Vérifie que seul le dernier événement de chaque clé est livré.
+    """
+    scheduler = ManualScheduler()
+    bus = EventBus()
+    batches = []
+    subscription = bus.subscribe_batch(
+        ReadingLoaded,
+        batches.append,
+        key=lambda evt: evt.station,
+        scheduler=scheduler,
+    )
+
+    for station, data in [("A", 1), ("B", 2), ("A", 3), ("C", 4), ("B", 5)]:
+        bus.publish(ReadingLoaded(station=station, data=data))
+    scheduler.fire()
+
+    assert [(evt.station, evt.data) for evt in batches[0]] == [
+        ("A", 3),
+        ("C", 4),
+        ("B", 5),
+    ]
+    assert subscription.coalesced == 2
+
+
+def test_event_bus_batch_flush_and_unsubscribe():
+    """
+    Vérifie flush() immédiat et l'abandon du lot au désabonnement.
+    """
+    scheduler = ManualScheduler()
+    bus = EventBus()
+    batches = []
+    subscription = bus.subscribe_batch(
+        ReadingLoaded, batches.append, scheduler=scheduler
+    )
+
+    bus.publish(ReadingLoaded(station="A", data=None))
+    assert subscription.flush() == 1
+    assert subscription.flush() == 0
+
+    bus.publish(ReadingLoaded(station="B", data=None))
+    subscription.unsubscribe()
+    scheduler.fire()
+    assert len(batches) == 1
+    assert subscription.pending == 0
+
+
+def test_event_bus_batch_manual_flush_disarms_window_timer():
+    """
+    Vérifie qu'après un flush() manuel, la fin de fenêtre déjà planifiée
+    ne livre ni lot vide ni lot en double, ni le lot de la fenêtre suivante.
+    """
+    scheduler = ManualScheduler()
+    bus = EventBus()
+    batches = []
+    subscription = bus.subscribe_batch(
+        ReadingLoaded, batches.append, window_seconds=0.5, scheduler=scheduler
+    )
+
+    bus.publish(ReadingLoaded(station="D", data=7))
+    assert subscription.flush() == 1
+    bus.publish(ReadingLoaded(station="E", data=8))
+    assert len(scheduler.tasks) == 2
+
+    scheduler.tasks[0]()
+    assert len(batches) == 1
+    assert subscription.pending == 1
+
+    scheduler.tasks[1]()
+    assert [[evt.station for evt in batch] for batch in batches] == [["D"], ["E"]]
+
+
+class HookedLock:
+    """
+    Verrou de test exécutant une action juste après sa prochaine libération.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.on_release = None
+
+    def __enter__(self):
+        self._lock.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._lock.release()
+        hook, self.on_release = self.on_release, None
+        if hook is not None:
+            hook()
+
+
+def test_event_bus_batch_deliver_during_flush_is_not_stranded():
+    """
+    Vérifie qu'un événement publié pendant un flush() ouvre une nouvelle
+    fenêtre et est livré sans autre publication.
+    """
+    scheduler = ManualScheduler()
+    bus = EventBus()
+    batches = []
+    subscription = bus.subscribe_batch(
+        ReadingLoaded, batches.append, window_seconds=0.3, scheduler=scheduler
+    )
+    bus.publish(ReadingLoaded(station="G", data=1))
+
+    lock = HookedLock()
+    subscription._lock = lock  # pylint: disable=protected-access
+    lock.on_release = lambda: bus.publish(ReadingLoaded(station="H", data=2))
+    assert subscription.flush() == 1
+
+    scheduler.fire()
+    assert [[evt.station for evt in batch] for batch in batches] == [["G"], ["H"]]
+    assert subscription.pending == 0
+
+
+def test_event_bus_batch_manual_flush_cancels_default_timer():
+    """
+    Vérifie que flush() annule le Timer par défaut encore armé.
+    """
+    timers = []
+
+    def recording_timer(delay, task):
+        timer = start_timer(delay, task)
+        timers.append(timer)
+        return timer
+
+    bus = EventBus()
+    subscription = bus.subscribe_batch(
+        ReadingLoaded, lambda events: None, window_seconds=30, scheduler=recording_timer
+    )
+    bus.publish(ReadingLoaded(station="F", data=None))
+
+    assert subscription.flush() == 1
+    assert timers[0].finished.is_set()
+    timers[0].join(timeout=5)
+    assert not timers[0].is_alive()
+
+
+def test_event_bus_batch_with_default_timer():
+    """
+    Vérifie la livraison par le Timer par défaut.
+    """
+    bus = EventBus()
+    delivered = threading.Event()
+    batches = []
+
+    def handler(events):
+        batches.append(events)
+        delivered.set()
+
+    bus.subscribe_batch(ReadingLoaded, handler, window_seconds=0.01)
+    bus.publish(ReadingLoaded(station="A", data=None))
+
+    assert delivered.wait(timeout=5)
+    assert [evt.station for evt in batches[0]] == ["A"]
@@ -0,0 +1,35 @@
+"""
+Tests unitaires de la factory.
+
+Ces tests vérifient :
+- l'emplacement du cache disque d'exécution, hors du dépôt
+"""
+
+from pathlib import Path
+
+from src.application import factory
+from src.application.factory import CACHE_FILE_ENV, default_cache_file
+
+
+def test_default_cache_file_is_outside_the_repository(monkeypatch, tmp_path):
+    """
+    Vérifie que le cache d'exécution est placé dans le répertoire de cache
+    de l'utilisateur et jamais sur le fichier d'exemple suivi par git.
+    """
+    monkeypatch.delenv(CACHE_FILE_ENV, raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    path = default_cache_file()
+    repository = Path(factory.__file__).resolve().parents[2]
+
+    assert path == tmp_path / "meteo-toulouse" / "meteo_cache.json"
+    assert repository not in path.resolve().parents
+
+
+def test_default_cache_file_honours_environment_override(monkeypatch, tmp_path):
+    """
+    Vérifie que METEO_CACHE_FILE remplace l'emplacement par défaut.
+    """
+    monkeypatch.setenv(CACHE_FILE_ENV, str(tmp_path / "custom.json"))
+
+    assert default_cache_file() == tmp_path / "custom.json"
@@ -0,0 +1,159 @@
+"""
+Tests unitaires du pool de workers.
+
+Ces tests vérifient :
+- l'exécution des demandes par plusieurs workers
+- la déduplication des demandes (en attente ou en cours)
+- l'ordre de service par priorité et l'annulation
+- la résistance aux erreurs de la fonction exécutée
+"""
+
+import threading
+
+import pytest
+
+from src.application.job_pool import PRIORITY_BACKGROUND, PRIORITY_USER, JobPool
+
+
+class GatedRunner:  # pylint: disable=too-few-public-methods
+    """
+    Fonction de travail bloquée tant que le test ne l'autorise pas.
+    """
+
+    def __init__(self):
+        self.gate = threading.Event()
+        self.started = threading.Semaphore(0)
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, key):
+        with self.lock:
+            self.calls.append(key)
+        self.started.release()
+        self.gate.wait(timeout=5)
+        if key == "boom":
+            raise RuntimeError("échec")
+
+
+@pytest.fixture(name="runner")
+def fixture_runner():
+    """
+    Fournit une fonction de travail contrôlée par le test.
+    """
+    return GatedRunner()
+
+
+def test_job_pool_runs_jobs_in_parallel(runner):
+    """
+    Vérifie que plusieurs demandes s'exécutent simultanément.
+    """
+    pool = JobPool(runner, workers=3)
+    pool.start()
+    for key in "ABC":
+        assert pool.submit(key) is True
+
+    for _ in range(3):
+        assert runner.started.acquire(timeout=5)
+    assert pool.running() == {"A", "B", "C"}
+
+    runner.gate.set()
+    assert pool.join(timeout=5)
+    pool.stop()
+    assert pool.stats()["completed"] == 3
+
+
+def test_job_pool_deduplicates_pending_and_running(runner):
+    """
+    Vérifie qu'une station n'est jamais chargée deux fois en même temps.
+    """
+    pool = JobPool(runner, workers=1)
+    pool.start()
+    pool.submit("A")
+    assert runner.started.acquire(timeout=5)
+
+    assert pool.submit("A") is False
+    assert pool.submit("B") is True
+    assert pool.submit("B") is False
+    assert pool.pending() == ["B"]
+
+    runner.gate.set()
+    assert pool.join(timeout=5)
+    pool.stop()
+    assert runner.calls == ["A", "B"]
+    assert pool.stats()["deduplicated"] == 2
+
+
+def test_job_pool_serves_by_priority_then_order(runner):
+    """
+    Vérifie que les demandes utilisateur passent avant l'arrière-plan.
+    """
+    pool = JobPool(runner, workers=1)
+    pool.submit("bg1", PRIORITY_BACKGROUND)
+    pool.submit("bg2", PRIORITY_BACKGROUND)
+    pool.submit("user", PRIORITY_USER)
+    # Une demande d'arrière-plan relancée par l'utilisateur est promue
+    pool.submit("bg2", PRIORITY_USER)
+
+    assert pool.pending() == ["user", "bg2", "bg1"]
+
+    runner.gate.set()
+    pool.start()
+    assert pool.join(timeout=5)
+    pool.stop()
+    assert runner.calls == ["user", "bg2", "bg1"]
+
+
+def test_job_pool_cancel_and_errors(runner):
+    """
+    Vérifie l'annulation d'une demande en attente et le comptage des échecs.
+    """
+    pool = JobPool(runner, workers=1)
+    pool.submit("A")
+    pool.submit("boom")
+    assert pool.cancel("A") is True
+    assert pool.cancel("A") is False
+
+    runner.gate.set()
+    pool.start()
+    assert pool.join(timeout=5)
+    pool.submit("B")
+    assert pool.join(timeout=5)
+    pool.stop()
+
+    assert runner.calls == ["boom", "B"]
+    stats = pool.stats()
+    assert (stats["cancelled"], stats["failed"], stats["completed"]) == (1, 1, 1)
+
+
+def test_job_pool_survives_unexpected_exceptions():
+    """
+    Vérifie qu'une exception imprévue (KeyError) est signalée sans tuer
+    le worker : une demande suivante est encore exécutée.
+    """
+    done = []
+    errors = []
+
+    def run(key):
+        if key == "parse":
+            raise KeyError("heure_utc")
+        done.append(key)
+
+    pool = JobPool(run, workers=1, on_error=lambda key, exc: errors.append((key, exc)))
+    pool.start()
+    pool.submit("parse")
+    assert pool.join(timeout=5)
+    pool.submit("next")
+    assert pool.join(timeout=5)
+    pool.stop()
+
+    assert done == ["next"]
+    assert [(key, type(exc)) for key, exc in errors] == [("parse", KeyError)]
+    assert (pool.stats()["failed"], pool.stats()["completed"]) == (1, 1)
+
+
+def test_job_pool_rejects_invalid_worker_count():
+    """
+    Vérifie qu'un pool sans worker est refusé.
+    """
+    with pytest.raises(ValueError):
+        JobPool(lambda key: None, workers=0)
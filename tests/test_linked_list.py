@@ -6,9 +6,12 @@ Ces tests vérifient le comportement de base de la structure LinkedList :
 - ajout en tête et en fin
 - suppression
 - parcours
+
+ainsi que les opérations indexées de IndexedLinkedList (suppression,
+déplacement en tête, retrait en fin, usage LRU).
 """
 
-from src.domain.linked_list import LinkedList
+from src.domain.linked_list import IndexedLinkedList, LinkedList
 
 
 def test_linked_list_initially_empty():
@@ -55,3 +58,55 @@ def test_linked_list_pop_left():
     assert ll.pop_left() == 20
     assert ll.pop_left() is None
     assert ll.is_empty() is True
+
+
+def test_indexed_linked_list_push_front_deduplicates():
+    """
+    Vérifie qu'une clé réinsérée est remplacée et déplacée en tête.
+    """
+    ll = IndexedLinkedList()
+    ll.push_front("a", 1)
+    ll.push_front("b", 2)
+    ll.push_front("a", 3)
+    assert len(ll) == 2
+    assert ll.keys() == ["a", "b"]
+    assert ll.to_list() == [3, 2]
+    assert "a" in ll and "c" not in ll
+    assert ll.get("b") == 2
+
+
+def test_indexed_linked_list_remove_and_move_to_front():
+    """
+    Vérifie la suppression et le déplacement en tête par clé.
+    """
+    ll = IndexedLinkedList()
+    for key in "abcd":
+        ll.append(key, key.upper())
+
+    assert ll.remove("b") == "B"
+    assert ll.remove("b") is None
+    assert ll.move_to_front("d") is True
+    assert ll.move_to_front("z") is False
+    assert ll.keys() == ["d", "a", "c"]
+    assert ll.pop_left() == ("d", "D")
+    assert ll.pop_right() == ("c", "C")
+    assert ll.keys() == ["a"]
+
+
+def test_indexed_linked_list_as_bounded_lru():
+    """
+    Vérifie un usage LRU : le moins récent est retiré en fin de liste.
+    """
+    ll = IndexedLinkedList()
+    evicted = []
+    for station in ["Nantes", "Lyon", "Nantes", "Paris", "Brest"]:
+        ll.push_front(station, None)
+        if len(ll) > 3:
+            evicted.append(ll.pop_right()[0])
+
+    assert ll.keys() == ["Brest", "Paris", "Nantes"]
+    assert evicted == ["Lyon"]
+
+    ll.clear()
+    assert ll.is_empty() is True
+    assert ll.pop_right() is None and ll.pop_left() is None
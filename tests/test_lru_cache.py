@@ -0,0 +1,110 @@
+"""
+Tests unitaires du cache LRU borné avec expiration.
+
+Ces tests vérifient :
+- l'expiration (TTL) et la fenêtre stale
+- l'éviction LRU par nombre d'entrées et par taille
+- le balayage périodique des entrées expirées
+- les compteurs exposés par stats()
+"""
+
+from src.domain.lru_cache import LruTtlCache, deep_sizeof
+
+
+class FakeClock:  # pylint: disable=too-few-public-methods
+    """
+    Horloge contrôlée par le test.
+    """
+
+    def __init__(self):
+        """
+        Initialise l'horloge à t=0.
+        """
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """
+        Retourne l'instant courant simulé.
+        """
+        return self.now
+
+
+def test_cache_expires_entries_after_ttl():
+    """
+    Vérifie qu'une entrée n'est plus servie après son TTL, sauf dans la
+    fenêtre stale via lookup().
+    """
+    clock = FakeClock()
+    cache = LruTtlCache(ttl_seconds=10, stale_ttl_seconds=5, clock=clock)
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    clock.now = 12
+    assert cache.get("a") is None
+    assert cache.lookup("a") == (1, True)
+    clock.now = 20
+    assert cache.lookup("a") == (None, False)
+    assert len(cache) == 0
+
+
+def test_cache_evicts_least_recently_used_entry():
+    """
+    Vérifie l'éviction de l'entrée la moins récemment utilisée.
+    """
+    cache = LruTtlCache(ttl_seconds=60, max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.stats()["evictions"] == 1
+
+
+def test_cache_respects_max_bytes():
+    """
+    Vérifie que l'empreinte mémoire estimée reste sous la limite.
+    """
+    cache = LruTtlCache(ttl_seconds=60, max_bytes=3 * deep_sizeof("x" * 100))
+    for i in range(10):
+        cache.set(i, "x" * 100)
+
+    stats = cache.stats()
+    assert stats["entries"] == 3
+    assert stats["bytes"] <= 3 * deep_sizeof("x" * 100)
+    assert stats["evictions"] == 7
+
+
+def test_cache_periodic_sweep_removes_expired_entries():
+    """
+    Vérifie que les entrées expirées sont supprimées sans être relues.
+    """
+    clock = FakeClock()
+    cache = LruTtlCache(ttl_seconds=1, sweep_interval_seconds=5, clock=clock)
+    for i in range(5):
+        cache.set(i, i)
+
+    clock.now = 6
+    cache.set("fresh", 0)
+
+    assert len(cache) == 1
+    assert cache.stats()["expirations"] == 5
+
+
+def test_cache_stats_hit_rate():
+    """
+    Vérifie les compteurs hits / misses et le taux de succès.
+    """
+    cache = LruTtlCache(ttl_seconds=60)
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("a")
+    cache.get("missing")
+    cache.peek("a")
+
+    stats = cache.stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    assert abs(stats["hit_rate"] - 2 / 3) < 1e-9
@@ -0,0 +1,225 @@
+"""
+Tests unitaires des clients météo HTTP.
+
+Ces tests vérifient :
+- le partage d'un pool de connexions unique entre les appels
+- la réutilisation effective des connexions (keep-alive)
+- le client asynchrone (aiohttp)
+- les requêtes conditionnelles (ETag / 304 Not Modified), limitées à
+  l'URL exacte qui a fourni les validateurs
+"""
+
+import asyncio
+import json
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+
+import pytest
+
+from src.infrastructure.http_session import HttpSessionPool
+from src.infrastructure.meteo_clients import AsyncHttpMeteoClient, HttpMeteoClient
+from src.infrastructure.station_registry import StationRegistry
+
+
+class FakeResponse:
+    """
+    Fausse réponse HTTP retournant un payload JSON fixe.
+    """
+
+    status_code = 200
+    headers: dict = {}
+
+    def __init__(self, payload: dict):
+        """
+        Initialise la réponse fake.
+
+        Args:
+            payload: contenu JSON renvoyé par json()
+        """
+        self._payload = payload
+
+    def raise_for_status(self) -> None:
+        """
+        Simule une réponse HTTP 200.
+        """
+
+    def json(self) -> dict:
+        """
+        Retourne le payload JSON.
+        """
+        return self._payload
+
+
+class FakePool:
+    """
+    Faux pool de connexions enregistrant les URLs demandées.
+    """
+
+    def __init__(self):
+        """
+        Initialise le pool fake.
+        """
+        self.urls = []
+
+    def get(self, url, timeout, headers=None):  # pylint: disable=unused-argument
+        """
+        Simule une requête GET.
+        """
+        self.urls.append(url)
+        return FakeResponse({"results": [{"heure_utc": "2026-01-20T10:00:00Z"}]})
+
+    def stats(self) -> dict:
+        """
+        Retourne des statistiques fictives.
+        """
+        return {"requests_sent": len(self.urls)}
+
+
+class _JsonHandler(BaseHTTPRequestHandler):
+    """
+    Handler HTTP/1.1 minimal répondant un payload de type Explore v2.1.
+    """
+
+    protocol_version = "HTTP/1.1"
+    etag = '"v1"'
+    # (chemin demandé, ETag présenté) de chaque requête reçue
+    received: list = []
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """
+        Répond avec un JSON contenant une liste de résultats, ou 304 si
+        le client présente l'ETag courant.
+        """
+        self.received.append((self.path, self.headers.get("If-None-Match")))
+        if self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.send_header("ETag", self.etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body = json.dumps({"results": [{"pluie": 0.0}]}).encode()
+        self.send_response(200)
+        self.send_header("ETag", self.etag)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):  # pylint: disable=arguments-differ
+        """
+        Désactive les logs du serveur de test.
+        """
+
+
+@pytest.fixture(name="local_server")
+def fixture_local_server():
+    """
+    Démarre un serveur HTTP local le temps d'un test.
+
+    Yields:
+        URL de base du serveur.
+    """
+    _JsonHandler.received.clear()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _JsonHandler)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_http_client_shares_pool_between_fetches():
+    """
+    Vérifie que tous les appels passent par le même pool.
+    """
+    pool = FakePool()
+    client = HttpMeteoClient(timeout_seconds=1, pool=pool)
+
+    first = client.fetch("endpoint://a")
+    second = client.fetch("endpoint://b")
+
+    assert pool.urls == ["endpoint://a", "endpoint://b"]
+    assert first.data and second.data
+    assert client.pool_stats() == {"requests_sent": 2}
+
+
+def test_session_pool_reuses_connections(local_server):
+    """
+    Vérifie qu'une seule connexion TCP est ouverte pour plusieurs requêtes.
+    """
+    client = HttpMeteoClient(timeout_seconds=5, pool=HttpSessionPool())
+    try:
+        for _ in range(3):
+            assert client.fetch(local_server + "/records").data == [{"pluie": 0.0}]
+
+        stats = client.pool_stats()
+        assert stats["requests_sent"] == 3
+        assert stats["connections_opened"] == 1
+        assert stats["connections_reused"] == 2
+        assert stats["idle_connections"] == 1
+    finally:
+        client.close()
+
+
+def test_async_client_fetches_concurrently(local_server):
+    """
+    Vérifie que le client asynchrone récupère plusieurs endpoints
+    depuis une seule boucle.
+    """
+    pytest.importorskip("aiohttp")
+    client = AsyncHttpMeteoClient(timeout_seconds=5, max_concurrency=4)
+
+    async def scenario():
+        try:
+            return await asyncio.gather(
+                *(client.fetch(f"{local_server}/records/{i}") for i in range(8))
+            )
+        finally:
+            await client.close()
+
+    results = asyncio.run(scenario())
+
+    assert [r.data for r in results] == [[{"pluie": 0.0}]] * 8
+
+
+def test_http_client_reuses_data_on_not_modified(local_server):
+    """
+    Vérifie qu'une réponse 304 renvoie le même objet RawMeteoData.
+    """
+    client = HttpMeteoClient(timeout_seconds=5)
+    try:
+        first = client.fetch(local_server + "/records")
+        second = client.fetch(local_server + "/records")
+        other = client.fetch(local_server + "/other")
+    finally:
+        client.close()
+
+    assert second is first
+    assert other is not first
+    assert other.data == first.data
+
+
+def test_http_client_keeps_validators_per_exact_url(local_server):
+    """
+    Vérifie que les validateurs d'un endpoint ne sont pas présentés pour
+    une requête incrémentale (autre chaîne de requête) et que la réponse
+    complète mémorisée n'est pas rendue à sa place.
+    """
+    endpoint = local_server + "/records?order_by=heure_utc%20desc"
+    incremental_url = StationRegistry.incremental_endpoint(
+        endpoint, datetime(2026, 1, 20, 10, tzinfo=timezone.utc)
+    )
+    client = HttpMeteoClient(timeout_seconds=5)
+    try:
+        first = client.fetch(endpoint)
+        incremental = client.fetch(incremental_url)
+        again = client.fetch(endpoint)
+    finally:
+        client.close()
+
+    assert incremental is not first
+    assert again is first
+    assert [etag for _, etag in _JsonHandler.received] == [None, None, '"v1"']
+    assert "where=" in _JsonHandler.received[1][0]
@@ -26,3 +26,59 @@ def test_aggregate_latest_values(sample_records):
 
     assert agg["wind_speed"] == 5.0
     assert agg["wind_direction_deg"] == 180.0
+
+
+def test_aggregate_latest_values_unordered_records():
+    """
+    Vérifie que l'ordre des enregistrements n'a pas d'influence :
+    la valeur du plus récent l'emporte, les non datés passent en dernier
+    et, à horodatage égal, le premier enregistrement est retenu.
+    """
+    records = [
+        {"temperature_en_degre_c": 1.0},
+        {"heure_utc": "2026-01-20T08:00:00Z", "temperature_en_degre_c": 8.0},
+        {"heure_utc": "2026-01-20T10:00:00Z", "humidite": 55},
+        {"heure_utc": "2026-01-20T09:00:00Z", "temperature_en_degre_c": 9.0},
+        {"heure_utc": "2026-01-20T10:00:00Z", "humidite": 99},
+        {"pluie": 0.4},
+    ]
+
+    agg = aggregate_latest_values(records)
+
+    assert agg["timestamp"].hour == 10
+    assert agg["temperature_c"] == 9.0
+    assert agg["humidity_pct"] == 55.0
+    assert agg["rain_mm"] == 0.4
+    assert agg["pressure_hpa"] is None
+
+
+def _full_record(hour: int, temperature: float) -> dict:
+    """
+    Construit un enregistrement fournissant tous les champs.
+    """
+    return {
+        "heure_utc": f"2026-01-20T{hour:02d}:00:00Z",
+        "temperature_en_degre_c": temperature,
+        "humidite": 60 + hour,
+        "pression": 101000 + hour,
+        "pluie": 0.2,
+        "force_moyenne_du_vecteur_vent": hour,
+        "direction_du_vecteur_vent_moyen": 90,
+    }
+
+
+def test_aggregate_latest_values_stops_early_on_newest_first_records():
+    """
+    Vérifie qu'un lot trié du plus récent au plus ancien donne le même
+    résultat et que la suite du lot n'est pas lue une fois tous les champs
+    connus.
+    """
+    records = [_full_record(hour, float(hour)) for hour in (12, 11, 10)]
+    assert aggregate_latest_values(records, newest_first=True) == (
+        aggregate_latest_values(records)
+    )
+
+    # Un enregistrement hors ordre en fin de lot n'est lu que sans newest_first
+    records.append(_full_record(13, 99.0))
+    assert aggregate_latest_values(records)["temperature_c"] == 99.0
+    assert aggregate_latest_values(records, newest_first=True)["temperature_c"] == 12.0
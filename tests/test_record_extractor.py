@@ -5,7 +5,12 @@ Ces tests vérifient l'extraction correcte des différents champs
 depuis des enregistrements météo bruts.
 """
 
+from src.infrastructure import record_extractor
 from src.infrastructure.record_extractor import (
+    GENERIC_EXTRACTORS,
+    RecordSchema,
+    clear_timestamp_cache,
+    parse_datetime,
     extract_timestamp,
     extract_temperature_c,
     extract_humidity_pct,
@@ -26,6 +31,38 @@ def test_extract_timestamp_iso():
     assert ts.isoformat().startswith("2026-01-20T10:00:00")
 
 
+def test_parse_datetime_is_memoized_and_bounded(monkeypatch):
+    """
+    Vérifie que les conversions sont mémorisées (instance partagée), que la
+    mémoire reste bornée et que les deux formes UTC donnent le même instant.
+    """
+    monkeypatch.setattr(record_extractor, "TIMESTAMP_CACHE_SIZE", 2)
+    clear_timestamp_cache()
+
+    first = parse_datetime("2026-01-20T10:00:00+00:00")
+    assert parse_datetime("2026-01-20T10:00:00+00:00") is first
+    assert parse_datetime("2026-01-20T10:00:00Z") == first
+    assert parse_datetime("2026-01-20T10:15:00Z") is not None
+    assert len(record_extractor._PARSED_TIMESTAMPS) <= 2  # pylint: disable=protected-access
+
+    assert parse_datetime("pas une date") is None
+    assert parse_datetime("") is None
+    clear_timestamp_cache()
+
+    # Un échec est mémorisé : le texte n'est plus reconverti
+    calls = []
+
+    def counting_parse(text):
+        calls.append(text)
+
+    monkeypatch.setattr(record_extractor, "parse_iso_text", counting_parse)
+    assert parse_datetime("invalide") is None
+    assert parse_datetime("invalide") is None
+    assert calls == ["invalide"]
+    assert parse_datetime(None) is None
+    clear_timestamp_cache()
+
+
 def test_extract_temperature_key_variants():
     """
     Vérifie l'extraction de la température.
@@ -84,3 +121,85 @@ def test_extract_supports_nested_data_object():
     }
     assert extract_temperature_c(record) == 9.5
     assert extract_timestamp(record) is not None
+
+
+def _extract_all(extractors, record):
+    """
+    Applique des extracteurs à un enregistrement.
+    """
+    values = {name: extract(record) for name, extract in extractors.fields}
+    values["timestamp"] = extractors.timestamp(record)
+    return values
+
+
+def test_record_schema_compiles_direct_lookups():
+    """
+    Vérifie que les extracteurs compilés donnent le même résultat que le
+    chemin générique pour un schéma imbriqué aux clés peu prioritaires.
+    """
+    records = [
+        {
+            "id": 1,
+            "data": {
+                "time": "2026-01-20T10:00:00Z",
+                "t": 9.5,
+                "u": 70,
+                "qnh": 101325,
+                "rr": None,
+                "force_rafale_max": 12,
+                "dd": 180,
+            },
+        },
+        {
+            "id": 2,
+            "data": {
+                "time": "2026-01-20T09:45:00Z",
+                "t": None,
+                "u": 71,
+                "qnh": 1012.0,
+                "rr": 0.2,
+                "force_rafale_max": None,
+                "dd": 190,
+            },
+        },
+    ]
+
+    schema = RecordSchema.detect(records)
+
+    assert schema is not None
+    for record in records:
+        assert schema.extractors_for(record) is schema.extractors
+        assert _extract_all(schema.extractors, record) == _extract_all(
+            GENERIC_EXTRACTORS, record
+        )
+
+
+def test_record_schema_falls_back_on_mismatch():
+    """
+    Vérifie qu'un enregistrement d'un autre schéma utilise le chemin générique.
+    """
+    schema = RecordSchema({"data": {"t": 1.0, "time": "2026-01-20T10:00:00Z"}})
+    other = {"data": {"t": None, "temp": 2.0, "time": "2026-01-20T10:00:00Z"}}
+
+    assert schema.extractors_for(other) is GENERIC_EXTRACTORS
+    assert schema.extractors_for({"data": "abc", "t": 1.0}) is GENERIC_EXTRACTORS
+
+
+def test_record_schema_not_compiled_when_generic_path_is_direct(sample_records):
+    """
+    Vérifie qu'aucun schéma n'est compilé lorsque chaque champ est fourni
+    par sa première clé candidate.
+    """
+    record = {
+        "heure_de_paris": "2026-01-20T10:00:00Z",
+        "temperature_en_degre_c": 1.0,
+        "humidite": 70,
+        "pression": 101325,
+        "pluie": 0.0,
+        "force_moyenne_du_vecteur_vent": 5,
+        "direction_du_vecteur_vent_moyen": 180,
+    }
+
+    assert RecordSchema.detect([record]) is None
+    assert RecordSchema.detect([]) is None
+    assert RecordSchema.detect(sample_records) is not None
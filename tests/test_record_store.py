@@ -0,0 +1,86 @@
+"""
+Tests unitaires du stockage local des enregistrements (mode incrémental).
+
+Ces tests vérifient :
+- la déduplication par heure_utc et le suivi du plus récent horodatage
+- la taille maximale de la fenêtre
+- la stabilité de l'instantané lorsque rien ne change
+- la construction de l'URL incrémentale
+"""
+
+from src.infrastructure.record_store import StationRecordStore
+from src.infrastructure.station_registry import StationRegistry
+
+
+def _record(minute: int, **values) -> dict:
+    """
+    Construit un enregistrement horodaté à 10:MM UTC.
+    """
+    return {"heure_utc": f"2026-01-20T10:{minute:02d}:00+00:00", **values}
+
+
+def test_store_deduplicates_and_tracks_newest():
+    """
+    Vérifie la fusion sans doublons et le suivi du plus récent horodatage.
+    """
+    store = StationRecordStore()
+    assert store.newest_timestamp("A") is None
+
+    assert store.merge("A", [_record(0), _record(15)]) == 2
+    assert store.merge("A", [_record(15), _record(30), {"pluie": 1.0}]) == 1
+
+    assert store.newest_timestamp("A").minute == 30
+    assert [r["heure_utc"][14:16] for r in store.snapshot("A").data] == [
+        "30",
+        "15",
+        "00",
+    ]
+
+
+def test_store_trims_oldest_records():
+    """
+    Vérifie que seuls les enregistrements les plus récents sont conservés.
+    """
+    store = StationRecordStore(max_records_per_station=2)
+    store.merge("A", [_record(m) for m in (0, 15, 30, 45)])
+
+    assert [r["heure_utc"][14:16] for r in store.snapshot("A").data] == ["45", "30"]
+
+
+def test_store_snapshot_is_stable_until_new_data():
+    """
+    Vérifie que l'instantané est réutilisé tant que rien n'est ajouté.
+    """
+    store = StationRecordStore()
+    store.merge("A", [_record(0)])
+    first = store.snapshot("A")
+    assert first.newest_first is True
+
+    store.merge("A", [_record(0)])
+    assert store.snapshot("A") is first
+
+    store.merge("A", [_record(15)])
+    assert store.snapshot("A") is not first
+
+
+def test_incremental_endpoint_adds_where_and_limit():
+    """
+    Vérifie les paramètres where / limit ajoutés à l'URL de la station.
+    """
+    store = StationRecordStore()
+    store.merge("A", [_record(30)])
+
+    url = StationRegistry.incremental_endpoint(
+        "https://x/records?order_by=heure_utc%20desc",
+        store.newest_timestamp("A"),
+        limit=50,
+    )
+
+    assert url.startswith("https://x/records?order_by=heure_utc%20desc&where=")
+    assert "2026-01-20T10%3A30%3A00%2B00%3A00" in url
+    assert url.endswith("&limit=50")
+    assert StationRegistry.base_endpoint(url) == (
+        "https://x/records?order_by=heure_utc%20desc"
+    )
+    assert StationRegistry.is_incremental(url)
+    assert not StationRegistry.is_incremental(StationRegistry.base_endpoint(url))
@@ -0,0 +1,59 @@
+"""
+Tests unitaires du tampon circulaire.
+
+Ces tests vérifient :
+- l'ajout et le parcours du plus récent au plus ancien
+- l'éviction automatique une fois la capacité atteinte
+- la réinitialisation et la validation de la capacité
+"""
+
+import pytest
+
+from src.domain.ring_buffer import RingBuffer
+
+
+def test_ring_buffer_initially_empty():
+    """
+    Vérifie qu'un tampon nouvellement créé est vide.
+    """
+    buffer = RingBuffer(3)
+    assert buffer.is_empty() is True
+    assert len(buffer) == 0
+    assert buffer.newest() is None
+    assert not buffer.to_list()
+
+
+def test_ring_buffer_push_iterates_newest_first():
+    """
+    Vérifie l'ordre de parcours avant saturation.
+    """
+    buffer = RingBuffer(3)
+    assert buffer.push("a") is None
+    buffer.push("b")
+    assert buffer.to_list() == ["b", "a"]
+    assert buffer.newest() == "b"
+
+
+def test_ring_buffer_evicts_oldest_when_full():
+    """
+    Vérifie l'éviction du plus ancien élément au-delà de la capacité.
+    """
+    buffer = RingBuffer(3)
+    for value in range(1, 4):
+        buffer.push(value)
+
+    assert buffer.push(4) == 1
+    assert buffer.push(5) == 2
+    assert len(buffer) == 3
+    assert buffer.to_list() == [5, 4, 3]
+
+    buffer.clear()
+    assert buffer.is_empty() and buffer.capacity == 3
+
+
+def test_ring_buffer_rejects_invalid_capacity():
+    """
+    Vérifie qu'une capacité nulle est refusée.
+    """
+    with pytest.raises(ValueError):
+        RingBuffer(0)
@@ -0,0 +1,99 @@
+"""
+Tests unitaires du moteur de cumuls par fenêtre de temps.
+
+Ces tests vérifient :
+- les statistiques horaires et journalières (min, max, moyenne, somme)
+- la mise à jour incrémentale sans double comptage
+- le filtrage par intervalle et la limite du nombre de fenêtres
+- la mémoire bornée (horodatages de déduplication, moteur illimité refusé)
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from src.domain.mesure.raw_data import RawMeteoData
+from src.infrastructure.rollup_engine import RollupEngine
+
+
+def _record(hour: int, minute: int, **values) -> dict:
+    """
+    Construit un enregistrement horodaté le 20/01/2026 à HH:MM UTC.
+    """
+    return {"heure_utc": f"2026-01-20T{hour:02d}:{minute:02d}:00+00:00", **values}
+
+
+def _at(hour: int) -> datetime:
+    """
+    Retourne le datetime UTC du 20/01/2026 à HH:00.
+    """
+    return datetime(2026, 1, 20, hour, tzinfo=timezone.utc)
+
+
+def test_rollups_are_updated_incrementally():
+    """
+    Vérifie les cumuls horaires / journaliers et l'absence de double
+    comptage lorsqu'un lot est reçu à nouveau.
+    """
+    engine = RollupEngine()
+    first = RawMeteoData(
+        [
+            _record(9, 45, temperature_en_degre_c=3.0, pluie=0.2),
+            _record(9, 30, temperature_en_degre_c=1.0, pluie=0.4),
+        ]
+    )
+
+    assert engine.ingest("A", first) == 2
+    assert engine.ingest("A", first) == 0
+    assert engine.ingest("A", RawMeteoData([_record(10, 0, temperature_en_degre_c=5.0)])) == 1
+
+    hours = engine.rollups("A", "hour")
+    assert [start for start, _ in hours] == [_at(9), _at(10)]
+    nine = hours[0][1]
+    assert (nine["temperature_c"].minimum, nine["temperature_c"].maximum) == (1.0, 3.0)
+    assert nine["temperature_c"].mean == pytest.approx(2.0)
+    assert nine["rain_mm"].total == pytest.approx(0.6)
+    assert hours[1][1]["rain_mm"].count == 0
+
+    (day_start, day), = engine.rollups("A", "day")
+    assert day_start == _at(0)
+    assert day["temperature_c"].count == 3
+    assert day["temperature_c"].mean == pytest.approx(3.0)
+
+
+def test_rollups_range_and_retention():
+    """
+    Vérifie le filtrage [start, end[, la limite de fenêtres et l'erreur
+    sur une résolution inconnue.
+    """
+    engine = RollupEngine(max_buckets=2)
+    engine.ingest("A", RawMeteoData([_record(h, 0, humidite=h) for h in range(4)]))
+
+    assert [s for s, _ in engine.rollups("A", "hour")] == [_at(2), _at(3)]
+    assert [s for s, _ in engine.rollups("A", "hour", start=_at(3))] == [_at(3)]
+    assert engine.rollups("A", "hour", end=_at(2)) == []
+    assert engine.ingest("A", RawMeteoData([_record(1, 30, humidite=9)])) == 0
+    assert engine.rollups("inconnue", "day") == []
+
+    with pytest.raises(ValueError):
+        engine.rollups("A", "minute")
+
+
+def test_rollups_bound_deduplication_memory():
+    """
+    Vérifie que les horodatages mémorisés pour la déduplication sont
+    supprimés avec les fenêtres et qu'un moteur illimité est refusé.
+    """
+    engine = RollupEngine(max_buckets=3)
+    for hour in range(24):
+        engine.ingest(
+            "A", RawMeteoData([_record(hour, m, humidite=m) for m in (0, 15, 30, 45)])
+        )
+
+    seen = engine._stations["A"].seen  # pylint: disable=protected-access
+    assert len(seen) == 12
+    assert min(seen) == _at(21).timestamp()
+
+    for invalid in (None, 0):
+        with pytest.raises(ValueError):
+            RollupEngine(max_buckets=invalid)
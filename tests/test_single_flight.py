@@ -0,0 +1,65 @@
+"""
+Tests unitaires du module single_flight.
+
+Ces tests vérifient que les appels concurrents sur une même clé
+partagent un unique chargement, y compris en cas d'erreur.
+"""
+
+from threading import Event, Thread
+from time import sleep
+
+import pytest
+
+from src.application.single_flight import SingleFlight
+
+
+def _run_concurrently(target, count: int) -> list[Thread]:
+    """
+    Démarre `count` threads exécutant target et les retourne.
+    """
+    threads = [Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads
+
+
+def test_single_flight_shares_result_between_callers():
+    """
+    Vérifie qu'un seul chargement est exécuté pour des appels simultanés.
+    """
+    flight = SingleFlight()
+    release = Event()
+    calls = []
+    results = []
+
+    def loader():
+        calls.append(1)
+        release.wait(timeout=5)
+        return "value"
+
+    threads = _run_concurrently(lambda: results.append(flight.do("k", loader)), 5)
+    sleep(0.1)
+    assert flight.in_flight() == 1
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == ["value"] * 5
+    assert flight.in_flight() == 0
+
+
+def test_single_flight_propagates_errors_and_recovers():
+    """
+    Vérifie que l'erreur du chargement est propagée puis qu'un nouvel
+    appel relance le chargement.
+    """
+    flight = SingleFlight()
+
+    def failing():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        flight.do("k", failing)
+
+    assert flight.do("k", lambda: 42) == 42
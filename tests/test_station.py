@@ -0,0 +1,58 @@
+"""
+Tests unitaires du modèle Station et des value objects de mesure.
+
+Ces tests vérifient que les lectures sont immuables, hashables et
+compactes (pas de __dict__ par instance).
+"""
+
+from dataclasses import FrozenInstanceError
+from datetime import datetime, timezone
+
+import pytest
+
+from src.domain.mesure.humidite import Humidite
+from src.domain.mesure.pression import Pression
+from src.domain.mesure.raw_data import RawMeteoData
+from src.domain.mesure.temperature import Temperature
+from src.domain.station import Station
+
+
+def _station() -> Station:
+    """
+    Construit une lecture complète.
+    """
+    return Station(
+        name="A",
+        timestamp=datetime(2026, 1, 20, 10, tzinfo=timezone.utc),
+        temperature=Temperature(9.5),
+        humidity=Humidite(70.0),
+        pressure=Pression(1013.25),
+        rain=0.0,
+    )
+
+
+def test_readings_are_immutable_value_objects():
+    """
+    Vérifie l'égalité par valeur, le hachage et l'immuabilité.
+    """
+    station = _station()
+
+    assert station == _station()
+    assert len({station, _station()}) == 1
+    assert Temperature(1.0) == Temperature(1.0)
+    with pytest.raises(FrozenInstanceError):
+        station.temperature.value = 3.0  # type: ignore[misc]
+
+
+def test_readings_have_no_instance_dict():
+    """
+    Vérifie l'absence de __dict__ par instance (__slots__).
+    """
+    for obj in (
+        _station(),
+        Temperature(1.0),
+        Humidite(1.0),
+        Pression(1.0),
+        RawMeteoData([]),
+    ):
+        assert not hasattr(obj, "__dict__")
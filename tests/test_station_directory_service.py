@@ -5,12 +5,26 @@ Ces tests vérifient :
 - la récupération des stations
 - l'utilisation du cache (dictionnaire)
 - le comportement en cas de station inconnue
+- le chargement concurrent de plusieurs stations
+- la déduplication des appels concurrents (single-flight)
+- le mode stale-while-revalidate et le rafraîchissement proactif
+- la réutilisation du cache persistant entre deux instances
+- l'absence de ré-agrégation lorsque les données n'ont pas changé
+- la récupération incrémentale des nouveaux enregistrements
 """
 
+import json
 from dataclasses import dataclass
+from threading import Barrier, Event, Thread
+from time import sleep
 
+from src.application import station_directory_service as service_module
 from src.application.station_directory_service import StationDirectoryService
 from src.domain.station import Station
+from src.infrastructure.disk_cache import JsonDiskCache
+from src.infrastructure.columnar_store import ColumnarStationStore
+from src.infrastructure.record_store import StationRecordStore
+from src.infrastructure.rollup_engine import RollupEngine
 
 
 @dataclass
@@ -98,6 +112,7 @@ def test_service_returns_station_and_uses_cache(sample_records):
     station_2 = service.get_latest_for_station("Compans-Caffarelli")
     assert isinstance(station_2, Station)
     assert client.calls == 1  # cache utilisé
+    assert service.cache_stats()["hits"] == 1
 
     assert station_1.name == "Compans-Caffarelli"
     assert station_1.timestamp is not None
@@ -122,3 +137,535 @@ def test_service_unknown_station_returns_none(sample_records):
     result = service.get_latest_for_station("UNKNOWN")
     assert result is None
     assert client.calls == 0
+
+
+class BarrierClient:  # pylint: disable=too-few-public-methods
+    """
+    Faux client bloquant tant que tous les appels attendus ne sont pas
+    simultanément en cours (prouve l'exécution concurrente).
+    """
+
+    def __init__(self, raw_data: FakeRawData, parties: int):
+        """
+        Initialise le client fake.
+
+        Args:
+            raw_data: données brutes à retourner lors de fetch()
+            parties: nombre d'appels devant être simultanés
+        """
+        self._raw_data = raw_data
+        self._barrier = Barrier(parties, timeout=5)
+        self.endpoints = []
+
+    def fetch(self, endpoint: str):
+        """
+        Attend les autres appels puis retourne les données.
+
+        Raises:
+            RuntimeError: pour l'endpoint "endpoint://boom"
+        """
+        self.endpoints.append(endpoint)
+        self._barrier.wait()
+        if endpoint == "endpoint://boom":
+            raise RuntimeError("boom")
+        return self._raw_data
+
+
+def test_service_bulk_fetch_runs_concurrently(sample_records):
+    """
+    Vérifie que le chargement groupé interroge les stations en parallèle
+    et isole les erreurs par station.
+    """
+    catalog = FakeCatalog(
+        {"A": "endpoint://a", "B": "endpoint://b", "C": "endpoint://boom"}
+    )
+    client = BarrierClient(FakeRawData(sample_records), parties=3)
+    service = StationDirectoryService(
+        catalog=catalog,
+        client=client,
+        cache_ttl_seconds=9999,
+        max_workers=3,
+    )
+
+    try:
+        results = {r.name: r for r in service.get_latest_for_stations(["A", "B", "C"])}
+    finally:
+        service.close()
+
+    assert set(results) == {"A", "B", "C"}
+    assert isinstance(results["A"].station, Station)
+    assert isinstance(results["B"].station, Station)
+    assert results["C"].station is None
+    assert isinstance(results["C"].error, RuntimeError)
+
+
+def test_service_bulk_fetch_uses_cache(sample_records):
+    """
+    Vérifie que le chargement groupé ne rappelle pas l'API pour les
+    stations déjà en cache et ignore les doublons.
+    """
+    catalog = FakeCatalog({"A": "endpoint://a", "B": "endpoint://b"})
+    client = FakeClient(FakeRawData(sample_records))
+    service = StationDirectoryService(
+        catalog=catalog,
+        client=client,
+        cache_ttl_seconds=9999,
+    )
+
+    service.get_latest_for_station("A")
+    assert client.calls == 1
+
+    names = [r.name for r in service.get_latest_for_stations(["A", "B", "A"])]
+    service.close()
+
+    assert sorted(names) == ["A", "B"]
+    assert client.calls == 2
+    # Un défaut par station chargée : le chargement groupé ne recompte pas
+    stats = service.cache_stats()
+    assert (stats["hits"], stats["misses"]) == (1, 2)
+
+
+class SlowClient(FakeClient):  # pylint: disable=too-few-public-methods
+    """
+    Faux client bloqué jusqu'à ce que le test libère la réponse.
+    """
+
+    def __init__(self, raw_data: FakeRawData):
+        """
+        Initialise le client fake.
+
+        Args:
+            raw_data: données brutes à retourner lors de fetch()
+        """
+        super().__init__(raw_data)
+        self.release = Event()
+
+    def fetch(self, _endpoint: str):
+        """
+        Attend la libération puis retourne les données.
+        """
+        self.calls += 1
+        self.release.wait(timeout=5)
+        return self._raw_data
+
+
+def test_service_coalesces_concurrent_misses(sample_records):
+    """
+    Vérifie que des demandes simultanées pour une station expirée ne
+    déclenchent qu'un seul appel API et partagent la même Station.
+    """
+    client = SlowClient(FakeRawData(sample_records))
+    service = StationDirectoryService(
+        catalog=FakeCatalog({"A": "endpoint://a"}),
+        client=client,
+        cache_ttl_seconds=9999,
+    )
+    results = []
+
+    threads = [
+        Thread(target=lambda: results.append(service.get_latest_for_station("A")))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    sleep(0.1)
+    client.release.set()
+    for thread in threads:
+        thread.join()
+
+    assert client.calls == 1
+    assert len(results) == 8
+    assert all(station is results[0] for station in results)
+
+
+class FakeClock:  # pylint: disable=too-few-public-methods
+    """
+    Horloge contrôlée par le test (remplace time.time).
+    """
+
+    def __init__(self, now: float = 1000.0):
+        """
+        Initialise l'horloge.
+
+        Args:
+            now: instant initial en secondes
+        """
+        self.now = now
+
+    def __call__(self) -> float:
+        """
+        Retourne l'instant courant simulé.
+        """
+        return self.now
+
+
+def _wait_for(predicate, timeout: float = 2.0) -> bool:
+    """
+    Attend qu'un prédicat devienne vrai (tâches en arrière-plan).
+    """
+    for _ in range(int(timeout / 0.01)):
+        if predicate():
+            return True
+        sleep(0.01)
+    return predicate()
+
+
+def test_service_serves_stale_value_and_revalidates(sample_records, monkeypatch):
+    """
+    Vérifie qu'une entrée périmée est servie immédiatement et rechargée
+    en arrière-plan.
+    """
+    clock = FakeClock()
+    monkeypatch.setattr(service_module, "time", clock)
+    client = FakeClient(FakeRawData(sample_records))
+    service = StationDirectoryService(
+        catalog=FakeCatalog({"A": "endpoint://a"}),
+        client=client,
+        cache_ttl_seconds=60,
+        stale_ttl_seconds=300,
+    )
+
+    first = service.get_latest_for_station("A")
+    clock.now += 120
+
+    stale = service.get_latest_for_station("A")
+    assert stale is first
+    assert _wait_for(lambda: client.calls == 2)
+
+    clock.now += 1000
+    service.get_latest_for_station("A")
+    assert client.calls == 3  # au-delà de la fenêtre stale : appel synchrone
+    service.close()
+
+
+def test_service_close_cancels_pending_refresh(sample_records, monkeypatch):
+    """
+    Vérifie que close() ne se bloque pas lorsqu'un rafraîchissement en
+    arrière-plan est encore en attente (son callback reprend le verrou).
+    """
+    clock = FakeClock()
+    monkeypatch.setattr(service_module, "time", clock)
+    client = SlowClient(FakeRawData(sample_records))
+    service = StationDirectoryService(
+        catalog=FakeCatalog({"A": "endpoint://a", "B": "endpoint://b"}),
+        client=client,
+        max_workers=1,
+        cache_ttl_seconds=60,
+        stale_ttl_seconds=300,
+    )
+    client.release.set()
+    service.get_latest_for_station("A")
+    service.get_latest_for_station("B")
+    client.release.clear()
+
+    clock.now += 120
+    service.get_latest_for_station("A")
+    service.get_latest_for_station("B")
+    assert _wait_for(lambda: client.calls == 3)
+
+    closing = Thread(target=service.close, daemon=True)
+    closing.start()
+    closing.join(timeout=2)
+    client.release.set()
+    assert not closing.is_alive()
+
+
+def test_service_refreshes_hot_stations_before_expiry(sample_records, monkeypatch):
+    """
+    Vérifie que seules les stations consultées récemment et proches de
+    l'expiration sont rafraîchies.
+    """
+    clock = FakeClock()
+    monkeypatch.setattr(service_module, "time", clock)
+    client = FakeClient(FakeRawData(sample_records))
+    service = StationDirectoryService(
+        catalog=FakeCatalog({"A": "endpoint://a", "B": "endpoint://b"}),
+        client=client,
+        cache_ttl_seconds=60,
+    )
+
+    service.get_latest_for_station("A")
+    service.get_latest_for_station("B")
+    clock.now += 55
+    service.get_latest_for_station("A")
+
+    scheduled = service.refresh_hot_stations(
+        refresh_ahead_seconds=10, hot_window_seconds=30
+    )
+
+    assert scheduled == ["A"]
+    assert _wait_for(lambda: client.calls == 3)
+    service.close()
+
+
+def test_service_reuses_persistent_cache_after_restart(sample_records, tmp_path):
+    """
+    Vérifie qu'une nouvelle instance du service relit la lecture stockée
+    sur disque au lieu de rappeler l'API.
+    """
+    path = tmp_path / "meteo_cache.json"
+    catalog = FakeCatalog({"A": "endpoint://a"})
+
+    first_client = FakeClient(FakeRawData(sample_records))
+    first = StationDirectoryService(
+        catalog=catalog,
+        client=first_client,
+        persistent_cache=JsonDiskCache(path, ttl_seconds=600),
+    ).get_latest_for_station("A")
+
+    second_client = FakeClient(FakeRawData(sample_records))
+    restored = StationDirectoryService(
+        catalog=catalog,
+        client=second_client,
+        persistent_cache=JsonDiskCache(path, ttl_seconds=600),
+    ).get_latest_for_station("A")
+
+    assert first_client.calls == 1
+    assert second_client.calls == 0
+    assert restored.timestamp == first.timestamp
+    assert restored.temperature.value == first.temperature.value
+    assert restored.pressure.value == first.pressure.value
+    assert sorted(json.loads(path.read_text())["entries"]) == ["raw:A", "station:A"]
+
+
+def test_service_close_flushes_deferred_disk_cache(sample_records, tmp_path):
+    """
+    Vérifie qu'avec un cache disque différé, les chargements ne réécrivent
+    pas le fichier et que close() l'écrit une seule fois.
+    """
+    path = tmp_path / "meteo_cache.json"
+    service = StationDirectoryService(
+        catalog=FakeCatalog({"A": "endpoint://a", "B": "endpoint://b"}),
+        client=FakeClient(FakeRawData(sample_records)),
+        persistent_cache=JsonDiskCache(
+            path, ttl_seconds=600, flush_delay_seconds=3600
+        ),
+    )
+    service.get_latest_for_station("A")
+    service.get_latest_for_station("B")
+    assert not path.exists()
+
+    service.close()
+    assert sorted(json.loads(path.read_text())["entries"]) == [
+        "raw:A",
+        "raw:B",
+        "station:A",
+        "station:B",
+    ]
+
+
+def test_service_resumes_incrementally_after_restart(tmp_path):
+    """
+    Vérifie qu'après un redémarrage, les enregistrements bruts persistés
+    alimentent le stockage local, l'historique et les cumuls, et que le
+    premier appel API est incrémental.
+    """
+    path = tmp_path / "meteo_cache.json"
+    clock = FakeClock()
+    catalog = FakeCatalog({"A": "https://x/records?order_by=heure_utc%20desc"})
+
+    def new_service(client):
+        return StationDirectoryService(
+            catalog=catalog,
+            client=client,
+            persistent_cache=JsonDiskCache(path, ttl_seconds=60, clock=clock),
+            record_store=StationRecordStore(),
+            history_store=ColumnarStationStore(),
+            rollup_engine=RollupEngine(),
+            raw_records_ttl_seconds=3600,
+        )
+
+    first = new_service(
+        IncrementalClient(
+            [
+                [
+                    {"heure_utc": "2026-01-20T11:00:00+00:00", "humidite": 55},
+                    {"heure_utc": "2026-01-20T10:45:00+00:00", "humidite": 65},
+                ]
+            ]
+        )
+    )
+    first.get_latest_for_station("A")
+    first.close()
+
+    # Lecture agrégée expirée, enregistrements bruts encore valides
+    clock.now += 120
+    client = IncrementalClient(
+        [[{"heure_utc": "2026-01-20T11:15:00+00:00", "humidite": 75}]]
+    )
+    second = new_service(client)
+
+    assert second.get_history("A").values("humidity_pct") == [65.0, 55.0]
+    station = second.get_latest_for_station("A")
+
+    assert len(client.urls) == 1
+    assert "where=" in client.urls[0] and "11%3A00%3A00" in client.urls[0]
+    assert station.humidity.value == 75.0
+    assert second.get_history("A").values("humidity_pct") == [65.0, 55.0, 75.0]
+    assert [
+        stats["humidity_pct"].count for _, stats in second.get_rollups("A", "hour")
+    ] == [1, 2]
+
+
+def test_service_bounds_last_built_readings(sample_records, monkeypatch):
+    """
+    Vérifie que les dernières lectures construites (détection des données
+    inchangées) sont bornées comme le cache mémoire.
+    """
+    monkeypatch.setattr(service_module, "DEFAULT_CACHE_MAX_ENTRIES", 2)
+    service = StationDirectoryService(
+        catalog=FakeCatalog({name: f"endpoint://{name}" for name in "ABC"}),
+        client=FakeClient(FakeRawData(sample_records)),
+    )
+    for name in "ABC":
+        service.get_latest_for_station(name)
+
+    assert len(service._last_built) == 2  # pylint: disable=protected-access
+
+
+def test_service_skips_aggregation_for_unchanged_data(sample_records, monkeypatch):
+    """
+    Vérifie qu'un client renvoyant le même objet (HTTP 304) n'entraîne
+    pas de nouvelle agrégation.
+    """
+    calls = []
+    original = service_module.aggregate_latest_values
+
+    def counting_aggregate(records, newest_first=False):
+        calls.append(1)
+        return original(records, newest_first)
+
+    monkeypatch.setattr(service_module, "aggregate_latest_values", counting_aggregate)
+    client = FakeClient(FakeRawData(sample_records))
+    service = StationDirectoryService(
+        catalog=FakeCatalog({"A": "endpoint://a"}),
+        client=client,
+    )
+
+    first = service.refresh_station("A")
+    second = service.refresh_station("A")
+
+    assert client.calls == 2
+    assert len(calls) == 1
+    assert second is first
+
+
+class IncrementalClient:  # pylint: disable=too-few-public-methods
+    """
+    Faux client servant un premier lot complet puis uniquement les
+    enregistrements demandés par les requêtes incrémentales.
+    """
+
+    def __init__(self, batches: list[list[dict]]):
+        """
+        Initialise le client fake.
+
+        Args:
+            batches: lots d'enregistrements renvoyés successivement
+        """
+        self._batches = batches
+        self.urls = []
+
+    def fetch(self, endpoint: str):
+        """
+        Enregistre l'URL demandée et renvoie le lot suivant.
+        """
+        self.urls.append(endpoint)
+        return FakeRawData(self._batches[len(self.urls) - 1])
+
+
+def test_service_fetches_only_new_records(monkeypatch):
+    """
+    Vérifie que seules les nouvelles données sont demandées, fusionnées
+    avec les précédentes, et qu'aucune agrégation n'a lieu sans nouveauté.
+    """
+    calls = []
+    original = service_module.aggregate_latest_values
+
+    def counting_aggregate(records, newest_first=False):
+        calls.append(len(records))
+        return original(records, newest_first)
+
+    monkeypatch.setattr(service_module, "aggregate_latest_values", counting_aggregate)
+    client = IncrementalClient(
+        [
+            [
+                {"heure_utc": "2026-01-20T10:00:00+00:00", "humidite": 70},
+                {"heure_utc": "2026-01-20T09:45:00+00:00", "pression": 101325},
+            ],
+            [{"heure_utc": "2026-01-20T10:15:00+00:00", "temperature_en_degre_c": 9.0}],
+            [],
+        ]
+    )
+    service = StationDirectoryService(
+        catalog=FakeCatalog({"A": "https://x/records?order_by=heure_utc%20desc"}),
+        client=client,
+        record_store=StationRecordStore(),
+    )
+
+    service.refresh_station("A")
+    station = service.refresh_station("A")
+    unchanged = service.refresh_station("A")
+
+    assert client.urls[0] == "https://x/records?order_by=heure_utc%20desc"
+    assert "where=" in client.urls[1] and "10%3A00%3A00" in client.urls[1]
+    assert "10%3A15%3A00" in client.urls[2]
+    assert calls == [2, 3]
+    assert unchanged is station
+    assert station.temperature.value == 9.0
+    assert station.humidity.value == 70.0
+    assert abs(station.pressure.value - 1013.25) < 1e-6
+
+
+def test_service_keeps_history_of_received_records():
+    """
+    Vérifie que les enregistrements reçus alimentent l'historique
+    colonnaire, consultable sans nouvel appel API.
+    """
+    client = IncrementalClient(
+        [
+            [
+                {"heure_utc": "2026-01-20T10:00:00+00:00", "humidite": 70},
+                {"heure_utc": "2026-01-20T09:45:00+00:00", "humidite": 60},
+            ],
+            [{"heure_utc": "2026-01-20T10:15:00+00:00", "humidite": 80}],
+        ]
+    )
+    service = StationDirectoryService(
+        catalog=FakeCatalog({"A": "https://x/records?order_by=heure_utc%20desc"}),
+        client=client,
+        record_store=StationRecordStore(),
+        history_store=ColumnarStationStore(),
+    )
+
+    service.refresh_station("A")
+    service.refresh_station("A")
+    history = service.get_history("A")
+
+    assert history.values("humidity_pct") == [60.0, 70.0, 80.0]
+    assert len(client.urls) == 2
+    assert StationDirectoryService(catalog=FakeCatalog({}), client=client).get_history(
+        "A"
+    ) is None
+
+
+def test_service_exposes_rollups():
+    """
+    Vérifie que les cumuls sont alimentés par les chargements.
+    """
+    client = IncrementalClient(
+        [[{"heure_utc": "2026-01-20T10:00:00+00:00", "humidite": 70}]]
+    )
+    service = StationDirectoryService(
+        catalog=FakeCatalog({"A": "https://x/a"}),
+        client=client,
+        rollup_engine=RollupEngine(),
+    )
+
+    service.refresh_station("A")
+    (_, stats), = service.get_rollups("A", "hour")
+
+    assert stats["humidity_pct"].mean == 70.0
+    assert StationDirectoryService(catalog=FakeCatalog({}), client=client).get_rollups(
+        "A", "day"
+    ) is None
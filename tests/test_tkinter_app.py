@@ -0,0 +1,52 @@
+"""
+Tests unitaires du réveil de l'interface (sans fenêtre Tk).
+
+Ces tests vérifient :
+- le repli sur la scrutation périodique si l'événement virtuel échoue
+"""
+
+import tkinter as tk
+from threading import Lock
+
+from src.ui.tkinter_app import FALLBACK_POLL_MS, MeteoApp
+
+
+class FailingRoot:
+    """
+    Fausse fenêtre Tk dont event_generate échoue.
+    """
+
+    def __init__(self):
+        self.scheduled = []
+
+    def event_generate(self, *_args, **_kwargs):
+        """
+        Simule un interpréteur qui refuse l'événement.
+        """
+        raise tk.TclError("application has been destroyed")
+
+    def after(self, delay, callback):
+        """
+        Enregistre la tâche planifiée.
+        """
+        self.scheduled.append((delay, callback))
+
+
+def test_wake_ui_falls_back_to_polling_when_event_fails():
+    """
+    Vérifie qu'un échec d'event_generate planifie la scrutation, une seule
+    fois, au lieu de laisser le résultat en file sans réveil.
+    """
+    app = MeteoApp.__new__(MeteoApp)
+    app.root = FailingRoot()
+    app._wake_lock = Lock()  # pylint: disable=protected-access
+    app._wake_pending = False  # pylint: disable=protected-access
+    app._event_driven = True  # pylint: disable=protected-access
+
+    app._wake_ui()  # pylint: disable=protected-access
+    app._wake_ui()  # pylint: disable=protected-access
+
+    assert app.root.scheduled == [
+        (FALLBACK_POLL_MS, app._poll_results)  # pylint: disable=protected-access
+    ]
+    assert not app._event_driven  # pylint: disable=protected-access